@@ -0,0 +1,304 @@
+"""
+Materialized per-user and per-project log aggregates in the shared local store.
+
+For each user, and each of a user's projects, this keeps the log count, total minutes,
+first/last log date and counts by status, so totals no longer need a scan of the
+logs table. A small `log_facts` row per log (owner, project, minutes, status, date)
+lets updates and deletes subtract exactly what a log contributed before.
+
+The write paths call `apply()`/`remove()` after Airtable accepts a change. A periodic
+reconciliation rebuilds everything from a full listing, which fixes drift from edits
+made directly in Airtable. Only one worker runs it per interval. Writes that land
+while the listing is in flight win over the snapshot.
+
+Every change to the facts bumps a shared version number, so anything derived from
+them in memory (the leaderboard) can tell when another worker has changed them.
+"""
+import logging
+import threading
+import time
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS log_facts (
+    record_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS log_facts_owner ON log_facts (user_id, project_name, created_at);
+CREATE TABLE IF NOT EXISTS log_aggregates (
+    user_id TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    log_count INTEGER NOT NULL,
+    total_minutes INTEGER NOT NULL,
+    first_log_at TEXT,
+    last_log_at TEXT,
+    PRIMARY KEY (user_id, project_name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS log_status_counts (
+    user_id TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (user_id, project_name, status)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS aggregate_meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+) WITHOUT ROWID;
+""")
+
+# project_name used for a user's totals across all projects
+ALL_PROJECTS = ''
+
+# Fields a reconciliation needs from each log
+FACT_FIELDS = ['User ID', 'Project Name', 'Time Spent (minutes)', 'Status', 'Created At']
+
+
+def log_fact(record):
+    """(user_id, project_name, minutes, status, created_at) for a log record, or None if it has no owner"""
+    fields = record.get('fields', {})
+    if not fields.get('User ID'):
+        return None
+    try:
+        minutes = int(float(fields.get('Time Spent (minutes)') or 0))
+    except (TypeError, ValueError):
+        minutes = 0
+    return (fields['User ID'], fields.get('Project Name') or '', minutes,
+            fields.get('Status') or 'Pending', fields.get('Created At'))
+
+
+class LogAggregates:
+    def __init__(self, reconcile_interval=3600):
+        self.reconcile_interval = reconcile_interval
+        self.reconcile_listeners = []
+        self._thread = None
+
+    def apply(self, record):
+        """
+        Count a created or updated log, replacing whatever it contributed before. Returns
+        (old fact, new fact, facts version), or None for a log without an owner.
+        """
+        fact = log_fact(record)
+        if fact is None:
+            return None
+        with local_store.transaction() as conn:
+            old = self._current_fact(conn, record['id'])
+            conn.execute(
+                'INSERT OR REPLACE INTO log_facts (record_id, user_id, project_name, minutes, status, created_at, '
+                'deleted, updated_at) VALUES (?, ?, ?, ?, ?, ?, 0, ?)', (record['id'], *fact, time.time()))
+            if old is not None:
+                self._adjust(conn, old, -1)
+            self._adjust(conn, fact, 1)
+            return old, fact, self._bump_version(conn)
+
+    def remove(self, record_id):
+        """Stop counting a deleted log. Returns (old fact, None, facts version), or None if it wasn't counted."""
+        with local_store.transaction() as conn:
+            old = self._current_fact(conn, record_id)
+            if old is None:
+                return None
+            # Kept as a marker so a reconciliation already in flight doesn't bring it back
+            conn.execute('UPDATE log_facts SET deleted = 1, updated_at = ? WHERE record_id = ?',
+                         (time.time(), record_id))
+            self._adjust(conn, old, -1)
+            return old, None, self._bump_version(conn)
+
+    @staticmethod
+    def _bump_version(conn):
+        """Count one more change to the facts; readers holding a derived copy compare against it"""
+        conn.execute("INSERT INTO aggregate_meta (key, value) VALUES ('facts_version', 1) "
+                     "ON CONFLICT (key) DO UPDATE SET value = value + 1")
+        return int(conn.execute("SELECT value FROM aggregate_meta WHERE key = 'facts_version'").fetchone()[0])
+
+    def facts_version(self):
+        row = local_store.connect().execute("SELECT value FROM aggregate_meta WHERE key = 'facts_version'").fetchone()
+        return int(row['value']) if row else 0
+
+    def owner(self, record_id):
+        row = local_store.connect().execute('SELECT user_id FROM log_facts WHERE record_id = ?', (record_id,)).fetchone()
+        return row['user_id'] if row else None
+
+    @staticmethod
+    def _current_fact(conn, record_id):
+        row = conn.execute('SELECT user_id, project_name, minutes, status, created_at FROM log_facts '
+                           'WHERE record_id = ? AND deleted = 0', (record_id,)).fetchone()
+        return tuple(row) if row else None
+
+    def _adjust(self, conn, fact, sign):
+        user_id, project_name, minutes, status, created_at = fact
+        for scope in (ALL_PROJECTS, project_name) if project_name else (ALL_PROJECTS,):
+            if sign > 0:
+                conn.execute(
+                    'INSERT INTO log_aggregates (user_id, project_name, log_count, total_minutes, first_log_at, last_log_at) '
+                    'VALUES (?, ?, 1, ?, ?, ?) ON CONFLICT (user_id, project_name) DO UPDATE SET '
+                    'log_count = log_count + 1, total_minutes = total_minutes + excluded.total_minutes, '
+                    'first_log_at = MIN(COALESCE(first_log_at, excluded.first_log_at), '
+                    'COALESCE(excluded.first_log_at, first_log_at)), '
+                    'last_log_at = MAX(COALESCE(last_log_at, excluded.last_log_at), '
+                    'COALESCE(excluded.last_log_at, last_log_at))',
+                    (user_id, scope, minutes, created_at, created_at))
+                conn.execute(
+                    'INSERT INTO log_status_counts (user_id, project_name, status, count) VALUES (?, ?, ?, 1) '
+                    'ON CONFLICT (user_id, project_name, status) DO UPDATE SET count = count + 1',
+                    (user_id, scope, status))
+            else:
+                conn.execute('UPDATE log_aggregates SET log_count = log_count - 1, total_minutes = total_minutes - ? '
+                             'WHERE user_id = ? AND project_name = ?', (minutes, user_id, scope))
+                conn.execute('DELETE FROM log_aggregates WHERE user_id = ? AND project_name = ? AND log_count <= 0',
+                             (user_id, scope))
+                conn.execute('UPDATE log_status_counts SET count = count - 1 '
+                             'WHERE user_id = ? AND project_name = ? AND status = ?', (user_id, scope, status))
+                conn.execute('DELETE FROM log_status_counts WHERE user_id = ? AND project_name = ? AND count <= 0',
+                             (user_id, scope))
+                # A min/max can't be decremented; re-read the bounds from the remaining facts
+                self._refresh_bounds(conn, user_id, scope)
+
+    @staticmethod
+    def _refresh_bounds(conn, user_id, scope):
+        if scope == ALL_PROJECTS:
+            bounds = conn.execute('SELECT MIN(created_at), MAX(created_at) FROM log_facts '
+                                  'WHERE user_id = ? AND deleted = 0', (user_id,)).fetchone()
+        else:
+            bounds = conn.execute('SELECT MIN(created_at), MAX(created_at) FROM log_facts '
+                                  'WHERE user_id = ? AND project_name = ? AND deleted = 0', (user_id, scope)).fetchone()
+        conn.execute('UPDATE log_aggregates SET first_log_at = ?, last_log_at = ? WHERE user_id = ? AND project_name = ?',
+                     (bounds[0], bounds[1], user_id, scope))
+
+    def get(self, user_id, project_name=ALL_PROJECTS):
+        """Aggregate dict for a user (or one of their projects); zeros when there are no logs"""
+        conn = local_store.connect()
+        row = conn.execute('SELECT log_count, total_minutes, first_log_at, last_log_at FROM log_aggregates '
+                           'WHERE user_id = ? AND project_name = ?', (user_id, project_name)).fetchone()
+        statuses = conn.execute('SELECT status, count FROM log_status_counts WHERE user_id = ? AND project_name = ?',
+                                (user_id, project_name)).fetchall()
+        return {
+            'log_count': row['log_count'] if row else 0,
+            'total_minutes': row['total_minutes'] if row else 0,
+            'first_log_at': row['first_log_at'] if row else None,
+            'last_log_at': row['last_log_at'] if row else None,
+            'status_counts': {status['status']: status['count'] for status in statuses},
+        }
+
+    def for_user(self, user_id):
+        """The user's totals plus one aggregate per project"""
+        names = [row['project_name'] for row in local_store.connect().execute(
+            'SELECT project_name FROM log_aggregates WHERE user_id = ? AND project_name != ? ORDER BY project_name',
+            (user_id, ALL_PROJECTS))]
+        return {'totals': self.get(user_id), 'projects': {name: self.get(user_id, name) for name in names}}
+
+    def fact_rows(self, user_id=None):
+        """(created_at, minutes, status) of every counted log, optionally for one user"""
+        conn = local_store.connect()
+        if user_id is None:
+            return conn.execute('SELECT created_at, minutes, status FROM log_facts WHERE deleted = 0').fetchall()
+        return conn.execute('SELECT created_at, minutes, status FROM log_facts WHERE user_id = ? AND deleted = 0',
+                            (user_id,)).fetchall()
+
+    def snapshot(self):
+        """(facts version, every counted fact as (user_id, project_name, minutes, status, created_at)), read together"""
+        with local_store.transaction() as conn:
+            version = conn.execute("SELECT value FROM aggregate_meta WHERE key = 'facts_version'").fetchone()
+            facts = conn.execute('SELECT user_id, project_name, minutes, status, created_at FROM log_facts '
+                                 'WHERE deleted = 0').fetchall()
+        return (int(version[0]) if version else 0), [tuple(row) for row in facts]
+
+    def last_reconciled(self):
+        """Unix time of the last completed reconciliation, or None before the first one"""
+        row = local_store.connect().execute("SELECT value FROM aggregate_meta WHERE key = 'reconciled_at'").fetchone()
+        return row['value'] if row else None
+
+    def is_ready(self):
+        return self.last_reconciled() is not None
+
+    def reconcile(self, records, started_at):
+        """Rebuild facts and aggregates from a full listing of the logs table that began at `started_at`"""
+        facts = [(record['id'], *fact) for record in records if (fact := log_fact(record)) is not None]
+        with local_store.transaction() as conn:
+            # Facts written after the listing started are newer than the snapshot and are kept
+            conn.execute('DELETE FROM log_facts WHERE updated_at < ?', (started_at,))
+            conn.executemany(
+                'INSERT OR IGNORE INTO log_facts (record_id, user_id, project_name, minutes, status, created_at, '
+                'deleted, updated_at) VALUES (?, ?, ?, ?, ?, ?, 0, ?)', [(*fact, started_at) for fact in facts])
+            conn.execute('DELETE FROM log_aggregates')
+            conn.execute('DELETE FROM log_status_counts')
+            # Users' totals, then per-project rows (logs without a project only count towards totals)
+            for scope_column, condition in (("''", ''), ('project_name', "AND project_name != ''")):
+                conn.execute(
+                    'INSERT INTO log_aggregates (user_id, project_name, log_count, total_minutes, first_log_at, last_log_at) '
+                    f'SELECT user_id, {scope_column}, COUNT(*), SUM(minutes), MIN(created_at), MAX(created_at) '
+                    f'FROM log_facts WHERE deleted = 0 {condition} GROUP BY user_id, {scope_column}')
+                conn.execute(
+                    'INSERT INTO log_status_counts (user_id, project_name, status, count) '
+                    f'SELECT user_id, {scope_column}, status, COUNT(*) FROM log_facts WHERE deleted = 0 {condition} '
+                    f'GROUP BY user_id, {scope_column}, status')
+            conn.execute("INSERT OR REPLACE INTO aggregate_meta (key, value) VALUES ('reconciled_at', ?)",
+                         (time.time(),))
+            self._bump_version(conn)
+        logger.info("Reconciled log aggregates from %d logs", len(facts))
+
+    def claim_reconciliation(self, force=False):
+        """
+        Take this interval's reconciliation slot (shared by all workers). Returns the claim
+        time, or None if another run already has the slot.
+        """
+        now = time.time()
+        with local_store.transaction() as conn:
+            row = conn.execute("SELECT value FROM aggregate_meta WHERE key = 'reconcile_started_at'").fetchone()
+            if not force and row and now - row['value'] < self.reconcile_interval:
+                return None
+            conn.execute("INSERT OR REPLACE INTO aggregate_meta (key, value) VALUES ('reconcile_started_at', ?)", (now,))
+        return now
+
+    def release_claim(self):
+        """Let the next check retry right away, e.g. after a failed listing"""
+        local_store.connect().execute("DELETE FROM aggregate_meta WHERE key = 'reconcile_started_at'")
+
+    def run_reconciliation(self, fetch_logs, force=False):
+        """
+        Claim the slot, list every log with `fetch_logs()` and rebuild, then hand the same listing
+        to each of `reconcile_listeners` as (records, started_at). Returns True if it ran.
+        """
+        started_at = self.claim_reconciliation(force)
+        if started_at is None:
+            return False
+        try:
+            records = fetch_logs()
+        except Exception:
+            self.release_claim()
+            raise
+        if records is None:
+            self.release_claim()
+            logger.error("Log aggregate reconciliation skipped: could not list logs")
+            return False
+        self.reconcile(records, started_at)
+        for listener in self.reconcile_listeners:
+            try:
+                listener(records, started_at)
+            except Exception as e:
+                logger.error("Reconciliation listener %s failed: %s", getattr(listener, '__qualname__', listener), e)
+        return True
+
+    def start_reconciler(self, fetch_logs):
+        """Background thread reconciling every `reconcile_interval` seconds, starting with a run if one is due"""
+        if self._thread is not None or not self.reconcile_interval:
+            return
+
+        def loop():
+            while True:
+                try:
+                    self.run_reconciliation(fetch_logs)
+                except Exception as e:
+                    logger.error("Log aggregate reconciliation failed: %s", e)
+                time.sleep(min(self.reconcile_interval, 60))
+
+        self._thread = threading.Thread(target=loop, name='aggregate-reconciler', daemon=True)
+        self._thread.start()
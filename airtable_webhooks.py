@@ -0,0 +1,300 @@
+"""
+Changes made to Airtable outside the app (admins editing records in the Airtable UI,
+scripts, automations), applied to the app's local copies record by record.
+
+The app registers an Airtable webhook on its base. Airtable pings `notification_url`
+after changes; a ping carries no data and is signed with an HMAC of its body under the
+webhook's MAC secret. On a verified ping, and every `poll_interval` seconds in case pings
+are lost, the watcher lists the webhook's payloads from the stored cursor, decodes which
+records of the watched tables were created, changed or destroyed, re-reads the changed
+ones by ID and hands them to `on_changes(table_name, records, destroyed_ids)`. Changes
+the app itself made are skipped when the change log already has a later entry for them.
+
+Webhooks expire 7 days after creation unless refreshed, which the watcher does a day
+ahead. A new webhook starts with a catch-up poll of each watched table for records
+modified since the last checkpoint with LAST_MODIFIED_TIME(). With `polling` on, the
+watcher also polls that way whenever there is no working webhook (no notification URL
+configured, creation failed, expired or deleted); it is off by default, since it lists
+every watched table each interval. Polling can't see deletions; those are caught by the
+next aggregates reconciliation. Polled records the app itself wrote since the checkpoint
+are skipped.
+
+The webhook's ID, MAC secret, expiry and payload cursor, and the checkpoint, live in the
+shared local store, so every worker verifies pings against the same secret. Periodic
+checks are claimed per interval like the aggregates reconciliation, so one worker makes
+them.
+"""
+import base64
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+import local_store
+import upstream
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS webhook_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+""")
+
+MAC_HEADER = 'X-Airtable-Content-MAC'
+
+# Records re-read per list call (one OR(RECORD_ID() = ...) formula)
+FETCH_CHUNK = 50
+
+# Refresh a webhook once it has less than this many seconds left
+REFRESH_MARGIN = 86400
+
+
+def decode_payloads(payloads):
+    """
+    {table_id: (changed_ids, destroyed_ids)} from webhook payloads, plus the time each record
+    last changed in them ({record_id: unix time}) and whether that change came through the API.
+    """
+    tables, changed_at, via_api = {}, {}, {}
+    for payload in payloads:
+        timestamp = _parse_time(payload.get('timestamp'))
+        from_api = (payload.get('actionMetadata') or {}).get('source') == 'publicApi'
+        for table_id, table in (payload.get('changedTablesById') or {}).items():
+            changed, destroyed = tables.setdefault(table_id, (set(), set()))
+            for record_id in [*(table.get('createdRecordsById') or {}), *(table.get('changedRecordsById') or {})]:
+                changed.add(record_id)
+                destroyed.discard(record_id)
+                changed_at[record_id], via_api[record_id] = timestamp, from_api
+            for record_id in table.get('destroyedRecordIds') or []:
+                changed.discard(record_id)
+                destroyed.add(record_id)
+    return tables, changed_at, via_api
+
+
+def _parse_time(value):
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+class ChangeWatcher:
+    def __init__(self, api_url, base_id, api_key, tables, fetch_records, on_changes, notification_url=None,
+                 poll_interval=60, polling=False, clock_skew=5.0, last_change_at=None):
+        """
+        `tables` are the watched table names. `fetch_records(table_name, formula)` lists matching
+        records (None on failure). `last_change_at(table_name, record_ids)` returns when the app
+        last wrote each record ({record_id: unix time}), so its own writes aren't read back.
+        """
+        self.api_url = api_url.rstrip('/')
+        self.base_id = base_id
+        self.headers = {'Authorization': f'Bearer {api_key}'}
+        self.tables = list(tables)
+        self.fetch_records = fetch_records
+        self.on_changes = on_changes
+        self.notification_url = notification_url
+        self.poll_interval = poll_interval
+        self.polling = polling
+        self.clock_skew = clock_skew
+        self.last_change_at = last_change_at
+        self._table_names = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def webhooks_url(self):
+        return f"{self.api_url}/bases/{self.base_id}/webhooks"
+
+    def _state(self):
+        return {row['key']: row['value'] for row in local_store.connect().execute('SELECT key, value FROM webhook_state')}
+
+    @staticmethod
+    def _save(**values):
+        with local_store.transaction() as conn:
+            conn.executemany('INSERT OR REPLACE INTO webhook_state (key, value) VALUES (?, ?)',
+                             [(key, str(value)) for key, value in values.items()])
+
+    def _forget_webhook(self):
+        with local_store.transaction() as conn:
+            conn.execute("DELETE FROM webhook_state WHERE key IN ('webhook_id', 'mac_secret', 'expires_at', 'cursor')")
+
+    def verify(self, body, mac_header, webhook_id):
+        """Whether a ping was signed with the current webhook's MAC secret"""
+        state = self._state()
+        if not state.get('mac_secret') or webhook_id != state.get('webhook_id') or not mac_header:
+            return False
+        digest = hmac.new(base64.b64decode(state['mac_secret']), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(mac_header, f'hmac-sha256={digest}')
+
+    def ensure_webhook(self):
+        """Create the webhook, or refresh it ahead of expiry. Returns True while one is active."""
+        state = self._state()
+        now = time.time()
+        if state.get('webhook_id'):
+            if float(state['expires_at']) - now > REFRESH_MARGIN:
+                return True
+            response = upstream.post(f"{self.webhooks_url}/{state['webhook_id']}/refresh", headers=self.headers)
+            if response.status_code == 200:
+                self._save(expires_at=_parse_time(response.json()['expirationTime']))
+                return True
+            logger.warning("Airtable webhook %s could not be refreshed (%s); creating a new one",
+                           state['webhook_id'], response.status_code)
+            self._forget_webhook()
+
+        # Webhooks this app registered before (e.g. with a lost local store) can't be used without
+        # their MAC secret, and they count towards Airtable's per-base limit
+        response = upstream.get(self.webhooks_url, headers=self.headers)
+        if response.status_code == 200:
+            for webhook in response.json().get('webhooks', []):
+                if webhook.get('notificationUrl') == self.notification_url:
+                    upstream.delete(f"{self.webhooks_url}/{webhook['id']}", headers=self.headers)
+
+        response = upstream.post(self.webhooks_url, headers=self.headers, json={
+            'notificationUrl': self.notification_url,
+            'specification': {'options': {'filters': {'dataTypes': ['tableData']}}},
+        })
+        if response.status_code != 200:
+            logger.error("Airtable webhook creation failed, polling for changes instead: %s", response.text)
+            return False
+        data = response.json()
+        self._save(webhook_id=data['id'], mac_secret=data['macSecretBase64'],
+                   expires_at=_parse_time(data['expirationTime']), cursor=1)
+        logger.info("Registered Airtable webhook %s", data['id'])
+        # Cover whatever changed while there was no webhook
+        self.poll()
+        return True
+
+    def table_names(self, refresh=False):
+        """Table ID -> name for the watched tables (a table configured by ID maps to itself)"""
+        if refresh or not self._table_names:
+            names = {name: name for name in self.tables if name.startswith('tbl')}
+            response = upstream.get(f"{self.api_url}/meta/bases/{self.base_id}/tables", headers=self.headers)
+            if response.status_code == 200:
+                names.update({table['id']: table['name'] for table in response.json().get('tables', [])
+                              if table['name'] in self.tables})
+            else:
+                logger.error("Airtable table list failed: %s", response.text)
+            self._table_names = names
+        return self._table_names
+
+    def sync(self):
+        """Apply the webhook's new payloads. Returns False if the webhook is gone or unreadable."""
+        with self._lock:
+            state = self._state()
+            if not state.get('webhook_id'):
+                return False
+            cursor = int(state['cursor'])
+            started_at = time.time()
+            while True:
+                response = upstream.get(f"{self.webhooks_url}/{state['webhook_id']}/payloads", headers=self.headers,
+                                        params={'cursor': cursor})
+                if response.status_code == 404:
+                    logger.warning("Airtable webhook %s is gone; polling for changes until it is replaced",
+                                   state['webhook_id'])
+                    self._forget_webhook()
+                    return False
+                if response.status_code != 200:
+                    logger.error("Airtable webhook payloads failed: %s", response.text)
+                    return False
+                data = response.json()
+                if not self._apply(*decode_payloads(data.get('payloads', []))):
+                    return False
+                cursor = data['cursor']
+                # Another worker may have got further meanwhile
+                local_store.connect().execute(
+                    "UPDATE webhook_state SET value = ? WHERE key = 'cursor' AND CAST(value AS INTEGER) < ?",
+                    (str(cursor), cursor))
+                if not data.get('mightHaveMore'):
+                    break
+            self._save(checkpoint=started_at)
+            return True
+
+    def _apply(self, tables, changed_at, via_api):
+        names = self.table_names()
+        if set(tables) - set(names):
+            names = self.table_names(refresh=True)
+        for table_id, (changed, destroyed) in tables.items():
+            table_name = names.get(table_id)
+            if table_name is None:
+                continue
+            if self.last_change_at and changed:
+                # A change the app made is already in its local copies
+                written = self.last_change_at(table_name, list(changed))
+                changed = {record_id for record_id in changed
+                           if not via_api[record_id] or changed_at[record_id] is None
+                           or written.get(record_id, 0) < changed_at[record_id]}
+            records = []
+            ids = sorted(changed)
+            for start in range(0, len(ids), FETCH_CHUNK):
+                chunk = ids[start:start + FETCH_CHUNK]
+                found = self.fetch_records(table_name, 'OR(' + ', '.join(f"RECORD_ID() = '{record_id}'" for record_id in chunk) + ')')
+                if found is None:
+                    return False
+                records.extend(found)
+            # Changed and then deleted before it could be read
+            gone = set(changed) - {record['id'] for record in records}
+            if records or destroyed or gone:
+                self.on_changes(table_name, records, sorted(destroyed | gone))
+        return True
+
+    def poll(self):
+        """Apply records modified since the checkpoint, for when there is no working webhook"""
+        with self._lock:
+            state = self._state()
+            started_at = time.time()
+            if state.get('checkpoint'):
+                after = float(state['checkpoint']) - self.clock_skew
+                for table_name in self.tables:
+                    records = self.fetch_records(table_name, f"IS_AFTER(LAST_MODIFIED_TIME(), '{_iso(after)}')")
+                    if records is None:
+                        return False
+                    if records and self.last_change_at:
+                        # Written by the app since the checkpoint, so already in its local copies
+                        written = self.last_change_at(table_name, [record['id'] for record in records])
+                        records = [record for record in records if written.get(record['id'], 0) < after]
+                    if records:
+                        self.on_changes(table_name, records, [])
+            self._save(checkpoint=started_at)
+            return True
+
+    def claim_check(self):
+        """Take this interval's periodic check (shared by all workers); False if another worker has it"""
+        now = time.time()
+        with local_store.transaction() as conn:
+            row = conn.execute("SELECT value FROM webhook_state WHERE key = 'checked_at'").fetchone()
+            if row and now - float(row['value']) < self.poll_interval:
+                return False
+            conn.execute("INSERT OR REPLACE INTO webhook_state (key, value) VALUES ('checked_at', ?)", (str(now),))
+        return True
+
+    def check(self):
+        """Keep the webhook alive and read its payloads, or poll when there is none and polling is on"""
+        if not self.claim_check():
+            return
+        if self.notification_url and self.ensure_webhook() and self.sync():
+            return
+        if self.polling:
+            self.poll()
+
+    def start(self):
+        """Background thread running `check()` every `poll_interval` seconds, if there is a webhook or polling"""
+        if self._thread is not None or not self.poll_interval or not (self.notification_url or self.polling):
+            return
+
+        def loop():
+            while True:
+                try:
+                    self.check()
+                except Exception as e:
+                    logger.error("Airtable change check failed: %s", e)
+                time.sleep(self.poll_interval)
+
+        self._thread = threading.Thread(target=loop, name='airtable-changes', daemon=True)
+        self._thread.start()
@@ -0,0 +1,100 @@
+"""
+Activity analytics (minutes per day and week, weekday/hour heatmap, streaks, status
+trends) computed in one pass over the logs.
+
+Each log adds to its day, week and weekday/hour buckets as it is read. The inputs are
+one user's or everyone's (created_at, minutes, status) facts, and results are cached
+by the caller, so a plain loop is fast enough and needs no numeric libraries.
+"""
+from datetime import date, datetime
+
+
+def _parse(created_at):
+    try:
+        return datetime.fromisoformat(created_at[:19])
+    except (TypeError, ValueError):
+        return None
+
+
+def _monday(ordinal):
+    # date.fromordinal(1) is a Monday
+    return ordinal - (ordinal - 1) % 7
+
+
+def streaks(day_set, today):
+    """(current, longest) runs of consecutive days with at least one log"""
+    longest = run = 0
+    previous = None
+    for day in sorted(day_set):
+        run = run + 1 if previous == day - 1 else 1
+        longest = max(longest, run)
+        previous = day
+    # Today may not have a log yet without breaking the streak
+    current = 0
+    day = today if today in day_set else today - 1
+    while day in day_set:
+        current += 1
+        day -= 1
+    return current, longest
+
+
+def compute(rows, today=None, days=90, weeks=26):
+    """Every analytics view for (created_at, minutes, status) rows, windows ending at `today` (a date)"""
+    today = (today or date.today()).toordinal()
+    day_start = today - days + 1
+    week_start = _monday(today) - 7 * (weeks - 1)
+
+    daily_logs, daily_minutes = [0] * days, [0] * days
+    weekly_logs, weekly_minutes = [0] * weeks, [0] * weeks
+    weekly_statuses = [{} for _ in range(weeks)]
+    # Weekday (Monday = 0) x hour
+    heat_logs = [[0] * 24 for _ in range(7)]
+    heat_minutes = [[0] * 24 for _ in range(7)]
+    status_names = {}
+    active_days = set()
+    total_logs = total_minutes = 0
+
+    for created_at, minutes, status in rows:
+        when = _parse(created_at)
+        if when is None:
+            continue
+        day = when.toordinal()
+        minutes = int(minutes or 0)
+        status_names.setdefault(status, len(status_names))
+        total_logs += 1
+        total_minutes += minutes
+        active_days.add(day)
+
+        if 0 <= day - day_start < days:
+            daily_logs[day - day_start] += 1
+            daily_minutes[day - day_start] += minutes
+        week = (day - week_start) // 7
+        if 0 <= week < weeks:
+            weekly_logs[week] += 1
+            weekly_minutes[week] += minutes
+            weekly_statuses[week][status] = weekly_statuses[week].get(status, 0) + 1
+        heat_logs[(day - 1) % 7][when.hour] += 1
+        heat_minutes[(day - 1) % 7][when.hour] += minutes
+
+    current_streak, longest_streak = streaks(active_days, today)
+
+    return {
+        'range': {'start': date.fromordinal(day_start).isoformat(), 'end': date.fromordinal(today).isoformat()},
+        'totals': {'logs': total_logs, 'minutes': total_minutes, 'active_days': len(active_days)},
+        'daily': [
+            {'date': date.fromordinal(day_start + i).isoformat(), 'logs': daily_logs[i], 'minutes': daily_minutes[i]}
+            for i in range(days)
+        ],
+        'weekly': [
+            {
+                'week_start': date.fromordinal(week_start + 7 * i).isoformat(),
+                'logs': weekly_logs[i],
+                'minutes': weekly_minutes[i],
+                # Statuses in the order they first appear
+                'statuses': {name: weekly_statuses[i][name] for name in status_names if name in weekly_statuses[i]},
+            }
+            for i in range(weeks)
+        ],
+        'heatmap': {'logs': heat_logs, 'minutes': heat_minutes},
+        'streaks': {'current': current_streak, 'longest': longest_streak},
+    }
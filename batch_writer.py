@@ -0,0 +1,378 @@
+"""
+Queued, rate-limited batch writes to Airtable.
+
+A job is a list of record creations, updates or deletions for one table. It is saved in the
+shared local store and returned to the caller straight away. A background thread in
+each worker sends the pending items in batches of `batch_size` (Airtable accepts 10
+records per call). Up to `concurrency` calls are in flight at a time, and call starts
+are spaced to at most `requests_per_second`. Only the worker holding the writer lease
+sends, so the rate holds across processes. The lease is a row in the store that
+expires if its holder stops renewing it.
+
+The item table doubles as the checkpoint. Each item is marked as sending before its
+call goes out and done or failed when the response arrives, so a job picks up where
+it stopped after a crash or restart. Updates and deletions caught mid-call are sent again.
+Creations caught mid-call are marked failed instead, because Airtable may already
+have created them.
+
+Responses are handled as follows:
+- 429 pauses sending for `rate_limit_pause` seconds, then the same batch is retried.
+- 5xx and network errors are retried with backoff until `max_attempts` is reached.
+- Any other 4xx fails the whole batch. A batch of several items is then re-sent one
+  item at a time, so a single bad record (deleted meanwhile, invalid value) only
+  fails itself. A deletion that gets 404 on its own counts as done.
+
+`send(table_name, op, items)` performs the call for [(record_id, fields)] items
+(record_id is None for creations). `on_success(table_name, op, records)` is told
+about every record Airtable accepted. For deletions these are the queued items as
+{'id', 'fields'}, so whatever fields were queued with them (e.g. the owner) reach
+the callback.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS write_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    op TEXT NOT NULL DEFAULT 'update',
+    created_by TEXT,
+    created_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    succeeded INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    calls INTEGER NOT NULL DEFAULT 0,
+    throttled INTEGER NOT NULL DEFAULT 0,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS write_job_items (
+    job_id INTEGER NOT NULL,
+    item_key TEXT NOT NULL,
+    record_id TEXT,
+    fields TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    solo INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (job_id, item_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS write_job_items_state ON write_job_items (state, job_id);
+CREATE TABLE IF NOT EXISTS write_lease (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+""")
+
+CREATE = 'create'
+UPDATE = 'update'
+DELETE = 'delete'
+
+PENDING = 'pending'
+SENDING = 'sending'
+DONE = 'done'
+FAILED = 'failed'
+
+# Most pending keys and errors listed in a job's progress
+DETAIL_LIMIT = 1000
+
+
+class BatchWriter:
+    def __init__(self, send, on_success=None, batch_size=10, requests_per_second=3.0, concurrency=3,
+                 max_attempts=5, rate_limit_pause=30.0, lease_ttl=60.0):
+        self.send = send
+        self.on_success = on_success
+        self.batch_size = batch_size
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.rate_limit_pause = rate_limit_pause
+        self.lease_ttl = lease_ttl
+        self.holder = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wake = threading.Event()
+        self._thread = None
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch-send')
+        self._slot_lock = threading.Lock()
+        self._round_lock = threading.Lock()
+        self._next_send = 0.0
+        self._failures = 0
+
+    def enqueue(self, kind, table_name, items, op=UPDATE, created_by=None):
+        """
+        Queue one job. `items` maps a key to the record's fields: the record ID for updates
+        and deletions, any unique label (e.g. the input line) for creations. Returns the job ID.
+        """
+        with local_store.transaction() as conn:
+            job_id = conn.execute(
+                'INSERT INTO write_jobs (kind, table_name, op, created_by, created_at, total) VALUES (?, ?, ?, ?, ?, ?)',
+                (kind, table_name, op, created_by, time.time(), len(items))).lastrowid
+            conn.executemany(
+                'INSERT OR REPLACE INTO write_job_items (job_id, item_key, record_id, fields) VALUES (?, ?, ?, ?)',
+                [(job_id, key, None if op == CREATE else key, json.dumps(fields)) for key, fields in items.items()])
+        self._wake.set()
+        return job_id
+
+    def extend(self, job_id, items):
+        """
+        Add items to a job that was queued before its records were known (e.g. with an empty
+        `items`, so its ID can be handed out straight away). Adding none closes the job.
+        """
+        with local_store.transaction() as conn:
+            op = conn.execute('SELECT op FROM write_jobs WHERE id = ?', (job_id,)).fetchone()['op']
+            conn.executemany(
+                'INSERT OR IGNORE INTO write_job_items (job_id, item_key, record_id, fields) VALUES (?, ?, ?, ?)',
+                [(job_id, key, None if op == CREATE else key, json.dumps(fields)) for key, fields in items.items()])
+            conn.execute('UPDATE write_jobs SET total = (SELECT COUNT(*) FROM write_job_items WHERE job_id = ?) '
+                         'WHERE id = ?', (job_id, job_id))
+            if not items:
+                conn.execute('UPDATE write_jobs SET finished_at = ? WHERE id = ? AND finished_at IS NULL AND NOT EXISTS '
+                             '(SELECT 1 FROM write_job_items WHERE job_id = ? AND state IN (?, ?))',
+                             (time.time(), job_id, job_id, PENDING, SENDING))
+        self._wake.set()
+
+    def job(self, job_id):
+        """Progress and throughput of a job, with (up to DETAIL_LIMIT) pending keys and errors; None if unknown"""
+        conn = local_store.connect()
+        row = conn.execute('SELECT * FROM write_jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        pending = conn.execute('SELECT item_key FROM write_job_items WHERE job_id = ? AND state IN (?, ?) LIMIT ?',
+                               (job_id, PENDING, SENDING, DETAIL_LIMIT)).fetchall()
+        errors = conn.execute('SELECT item_key, error FROM write_job_items WHERE job_id = ? AND state = ? LIMIT ?',
+                              (job_id, FAILED, DETAIL_LIMIT)).fetchall()
+        elapsed = None
+        if row['started_at'] is not None:
+            elapsed = (row['finished_at'] or time.time()) - row['started_at']
+        return {
+            'id': row['id'],
+            'kind': row['kind'],
+            'table': row['table_name'],
+            'op': row['op'],
+            'created_by': row['created_by'],
+            'total': row['total'],
+            'succeeded': row['succeeded'],
+            'failed': row['failed'],
+            'done': row['finished_at'] is not None,
+            'pending': [item['item_key'] for item in pending],
+            'errors': {item['item_key']: item['error'] for item in errors},
+            'calls': row['calls'],
+            'throttled': row['throttled'],
+            'elapsed_seconds': round(elapsed, 3) if elapsed is not None else None,
+            'records_per_second': round(row['succeeded'] / elapsed, 2) if elapsed else None,
+        }
+
+    def claim_lease(self):
+        """Take or renew the writer lease; returns False while another live worker holds it"""
+        now = time.time()
+        with local_store.transaction() as conn:
+            row = conn.execute("SELECT holder, expires_at FROM write_lease WHERE name = 'writer'").fetchone()
+            if row and row['holder'] != self.holder and row['expires_at'] > now:
+                return False
+            conn.execute("INSERT OR REPLACE INTO write_lease (name, holder, expires_at) VALUES ('writer', ?, ?)",
+                         (self.holder, now + self.lease_ttl))
+            if not row or row['holder'] != self.holder:
+                self._recover(conn)
+        return True
+
+    @staticmethod
+    def _recover(conn):
+        """Settle items a previous lease holder was sending when it stopped"""
+        conn.execute('UPDATE write_job_items SET state = ? WHERE state = ? AND job_id IN '
+                     '(SELECT id FROM write_jobs WHERE op != ?)', (PENDING, SENDING, CREATE))
+        interrupted = conn.execute('SELECT job_id, item_key FROM write_job_items WHERE state = ?', (SENDING,)).fetchall()
+        for item in interrupted:
+            BatchWriter._finish(conn, item['job_id'], [item['item_key']], FAILED,
+                                'Interrupted while sending; the record may already have been created')
+        if interrupted:
+            logger.warning("Marked %d interrupted creations as failed", len(interrupted))
+
+    def _next_batches(self, count):
+        """Up to `count` batches of pending items, oldest job first, as (job_id, table, op, solo, items)"""
+        rows = local_store.connect().execute(
+            'SELECT i.job_id, j.table_name, j.op, i.item_key, i.record_id, i.fields, i.solo '
+            'FROM write_job_items i JOIN write_jobs j ON j.id = i.job_id '
+            'WHERE i.state = ? ORDER BY i.job_id, i.solo DESC LIMIT ?', (PENDING, count * self.batch_size)).fetchall()
+        batches = []
+        for row in rows:
+            last = batches[-1] if batches else None
+            size = 1 if row['solo'] else self.batch_size
+            if last is None or last[0] != row['job_id'] or last[3] != row['solo'] or len(last[4]) >= size:
+                if len(batches) == count:
+                    break
+                last = (row['job_id'], row['table_name'], row['op'], row['solo'], [])
+                batches.append(last)
+            last[4].append((row['item_key'], row['record_id'], json.loads(row['fields'])))
+        return batches
+
+    @staticmethod
+    def _finish(conn, job_id, keys, state, error=None):
+        conn.executemany('UPDATE write_job_items SET state = ?, error = ? WHERE job_id = ? AND item_key = ?',
+                         [(state, error, job_id, key) for key in keys])
+        column = 'succeeded' if state == DONE else 'failed'
+        conn.execute(f'UPDATE write_jobs SET {column} = {column} + ? WHERE id = ?', (len(keys), job_id))
+        conn.execute('UPDATE write_jobs SET finished_at = ? WHERE id = ? AND finished_at IS NULL AND NOT EXISTS '
+                     '(SELECT 1 FROM write_job_items WHERE job_id = ? AND state IN (?, ?))',
+                     (time.time(), job_id, job_id, PENDING, SENDING))
+
+    def _wait_for_slot(self):
+        with self._slot_lock:
+            start = max(time.monotonic(), self._next_send)
+            self._next_send = start + self.interval
+        delay = start - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _send(self, batch):
+        _, table_name, op, _, items = batch
+        self._wait_for_slot()
+        try:
+            return self.send(table_name, op, [(record_id, fields) for _, record_id, fields in items])
+        except Exception as e:
+            return e
+
+    def process_round(self):
+        """Send up to `concurrency` batches at once; returns False when the queue is empty"""
+        with self._round_lock:
+            return self._process_round()
+
+    def _process_round(self):
+        batches = self._next_batches(self.concurrency)
+        if not batches:
+            return False
+        now = time.time()
+        with local_store.transaction() as conn:
+            for job_id, _, _, _, items in batches:
+                conn.executemany('UPDATE write_job_items SET state = ? WHERE job_id = ? AND item_key = ?',
+                                 [(SENDING, job_id, key) for key, _, _ in items])
+                conn.execute('UPDATE write_jobs SET started_at = ? WHERE id = ? AND started_at IS NULL', (now, job_id))
+        results = list(self._pool.map(self._send, batches))
+        if not self.claim_lease():
+            # The round outlasted the lease and another worker took over, re-queueing these items
+            logger.warning("Lost the writer lease while sending; leaving %d batches to its new holder", len(batches))
+            return True
+        for batch, result in zip(batches, results):
+            try:
+                self._handle(batch, result)
+            except Exception as e:
+                logger.error("Failed to record batch write result: %s", e)
+        return True
+
+    def _handle(self, batch, response):
+        job_id, table_name, op, _, items = batch
+        sent_keys = [key for key, _, _ in items]
+        status = getattr(response, 'status_code', None)
+
+        with local_store.transaction() as conn:
+            # Items settled meanwhile (e.g. by a lease holder recovering them) aren't counted twice
+            sending = {row[0] for row in conn.execute(
+                f'SELECT item_key FROM write_job_items WHERE job_id = ? AND state = ? '
+                f'AND item_key IN ({", ".join("?" * len(sent_keys))})', (job_id, SENDING, *sent_keys))}
+            items = [item for item in items if item[0] in sending]
+            if not items:
+                return
+            keys = [key for key, _, _ in items]
+            conn.execute('UPDATE write_jobs SET calls = calls + 1, throttled = throttled + ? WHERE id = ?',
+                         (1 if status == 429 else 0, job_id))
+            if status == 200:
+                records = response.json().get('records', [])
+                if op == DELETE:
+                    records = [{'id': key, 'fields': fields} for key, _, fields in items]
+                elif op == CREATE:
+                    # Airtable returns created records in request order
+                    records = [record for key, record in zip(sent_keys, records) if key in sending]
+                    conn.executemany('UPDATE write_job_items SET record_id = ? WHERE job_id = ? AND item_key = ?',
+                                     [(record['id'], job_id, key) for key, record in zip(keys, records)])
+                self._finish(conn, job_id, keys, DONE)
+            elif status == 429:
+                self._set_state(conn, job_id, keys, PENDING)
+            elif status is not None and 400 <= status < 500:
+                error = _error_message(response)
+                if len(items) > 1:
+                    conn.executemany('UPDATE write_job_items SET solo = 1, state = ? WHERE job_id = ? AND item_key = ?',
+                                     [(PENDING, job_id, key) for key in keys])
+                elif op == DELETE and status == 404:
+                    # Already gone
+                    self._finish(conn, job_id, keys, DONE)
+                else:
+                    self._finish(conn, job_id, keys, FAILED, error)
+            else:
+                error = _error_message(response) if status is not None else str(response)
+                conn.executemany('UPDATE write_job_items SET attempts = attempts + 1, state = ? '
+                                 'WHERE job_id = ? AND item_key = ?', [(PENDING, job_id, key) for key in keys])
+                exhausted = [row[0] for row in conn.execute(
+                    f'SELECT item_key FROM write_job_items WHERE job_id = ? AND attempts >= ? '
+                    f'AND item_key IN ({", ".join("?" * len(keys))})', (job_id, self.max_attempts, *keys))]
+                if exhausted:
+                    self._finish(conn, job_id, exhausted, FAILED, error)
+
+        if status == 200:
+            self._failures = 0
+            if self.on_success:
+                try:
+                    self.on_success(table_name, op, records)
+                except Exception as e:
+                    logger.error("Batch write callback failed: %s", e)
+        elif status == 429:
+            logger.warning("Airtable rate limit hit; pausing batch writes for %.0fs", self.rate_limit_pause)
+            self._pause(self.rate_limit_pause)
+        elif status is not None and 400 <= status < 500:
+            logger.warning("Batch write to %s rejected (%s): %s", table_name, status, error)
+        else:
+            logger.error("Batch write to %s failed (%s): %s", table_name, status, error)
+            self._failures += 1
+            self._pause(min(2 ** self._failures, 30))
+
+    @staticmethod
+    def _set_state(conn, job_id, keys, state):
+        conn.executemany('UPDATE write_job_items SET state = ? WHERE job_id = ? AND item_key = ?',
+                         [(state, job_id, key) for key in keys])
+
+    def _pause(self, seconds):
+        with self._slot_lock:
+            self._next_send = max(self._next_send, time.monotonic() + seconds)
+
+    def release_lease(self):
+        local_store.connect().execute("DELETE FROM write_lease WHERE name = 'writer' AND holder = ?", (self.holder,))
+
+    def run(self):
+        """Send while this worker holds the lease, then let the lease go once the queue is empty"""
+        while self.claim_lease():
+            if not self.process_round():
+                self.release_lease()
+                return
+
+    def start(self):
+        """Background thread sending queued batches while this worker holds the lease"""
+        if self._thread is not None:
+            return
+
+        def loop():
+            while True:
+                try:
+                    self.run()
+                except Exception as e:
+                    logger.error("Batch writer failed: %s", e)
+                self._wake.wait(1.0)
+                self._wake.clear()
+
+        self._thread = threading.Thread(target=loop, name='batch-writer', daemon=True)
+        self._thread.start()
+
+
+def _error_message(response):
+    try:
+        error = response.json().get('error', {})
+        return error.get('message') or error.get('type') or response.text if isinstance(error, dict) else str(error)
+    except ValueError:
+        return response.text
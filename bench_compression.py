@@ -0,0 +1,71 @@
+"""
+Bytes saved and CPU spent compressing each page and API response.
+
+Run against fake_upstream.py (or real credentials) with the usual environment:
+
+    python bench_compression.py --user-id U00000000 --iterations 50
+
+Each route is fetched once uncompressed through the Flask test client as a logged-in
+user (pages that need no login are fetched logged out as well), then the body is
+compressed repeatedly with every available encoding and level. The report shows
+the original size, the compressed size and ratio, and the CPU time per response.
+"""
+import argparse
+import gzip
+import time
+
+import compression
+
+DEFAULT_ROUTES = ['/', '/login', '/settings', '/create-log', '/create-project', '/api/logs', '/api/projects']
+ANONYMOUS_ROUTES = {'/', '/login'}
+
+
+def encoders(gzip_levels, brotli_qualities):
+    for level in gzip_levels:
+        yield f"gzip-{level}", lambda data, level=level: gzip.compress(data, compresslevel=level)
+    if compression.brotli is not None:
+        for quality in brotli_qualities:
+            yield f"br-{quality}", lambda data, quality=quality: compression.brotli.compress(data, quality=quality)
+
+
+def fetch_bodies(app, routes, user_id):
+    bodies = []
+    anonymous = app.test_client()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = user_id
+        session['user_name'] = 'Benchmark User'
+    for route in routes:
+        if route in ANONYMOUS_ROUTES:
+            response = anonymous.get(route, headers={'Accept-Encoding': 'identity'})
+            bodies.append((f"{route} (anon)", response.mimetype, response.get_data()))
+        response = client.get(route, headers={'Accept-Encoding': 'identity'})
+        bodies.append((route, response.mimetype, response.get_data()))
+    return bodies
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark response compression per route')
+    parser.add_argument('--routes', nargs='+', default=DEFAULT_ROUTES)
+    parser.add_argument('--user-id', default='U00000000', help='Session user for logged-in routes')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--gzip-levels', type=int, nargs='+', default=[1, 6, 9])
+    parser.add_argument('--brotli-qualities', type=int, nargs='+', default=[4, 11])
+    args = parser.parse_args()
+
+    import main
+
+    if compression.brotli is None:
+        print("brotli is not installed; only gzip is measured\n")
+
+    print(f"{'route':<24} {'type':<18} {'encoding':<9} {'bytes':>9} {'out':>9} {'ratio':>6} {'cpu us':>9}")
+    for route, mimetype, data in fetch_bodies(main.app, args.routes, args.user_id):
+        print(f"{route:<24} {mimetype:<18} {'identity':<9} {len(data):>9} {len(data):>9} {1:>6.2f} {0:>9.1f}")
+        for name, encode in encoders(args.gzip_levels, args.brotli_qualities):
+            out = encode(data)
+            start = time.process_time()
+            for _ in range(args.iterations):
+                encode(data)
+            cpu_us = (time.process_time() - start) / args.iterations * 1e6
+            ratio = len(out) / len(data) if data else 1
+            print(f"{'':<24} {'':<18} {name:<9} {'':>9} {len(out):>9} {ratio:>6.2f} {cpu_us:>9.1f}")
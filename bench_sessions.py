@@ -0,0 +1,114 @@
+"""
+Compare session storage costs for realistic session payloads.
+
+    python bench_sessions.py --records 10 50 200 --iterations 2000
+
+For each payload size (number of cached log/project records) this reports the
+encoded size and the time to serialize, deserialize and save+load a session with:
+
+- cookie:  Flask's default signed cookie (what every request and response carried)
+- sqlite:  the server-side SqliteSessionInterface (only a signed ID in the cookie)
+
+Browsers reject cookies over ~4096 bytes, so larger cookie sizes are marked.
+"""
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+
+os.environ.setdefault('LOCAL_STORE_PATH', os.path.join(tempfile.mkdtemp(), 'bench.sqlite3'))
+
+from flask import Flask
+from flask.sessions import SecureCookieSessionInterface
+
+import sessions
+
+COOKIE_LIMIT = 4096
+
+
+def fake_record(i):
+    text = lambda n: ''.join(random.choices(string.ascii_letters + ' ', k=n))
+    return {
+        'id': f"rec{i:014d}",
+        'createdTime': '2024-01-01T00:00:00.000Z',
+        'fields': {
+            'User ID': 'U012345678', 'User Name': 'Test User', 'Project Name': text(20),
+            'Project Tag': 'proj-tag', 'Title': text(40), 'What Did': text(300),
+            'Issues Faced': text(150), 'Next Steps': text(150), 'Time Spent': random.randint(1, 240),
+            'Media URL': 'https://cdn.example.com/' + text(30).replace(' ', ''),
+            'Created At': '2024-01-01T00:00:00',
+        },
+    }
+
+
+def fake_session(records):
+    return {
+        'user_id': 'U012345678', 'user_name': 'Test User', 'access_token': 'xoxp-' + 'x' * 60,
+        'user_settings': {'use_static_props': True},
+        'logs_cache': [fake_record(i) for i in range(records)],
+        'projects_cache': [fake_record(i) for i in range(max(1, records // 10))],
+    }
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench(records, iterations):
+    app = Flask(__name__)
+    app.secret_key = 'bench'
+    data = fake_session(records)
+
+    cookie_serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+    cookie = cookie_serializer.dumps(data)
+    cookie_row = {
+        'backend': 'cookie',
+        'bytes': len(cookie),
+        'dump_us': timed(lambda: cookie_serializer.dumps(data), iterations),
+        'load_us': timed(lambda: cookie_serializer.loads(cookie), iterations),
+    }
+
+    interface = sessions.SqliteSessionInterface(sweep_interval=3600)
+    payload = interface.serializer.dumps(data)
+    with app.test_request_context():
+        session = sessions.ServerSideSession(data, sid=sessions.new_session_id(), new=True)
+        response = app.response_class()
+
+        def save_and_load():
+            session.modified = True
+            interface.save_session(app, session, response)
+            sessions.local_store.connect().execute('SELECT data FROM sessions WHERE id = ?', (session.sid,)).fetchone()
+
+        save_and_load()
+        sqlite_row = {
+            'backend': 'sqlite',
+            'bytes': len(response.headers.get('Set-Cookie', '').split(';')[0]),
+            'stored': len(payload),
+            'dump_us': timed(lambda: interface.serializer.dumps(data), iterations),
+            'load_us': timed(lambda: interface.serializer.loads(payload), iterations),
+            'roundtrip_us': timed(save_and_load, max(1, iterations // 10)),
+        }
+    return cookie_row, sqlite_row
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark cookie vs server-side session serialization')
+    parser.add_argument('--records', type=int, nargs='+', default=[0, 10, 50, 200],
+                        help='Cached records per session')
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    print(f"{'records':>7} {'backend':>7} {'cookie B':>9} {'stored B':>9} {'dump us':>9} {'load us':>9} {'save+load us':>13}")
+    for records in args.records:
+        for row in bench(records, args.iterations):
+            flag = ' (over browser limit)' if row['backend'] == 'cookie' and row['bytes'] > COOKIE_LIMIT else ''
+            roundtrip = f"{row['roundtrip_us']:.1f}" if 'roundtrip_us' in row else '-'
+            print(f"{records:>7} {row['backend']:>7} {row['bytes']:>9} {row.get('stored', row['bytes']):>9} "
+                  f"{row['dump_us']:>9.1f} {row['load_us']:>9.1f} {roundtrip:>13}{flag}")
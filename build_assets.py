@@ -0,0 +1,172 @@
+"""
+Minify and fingerprint the CSS/JS/image assets under static/.
+
+    python build_assets.py
+
+Every file in static/css, static/js and static/img is copied to
+static/dist/<name>.<hash>.<ext> (CSS and JS minified first) and recorded in
+static/dist/manifest.json as {"css/base.css": "dist/base.1a2b3c4d.css", ...}. The
+app's `asset_url()` template helper resolves names through the manifest, and files
+under dist/ are served with a one-year immutable Cache-Control, since any change to
+a file produces a new name. Without a build, `asset_url()` falls back to the
+unminified source files.
+
+The minifiers are deliberately conservative (comments and whitespace only), so the
+output behaves exactly like the source.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+SOURCE_DIRS = ('css', 'js', 'img')
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+
+_CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+
+
+def _minify_css_code(code):
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r'\s*([{};,>])\s*', r'\1', code)
+    code = re.sub(r'\s*:\s*(?=[^{}]*;)', ':', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    # Odd-numbered parts are quoted strings and are kept verbatim
+    parts = _CSS_STRING.split(source)
+    return ''.join(part if i % 2 else _minify_css_code(part) for i, part in enumerate(parts)).strip() + '\n'
+
+
+# Characters after which a '/' starts a regular expression literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def _string_end(source, i):
+    """Index just past the string or template literal (including nested ${...}) starting at source[i]"""
+    quote, j, n = source[i], i + 1, len(source)
+    depth = 0
+    while j < n:
+        c = source[j]
+        if c == '\\':
+            j += 2
+            continue
+        if quote == '`' and source.startswith('${', j):
+            depth += 1
+            j += 2
+            continue
+        if depth:
+            if c in '"\'`':
+                j = _string_end(source, j)
+                continue
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+        elif c == quote:
+            return j + 1
+        j += 1
+    return n
+
+
+def minify_js(source):
+    """Drop comments, indentation and blank lines outside of strings, template literals and regexes"""
+    out = []
+    i, n = 0, len(source)
+    last_significant = ''
+    at_line_start = True
+    while i < n:
+        c = source[i]
+        if c in '"\'`':
+            j = _string_end(source, i)
+            out.append(source[i:j])
+            i = j
+            last_significant, at_line_start = c, False
+        elif source.startswith('//', i):
+            while i < n and source[i] != '\n':
+                i += 1
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        elif c == '/' and (last_significant in _REGEX_PRECEDERS or last_significant == ''
+                           or re.search(r'\b(return|typeof|case|in|of)\s*$', ''.join(out[-3:]))):
+            j, in_class = i + 1, False
+            while j < n and (source[j] != '/' or in_class):
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                j += 1
+            j += 1
+            while j < n and source[j].isalpha():
+                j += 1
+            out.append(source[i:j])
+            i = j
+            last_significant, at_line_start = '/', False
+        elif c == '\n':
+            if not at_line_start:
+                out.append('\n')
+            at_line_start = True
+            i += 1
+        elif c in ' \t\r':
+            j = i
+            while j < n and source[j] in ' \t\r':
+                j += 1
+            if not at_line_start and j < n and source[j] != '\n':
+                out.append(' ')
+            i = j
+        else:
+            out.append(c)
+            last_significant, at_line_start = c, False
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def build(static_dir=STATIC_DIR):
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for source_dir in SOURCE_DIRS:
+        root = os.path.join(static_dir, source_dir)
+        if not os.path.isdir(root):
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, static_dir).replace(os.sep, '/')
+                stem, ext = os.path.splitext(filename)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                if ext in MINIFIERS:
+                    data = MINIFIERS[ext](data.decode('utf-8')).encode('utf-8')
+                digest = hashlib.sha256(data).hexdigest()[:10]
+                built_name = f"{DIST_DIR}/{stem}.{digest}{ext}"
+                with open(os.path.join(static_dir, built_name), 'wb') as f:
+                    f.write(data)
+                manifest[name] = built_name
+                print(f"{name:<32} {os.path.getsize(path):>8} -> {built_name} ({len(data)} bytes)")
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Minify and fingerprint static assets')
+    parser.add_argument('--static-dir', default=STATIC_DIR)
+    args = parser.parse_args()
+    build(args.static_dir)
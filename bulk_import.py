@@ -0,0 +1,243 @@
+"""
+Bulk creation and update of logs and projects from CSV or NDJSON.
+
+    python bulk_import.py corrections.csv
+    python bulk_import.py migration.ndjson --dry-run
+    python bulk_import.py --resume 12 13
+
+Every row names an operation (`create` or `update`), a table (`logs` or `projects`),
+the record `id` for updates, and the Airtable fields to set. In CSV, `op`, `table` and
+`id` are columns and every other column header is a field name. Empty cells are left
+out, so an update only changes the fields it fills in. In NDJSON each line is
+{"op": ..., "table": ..., "id": ..., "fields": {...}}.
+
+The whole file is validated before anything is written: unknown fields, bad values,
+missing required fields, malformed or repeated record IDs. One invalid row rejects
+the import. Valid imports are queued as one batch-writer job per table and operation
+and sent in 10-record batches under the Airtable rate limit. The jobs persist in the
+local store, so an interrupted import carries on where it stopped: in the app's
+background writer, or with `--resume <job id>...`. The same import is available to
+admins as POST /api/admin/import.
+"""
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+import time
+from datetime import datetime
+
+LOG_STATUSES = ('Pending', 'In Review', 'Approved', 'Rejected')
+
+TABLES = ('logs', 'projects')
+
+OPS = ('create', 'update')
+
+# Most rows accepted in one import
+MAX_ROWS = 10000
+
+_RECORD_ID = re.compile(r'^rec[A-Za-z0-9]{14}$')
+
+
+def _text(value):
+    if not isinstance(value, str):
+        raise ValueError("must be text")
+    return value
+
+
+def _minutes(value):
+    try:
+        minutes = int(value) if not isinstance(value, float) or value.is_integer() else None
+    except (TypeError, ValueError):
+        minutes = None
+    if minutes is None or isinstance(value, bool) or minutes < 0:
+        raise ValueError("must be a whole number of minutes, 0 or more")
+    return minutes
+
+
+def _timestamp(value):
+    try:
+        datetime.fromisoformat(_text(value).replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError("must be an ISO 8601 date/time")
+    return value
+
+
+def _status(value):
+    if value not in LOG_STATUSES:
+        raise ValueError(f"must be one of {', '.join(LOG_STATUSES)}")
+    return value
+
+
+# Writable fields per table, with their validators
+FIELDS = {
+    'logs': {
+        'User ID': _text, 'User Name': _text, 'Project Name': _text, 'Project Tag': _text, 'Title': _text,
+        'What I Did': _text, 'Next Steps': _text, 'Issues Faced': _text, 'Media URL': _text,
+        'Time Spent (minutes)': _minutes, 'Created At': _timestamp, 'Status': _status,
+    },
+    'projects': {
+        'User ID': _text, 'User Name': _text, 'Project Name': _text, 'Description': _text,
+        'Github Link': _text, 'Cover Image URL': _text, 'Created At': _timestamp,
+    },
+}
+
+REQUIRED_ON_CREATE = {
+    'logs': ('User ID', 'Project Name', 'Time Spent (minutes)'),
+    'projects': ('User ID', 'Project Name'),
+}
+
+
+def read_rows(data, fmt):
+    """(line, {'op', 'table', 'id', 'fields'}) per input row. Raises ValueError on unreadable input."""
+    if fmt == 'csv':
+        reader = csv.DictReader(io.StringIO(data))
+        if not reader.fieldnames or 'op' not in reader.fieldnames or 'table' not in reader.fieldnames:
+            raise ValueError("CSV needs a header row with at least `op` and `table` columns")
+        for row in reader:
+            fields = {name: value for name, value in row.items()
+                      if name not in ('op', 'table', 'id') and name is not None and value not in (None, '')}
+            yield reader.line_num, {'op': row.get('op'), 'table': row.get('table'), 'id': row.get('id') or None,
+                                    'fields': fields}
+    elif fmt == 'ndjson':
+        for line, text in enumerate(data.splitlines(), 1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError:
+                raise ValueError(f"Line {line} is not valid JSON")
+            if not isinstance(row, dict) or not isinstance(row.get('fields', {}), dict):
+                raise ValueError(f"Line {line} must be an object with a `fields` object")
+            yield line, {'op': row.get('op'), 'table': row.get('table'), 'id': row.get('id'),
+                         'fields': row.get('fields', {})}
+    else:
+        raise ValueError("format must be csv or ndjson")
+
+
+def validate(data, fmt):
+    """
+    Parse and check an import. Returns (operations, errors): operations group the rows as
+    {(table, op): {key: fields}} (the key is the record ID for updates and "line N" for
+    creations); errors is a list of {'line', 'message'}. Raises ValueError on unreadable input.
+    """
+    operations, errors, seen, count = {}, [], set(), 0
+    for line, row in read_rows(data, fmt):
+        count += 1
+        if count > MAX_ROWS:
+            raise ValueError(f"At most {MAX_ROWS} rows per import")
+        op, table, record_id, fields = row['op'], row['table'], row['id'], row['fields']
+        problems = []
+        if op not in OPS:
+            problems.append(f"op must be one of {', '.join(OPS)}")
+        if table not in TABLES:
+            problems.append(f"table must be one of {', '.join(TABLES)}")
+        if problems:
+            errors.extend({'line': line, 'message': problem} for problem in problems)
+            continue
+
+        clean = {}
+        for name, value in fields.items():
+            validator = FIELDS[table].get(name)
+            if validator is None:
+                problems.append(f"unknown {table} field `{name}`")
+                continue
+            try:
+                clean[name] = validator(value)
+            except ValueError as e:
+                problems.append(f"`{name}` {e}")
+
+        if op == 'update':
+            if not isinstance(record_id, str) or not _RECORD_ID.match(record_id):
+                problems.append("update needs the `id` of an existing record (rec...)")
+            elif (table, record_id) in seen:
+                problems.append(f"record {record_id} is updated more than once")
+            else:
+                seen.add((table, record_id))
+            if not fields:
+                problems.append("update sets no fields")
+            key = record_id
+        else:
+            missing = [name for name in REQUIRED_ON_CREATE[table] if name not in fields]
+            if missing:
+                problems.append(f"create is missing {', '.join(missing)}")
+            clean.setdefault('Created At', datetime.now().isoformat())
+            if table == 'logs':
+                clean.setdefault('Status', 'Pending')
+            key = f"line {line}"
+
+        if problems:
+            errors.extend({'line': line, 'message': problem} for problem in problems)
+        else:
+            operations.setdefault((table, op), {})[key] = clean
+    if not count:
+        raise ValueError("The import is empty")
+    return operations, errors
+
+
+def detect_format(filename=None, content_type=None):
+    if filename and filename.lower().endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if content_type and ('ndjson' in content_type or 'jsonl' in content_type):
+        return 'ndjson'
+    return 'csv'
+
+
+def report(jobs):
+    """Text summary of batch-writer job progress and throughput"""
+    lines = [f"{'job':>5} {'table':<10} {'op':<7} {'total':>6} {'ok':>6} {'failed':>6} {'calls':>6} {'429s':>5} "
+             f"{'secs':>8} {'rec/s':>7}"]
+    for job in jobs:
+        lines.append(f"{job['id']:>5} {job['table']:<10} {job['op']:<7} {job['total']:>6} {job['succeeded']:>6} "
+                     f"{job['failed']:>6} {job['calls']:>6} {job['throttled']:>5} "
+                     f"{job['elapsed_seconds'] or 0:>8.1f} {job['records_per_second'] or 0:>7.1f}")
+        for key, error in list(job['errors'].items())[:20]:
+            lines.append(f"      {key}: {error}")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk-create or update logs and projects from CSV or NDJSON')
+    parser.add_argument('file', nargs='?', help='CSV or NDJSON file ("-" for stdin)')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], help='Input format (default: from the file name)')
+    parser.add_argument('--dry-run', action='store_true', help='Only validate the file')
+    parser.add_argument('--created-by', default=None, help='User ID recorded as the author of the jobs')
+    parser.add_argument('--resume', type=int, nargs='+', metavar='JOB_ID', help='Continue earlier import jobs')
+    args = parser.parse_args()
+    if not args.file and not args.resume:
+        parser.error('give a file to import or --resume JOB_ID...')
+
+    import main
+    main.batch_writer.start()
+
+    if args.resume:
+        job_ids = args.resume
+    else:
+        data = sys.stdin.read() if args.file == '-' else open(args.file, encoding='utf-8-sig').read()
+        try:
+            operations, errors = validate(data, args.format or detect_format(args.file))
+        except ValueError as e:
+            sys.exit(str(e))
+        if errors:
+            for error in errors[:100]:
+                print(f"line {error['line']}: {error['message']}", file=sys.stderr)
+            sys.exit(f"{len(errors)} problem(s) found; nothing was imported")
+        print(', '.join(f"{len(items)} {table} to {op}" for (table, op), items in operations.items()))
+        if args.dry_run:
+            sys.exit(0)
+        job_ids = main.queue_import(operations, args.created_by)
+        print(f"Queued as job(s) {' '.join(map(str, job_ids))}; resume with --resume {' '.join(map(str, job_ids))}")
+
+    def unfinished():
+        return [job for job in map(main.batch_writer.job, job_ids) if job is not None and not job['done']]
+
+    # The writer thread started above does the sending, unless the running app holds the lease
+    last_print = time.time()
+    while unfinished():
+        time.sleep(1)
+        if time.time() - last_print >= 5:
+            last_print = time.time()
+            done = sum(job['succeeded'] + job['failed'] for job in map(main.batch_writer.job, job_ids) if job)
+            print(f"... {done} records written")
+    print(report([job for job in map(main.batch_writer.job, job_ids) if job is not None]))
@@ -0,0 +1,165 @@
+"""
+Record-level change log for the Airtable tables users edit (logs and projects).
+
+Every create, update and delete the app sends to Airtable is appended here with a
+monotonically increasing sequence number. Airtable can report which records were
+created or modified after a point in time (LAST_MODIFIED_TIME()), but it keeps no
+trace of deleted records, so the log is what lets delta sync hand out tombstones.
+
+Deleted projects are also kept by name, since logs refer to their project by name
+(owner and Project Name): these tombstones are what the project cascade and the
+orphaned-log cleanup go by.
+
+Sync tokens are opaque strings wrapping the latest sequence number and the server
+time they were issued at. Rows older than `retention` seconds are pruned; tokens
+older than that can no longer be answered and clients must do a full sync.
+"""
+import base64
+import json
+import logging
+import time
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS record_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    user_id TEXT,
+    op TEXT NOT NULL,
+    changed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS record_changes_user ON record_changes (user_id, table_name, seq);
+CREATE INDEX IF NOT EXISTS record_changes_changed_at ON record_changes (changed_at);
+CREATE INDEX IF NOT EXISTS record_changes_record ON record_changes (record_id, seq);
+CREATE TABLE IF NOT EXISTS deleted_projects (
+    record_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    deleted_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS deleted_projects_deleted_at ON deleted_projects (deleted_at);
+""")
+
+UPSERT = 'upsert'
+DELETE = 'delete'
+
+
+class ExpiredToken(ValueError):
+    """The sync token predates the retained change log"""
+
+
+class ChangeLog:
+    def __init__(self, retention=30 * 86400, prune_interval=3600):
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self.last_prune = 0.0
+
+    def record(self, table_name, record_id, user_id, op):
+        """Append a change; returns its sequence number"""
+        now = time.time()
+        seq = local_store.connect().execute(
+            'INSERT INTO record_changes (table_name, record_id, user_id, op, changed_at) VALUES (?, ?, ?, ?, ?)',
+            (table_name, record_id, user_id, op, now)).lastrowid
+        if now - self.last_prune >= self.prune_interval:
+            self.last_prune = now
+            self.prune()
+        return seq
+
+    def since(self, table_name, user_id, seq=None, timestamp=None):
+        """Latest change per record after `seq` (or after `timestamp` when no seq is known), oldest first"""
+        conn = local_store.connect()
+        if seq is not None:
+            rows = conn.execute(
+                'SELECT seq, record_id, op, changed_at FROM record_changes '
+                'WHERE user_id = ? AND table_name = ? AND seq > ? ORDER BY seq',
+                (user_id, table_name, seq)).fetchall()
+        else:
+            rows = conn.execute(
+                'SELECT seq, record_id, op, changed_at FROM record_changes '
+                'WHERE user_id = ? AND table_name = ? AND changed_at > ? ORDER BY seq',
+                (user_id, table_name, timestamp)).fetchall()
+        latest = {}
+        for row in rows:
+            latest.pop(row['record_id'], None)
+            latest[row['record_id']] = dict(row)
+        return list(latest.values())
+
+    def has_changes(self, table_name, user_id, seq):
+        return local_store.connect().execute(
+            'SELECT 1 FROM record_changes WHERE user_id = ? AND table_name = ? AND seq > ? LIMIT 1',
+            (user_id, table_name, seq)).fetchone() is not None
+
+    def last_changed(self, table_name, record_ids):
+        """{record_id: time of its latest recorded change} for those of `record_ids` that have one"""
+        conn = local_store.connect()
+        found = {}
+        for start in range(0, len(record_ids), 500):
+            chunk = record_ids[start:start + 500]
+            found.update(conn.execute(
+                f'SELECT record_id, MAX(changed_at) FROM record_changes WHERE table_name = ? '
+                f'AND record_id IN ({", ".join("?" * len(chunk))}) GROUP BY record_id', (table_name, *chunk)).fetchall())
+        return found
+
+    def owner(self, record_id):
+        """User ID recorded with the record's latest change, if any"""
+        row = local_store.connect().execute(
+            'SELECT user_id FROM record_changes WHERE record_id = ? AND user_id IS NOT NULL ORDER BY seq DESC LIMIT 1',
+            (record_id,)).fetchone()
+        return row['user_id'] if row else None
+
+    def record_project_deletion(self, record_id, user_id, project_name):
+        """Tombstone for a deleted project, so its logs (matched by owner and name) can be found later"""
+        local_store.connect().execute(
+            'INSERT OR REPLACE INTO deleted_projects (record_id, user_id, project_name, deleted_at) VALUES (?, ?, ?, ?)',
+            (record_id, user_id, project_name, time.time()))
+
+    def deleted_projects(self):
+        """Retained project tombstones as {(user_id, project_name): [record_id, ...]}"""
+        found = {}
+        for row in local_store.connect().execute('SELECT record_id, user_id, project_name FROM deleted_projects'):
+            found.setdefault((row['user_id'], row['project_name']), []).append(row['record_id'])
+        return found
+
+    def forget_deleted_projects(self, record_ids):
+        with local_store.transaction() as conn:
+            conn.executemany('DELETE FROM deleted_projects WHERE record_id = ?', [(record_id,) for record_id in record_ids])
+
+    def latest_seq(self):
+        return local_store.connect().execute('SELECT COALESCE(MAX(seq), 0) FROM record_changes').fetchone()[0]
+
+    def prune(self):
+        """Drop changes older than the retention window; returns the number removed"""
+        cutoff = time.time() - self.retention
+        conn = local_store.connect()
+        removed = conn.execute('DELETE FROM record_changes WHERE changed_at < ?', (cutoff,)).rowcount
+        conn.execute('DELETE FROM deleted_projects WHERE deleted_at < ?', (cutoff,))
+        if removed:
+            logger.info("Pruned %d old record changes", removed)
+        return removed
+
+    def issue_token(self):
+        """Token for "everything up to now"; the sequence is read before any data is fetched"""
+        return encode_token(self.latest_seq(), time.time())
+
+    def check_token(self, issued_at):
+        if issued_at < time.time() - self.retention:
+            raise ExpiredToken("Sync token has expired; fetch the full list again")
+
+
+def encode_token(seq, issued_at):
+    return base64.urlsafe_b64encode(json.dumps([seq, round(issued_at, 3)]).encode()).decode().rstrip('=')
+
+
+def decode_token(token):
+    """(seq, issued_at) from a sync token. Raises ValueError."""
+    try:
+        seq, issued_at = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid sync token")
+    if not isinstance(seq, int) or not isinstance(issued_at, (int, float)):
+        raise ValueError("Invalid sync token")
+    return seq, float(issued_at)
@@ -0,0 +1,140 @@
+"""
+gzip/brotli response compression negotiated from Accept-Encoding.
+
+Text responses (HTML, JSON, CSS, JS, SVG, plain text) at least `min_size` bytes long are
+compressed in an after_request hook. Streamed responses are compressed chunk by
+chunk with a sync flush after each chunk, so the client still receives data as it is
+produced. Media, anything that already has a Content-Encoding, and the excluded
+paths (temp uploads the CDN pulls, the default cover image) are left alone.
+
+brotli is used when the optional `brotli` package is installed and the client asks
+for it; otherwise gzip.
+"""
+from flask import request
+import gzip
+import time
+import zlib
+
+import metrics
+import server_timing
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'text/csv', 'text/markdown',
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+}
+
+COMPRESSION_BYTES = metrics.Counter('groundplane_compression_bytes',
+                                    'Response bytes before (in) and after (out) compression',
+                                    ('encoding', 'stage'))
+
+
+def choose_encoding(accept_encodings, allow_brotli=True):
+    """Best supported encoding the client accepts, or None"""
+    candidates = []
+    if allow_brotli and brotli is not None:
+        candidates.append('br')
+    candidates.append('gzip')
+    best, best_quality = None, 0
+    for encoding in candidates:
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding, gzip_level=6, brotli_quality=4):
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level)
+
+
+def _stream_compressor(encoding, gzip_level, brotli_quality):
+    """(compress(chunk), flush(), finish()) callables for incremental compression"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=brotli_quality)
+        return compressor.process, compressor.flush, compressor.finish
+    compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+class Compress:
+    """Flask extension compressing eligible responses"""
+
+    def __init__(self, min_size=1024, gzip_level=6, brotli_quality=4, exclude_paths=(), allow_brotli=True):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = tuple(exclude_paths)
+        self.allow_brotli = allow_brotli
+
+    def init_app(self, app):
+        app.after_request(self._after_request)
+
+    def _after_request(self, response):
+        if (response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or 'Content-Encoding' in response.headers
+                or request.path.startswith(self.exclude_paths)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(request.accept_encodings, self.allow_brotli)
+        if encoding is None:
+            return response
+
+        if response.is_streamed and not response.direct_passthrough:
+            self._compress_stream(response, encoding)
+            return response
+
+        # Static files are sent as file wrappers; read them so they can be compressed
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        start = time.perf_counter()
+        compressed = compress(data, encoding, self.gzip_level, self.brotli_quality)
+        server_timing.record('compress', time.perf_counter() - start, f"compress {encoding}")
+        COMPRESSION_BYTES.inc(encoding, 'in', amount=len(data))
+        COMPRESSION_BYTES.inc(encoding, 'out', amount=len(compressed))
+
+        response.set_data(compressed)
+        self._mark_encoded(response, encoding)
+        return response
+
+    def _compress_stream(self, response, encoding):
+        process, flush, finish = _stream_compressor(encoding, self.gzip_level, self.brotli_quality)
+        chunks = response.response
+
+        def generate():
+            try:
+                for chunk in chunks:
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode(response.charset)
+                    COMPRESSION_BYTES.inc(encoding, 'in', amount=len(chunk))
+                    out = process(chunk) + flush()
+                    COMPRESSION_BYTES.inc(encoding, 'out', amount=len(out))
+                    yield out
+                tail = finish()
+                COMPRESSION_BYTES.inc(encoding, 'out', amount=len(tail))
+                yield tail
+            finally:
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+
+        response.response = generate()
+        response.headers.pop('Content-Length', None)
+        self._mark_encoded(response, encoding)
+
+    @staticmethod
+    def _mark_encoded(response, encoding):
+        response.headers['Content-Encoding'] = encoding
+        # The encoded body differs byte-for-byte, so only a weak validator still holds
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
@@ -0,0 +1,921 @@
+"""
+Local stand-in for the upstream services main.py talks to: the Airtable REST API,
+the Hack Club CDN and tmpfiles.org. Used for offline development and deterministic
+performance testing.
+
+    python fake_upstream.py --port 8787 --latency-ms 40 --error-rate 0.01 --seed 1
+
+then run the app against it:
+
+    AIRTABLE_API_URL=http://127.0.0.1:8787/v0 \\
+    HACKCLUB_CDN_URL=http://127.0.0.1:8787 \\
+    TMPFILES_URL=http://127.0.0.1:8787 python main.py
+
+Only the subset of behaviour the app relies on is implemented: list with
+filterByFormula (equality/inequality comparisons combined with AND/OR/NOT, plus
+IS_BEFORE/IS_AFTER over CREATED_TIME()/LAST_MODIFIED_TIME()), sort,
+maxRecords, pageSize/offset pagination and fields[], single record get/create/
+update/delete, 10-record batches and per-base 429 rate limiting. Webhooks are
+supported too: create/list/refresh/delete, payload listing by cursor and signed
+notification pings to the registered URL after every change, plus the table list
+of the metadata API. `webhook_ttl` in /_fake/config shortens their lifetime.
+"""
+from flask import Flask, request, jsonify, abort, Response, has_request_context
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import math
+import os
+import random
+import string
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+
+import requests
+
+MAX_BATCH_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+app = Flask(__name__)
+
+config = {
+    'latency_ms': 0,
+    'jitter_ms': 0,
+    'error_rate': 0.0,
+    'rate_limit': 5,
+    'cdn_fetch': False,
+    'webhook_ttl': 7 * 86400,
+}
+
+_rng = random.Random()
+_rng_lock = threading.Lock()
+
+
+def _random():
+    with _rng_lock:
+        return _rng.random()
+
+
+def now_iso():
+    now = datetime.now(timezone.utc)
+    return now.strftime('%Y-%m-%dT%H:%M:%S.') + f"{now.microsecond // 1000:03d}Z"
+
+
+def airtable_error(status, error_type, message):
+    return jsonify({'error': {'type': error_type, 'message': message}}), status
+
+
+class FormulaError(Exception):
+    pass
+
+
+class Formula:
+    """Tiny parser/evaluator for the filterByFormula expressions main.py builds"""
+
+    FUNCTIONS = {'AND', 'OR', 'NOT', 'RECORD_ID', 'TRUE', 'FALSE', 'BLANK',
+                 'CREATED_TIME', 'LAST_MODIFIED_TIME', 'IS_BEFORE', 'IS_AFTER'}
+    OPERATORS = ('!=', '>=', '<=', '=', '>', '<')
+
+    def __init__(self, source):
+        self.tokens = self._tokenize(source)
+        self.pos = 0
+        self.ast = self._parse_expression()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"Unexpected token {self.tokens[self.pos][1]!r}")
+
+    def _tokenize(self, source):
+        tokens = []
+        i = 0
+        while i < len(source):
+            char = source[i]
+            if char.isspace():
+                i += 1
+            elif char == '{':
+                end = source.find('}', i)
+                if end == -1:
+                    raise FormulaError("Unterminated field reference")
+                tokens.append(('field', source[i + 1:end]))
+                i = end + 1
+            elif char in '\'"':
+                value = []
+                i += 1
+                while i < len(source) and source[i] != char:
+                    if source[i] == '\\' and i + 1 < len(source):
+                        i += 1
+                    value.append(source[i])
+                    i += 1
+                if i >= len(source):
+                    raise FormulaError("Unterminated string literal")
+                tokens.append(('string', ''.join(value)))
+                i += 1
+            elif char in '(),':
+                tokens.append((char, char))
+                i += 1
+            elif source.startswith(self.OPERATORS, i):
+                op = next(op for op in self.OPERATORS if source.startswith(op, i))
+                tokens.append(('op', op))
+                i += len(op)
+            elif char.isdigit() or (char == '-' and i + 1 < len(source) and source[i + 1].isdigit()):
+                end = i + 1
+                while end < len(source) and (source[end].isdigit() or source[end] == '.'):
+                    end += 1
+                tokens.append(('number', float(source[i:end])))
+                i = end
+            elif char.isalpha() or char == '_':
+                end = i
+                while end < len(source) and (source[end].isalnum() or source[end] == '_'):
+                    end += 1
+                tokens.append(('name', source[i:end].upper()))
+                i = end
+            else:
+                raise FormulaError(f"Unexpected character {char!r}")
+        return tokens
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _expect(self, kind):
+        token = self._peek()
+        if token[0] != kind:
+            raise FormulaError(f"Expected {kind!r}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def _parse_expression(self):
+        left = self._parse_primary()
+        if self._peek()[0] == 'op':
+            op = self._expect('op')[1]
+            right = self._parse_primary()
+            return ('compare', op, left, right)
+        return left
+
+    def _parse_primary(self):
+        kind, value = self._peek()
+        if kind == 'field':
+            self.pos += 1
+            return ('field', value)
+        if kind in ('string', 'number'):
+            self.pos += 1
+            return ('literal', value)
+        if kind == '(':
+            self.pos += 1
+            expr = self._parse_expression()
+            self._expect(')')
+            return expr
+        if kind == 'name':
+            if value not in self.FUNCTIONS:
+                raise FormulaError(f"Unknown function {value}")
+            self.pos += 1
+            self._expect('(')
+            args = []
+            if self._peek()[0] != ')':
+                args.append(self._parse_expression())
+                while self._peek()[0] == ',':
+                    self.pos += 1
+                    args.append(self._parse_expression())
+            self._expect(')')
+            return ('call', value, args)
+        raise FormulaError(f"Unexpected token {value!r}")
+
+    def matches(self, record):
+        return self._truthy(self._eval(self.ast, record))
+
+    @staticmethod
+    def _truthy(value):
+        return value not in (None, '', 0, False, [])
+
+    def _eval(self, node, record):
+        kind = node[0]
+        if kind == 'literal':
+            return node[1]
+        if kind == 'field':
+            return record['fields'].get(node[1])
+        if kind == 'compare':
+            return self._compare(node[1], self._eval(node[2], record), self._eval(node[3], record))
+        name, args = node[1], node[2]
+        if name == 'AND':
+            return all(self._truthy(self._eval(arg, record)) for arg in args)
+        if name == 'OR':
+            return any(self._truthy(self._eval(arg, record)) for arg in args)
+        if name == 'NOT':
+            return not self._truthy(self._eval(args[0], record))
+        if name == 'RECORD_ID':
+            return record['id']
+        if name == 'TRUE':
+            return True
+        if name == 'FALSE':
+            return False
+        if name == 'CREATED_TIME':
+            return record['createdTime']
+        if name == 'LAST_MODIFIED_TIME':
+            return store.last_modified(record)
+        if name in ('IS_BEFORE', 'IS_AFTER'):
+            left, right = (_parse_time(self._eval(arg, record)) for arg in args)
+            if left is None or right is None:
+                return None
+            return left < right if name == 'IS_BEFORE' else left > right
+        return None
+
+    @staticmethod
+    def _compare(op, left, right):
+        # Airtable treats empty cells as BLANK(), which compares equal to ''
+        left = '' if left is None else left
+        right = '' if right is None else right
+        if isinstance(left, bool) or isinstance(right, bool):
+            left, right = str(left).lower(), str(right).lower()
+        try:
+            left_num, right_num = float(left), float(right)
+            left, right = left_num, right_num
+        except (TypeError, ValueError):
+            left, right = str(left), str(right)
+        if op == '=':
+            return left == right
+        if op == '!=':
+            return left != right
+        if op == '>':
+            return left > right
+        if op == '<':
+            return left < right
+        if op == '>=':
+            return left >= right
+        return left <= right
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class FakeAirtable:
+    """In-memory record store keyed by base and table name"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tables = {}
+        # Record ID -> last modification time, reported by LAST_MODIFIED_TIME()
+        self.modified = {}
+        # Called with (base_id, table_name, kind, record_id) after each change
+        self.listeners = []
+
+    def _changed(self, base_id, table_name, kind, record_id):
+        for listener in self.listeners:
+            listener(base_id, table_name, kind, record_id)
+
+    def last_modified(self, record):
+        return self.modified.get(record['id'], record['createdTime'])
+
+    def table(self, base_id, table_name):
+        return self.tables.setdefault((base_id, table_name), {})
+
+    @staticmethod
+    def new_record_id():
+        return 'rec' + ''.join(random.choices(string.ascii_letters + string.digits, k=14))
+
+    def create(self, base_id, table_name, fields):
+        record = {'id': self.new_record_id(), 'createdTime': now_iso(), 'fields': dict(fields)}
+        with self.lock:
+            self.table(base_id, table_name)[record['id']] = record
+        self._changed(base_id, table_name, 'created', record['id'])
+        return record
+
+    def get(self, base_id, table_name, record_id):
+        with self.lock:
+            return self.table(base_id, table_name).get(record_id)
+
+    def update(self, base_id, table_name, record_id, fields, replace=False):
+        with self.lock:
+            record = self.table(base_id, table_name).get(record_id)
+            if record is None:
+                return None
+            if replace:
+                record['fields'] = {}
+            record['fields'].update(fields)
+            record['fields'] = {k: v for k, v in record['fields'].items() if v not in (None, '')}
+            self.modified[record_id] = now_iso()
+        self._changed(base_id, table_name, 'changed', record_id)
+        return record
+
+    def delete(self, base_id, table_name, record_id):
+        with self.lock:
+            self.modified.pop(record_id, None)
+            deleted = self.table(base_id, table_name).pop(record_id, None) is not None
+        if deleted:
+            self._changed(base_id, table_name, 'destroyed', record_id)
+        return deleted
+
+    def select(self, base_id, table_name, formula=None, sort=None):
+        with self.lock:
+            records = list(self.table(base_id, table_name).values())
+        if formula:
+            records = [r for r in records if formula.matches(r)]
+        for field, direction in reversed(sort or []):
+            records.sort(key=lambda r: _sort_key(r['fields'].get(field)), reverse=(direction == 'desc'))
+        return records
+
+    def reset(self):
+        with self.lock:
+            self.tables = {}
+            self.modified = {}
+
+
+def _sort_key(value):
+    if value is None:
+        return (0, '')
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value))
+
+
+store = FakeAirtable()
+
+
+class RateLimiter:
+    """Sliding one-second window per base, mirroring Airtable's 5 req/s limit"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.windows = {}
+
+    def allow(self, key, limit):
+        if not limit:
+            return True
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.setdefault(key, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= limit:
+                return False
+            window.append(now)
+            return True
+
+
+rate_limiter = RateLimiter()
+
+stats = {'requests': 0, 'rate_limited': 0, 'injected_errors': 0}
+stats_lock = threading.Lock()
+
+
+def _count(key):
+    with stats_lock:
+        stats[key] += 1
+
+
+@app.before_request
+def simulate_network():
+    """Apply injected latency, random failures and Airtable rate limiting"""
+    if request.path.startswith('/_fake/'):
+        return None
+
+    _count('requests')
+
+    delay_ms = config['latency_ms']
+    if config['jitter_ms']:
+        delay_ms += _random() * config['jitter_ms']
+    if delay_ms:
+        time.sleep(delay_ms / 1000.0)
+
+    if config['error_rate'] and _random() < config['error_rate']:
+        _count('injected_errors')
+        return airtable_error(503, 'SERVICE_UNAVAILABLE', 'Injected failure from fake upstream')
+
+    if request.path.startswith('/v0/'):
+        if not request.headers.get('Authorization', '').startswith('Bearer '):
+            return airtable_error(401, 'AUTHENTICATION_REQUIRED', 'Authentication required')
+        segments = request.path.split('/')
+        # /v0/<base>/..., /v0/bases/<base>/webhooks... and /v0/meta/bases/<base>/tables
+        base_id = segments[{'bases': 3, 'meta': 4}.get(segments[2], 2)] if len(segments) > 4 else segments[2]
+        if not rate_limiter.allow(base_id, config['rate_limit']):
+            _count('rate_limited')
+            return jsonify({'errors': [{'error': 'RATE_LIMIT_REACHED',
+                                        'message': 'Rate limit exceeded. Please try again later'}]}), 429
+    return None
+
+
+def _parse_sort(args):
+    sort = []
+    index = 0
+    while f'sort[{index}][field]' in args:
+        sort.append((args[f'sort[{index}][field]'], args.get(f'sort[{index}][direction]', 'asc')))
+        index += 1
+    return sort
+
+
+def _project(record, fields):
+    if not fields:
+        return record
+    return {**record, 'fields': {k: v for k, v in record['fields'].items() if k in fields}}
+
+
+@app.route('/v0/<base_id>/<table_name>', methods=['GET'])
+def list_records(base_id, table_name):
+    """List records with filterByFormula, sort, maxRecords and offset pagination"""
+    formula = None
+    if request.args.get('filterByFormula'):
+        try:
+            formula = Formula(request.args['filterByFormula'])
+        except FormulaError as e:
+            return airtable_error(422, 'INVALID_FILTER_BY_FORMULA', f"The formula for filtering records is invalid: {e}")
+
+    records = store.select(base_id, table_name, formula, _parse_sort(request.args))
+
+    if request.args.get('maxRecords'):
+        records = records[:int(request.args['maxRecords'])]
+
+    page_size = min(int(request.args.get('pageSize', MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+    start = 0
+    if request.args.get('offset'):
+        try:
+            start = int(request.args['offset'].split('/')[0].lstrip('itr'))
+        except ValueError:
+            return airtable_error(422, 'LIST_RECORDS_ITERATOR_NOT_AVAILABLE', 'Invalid offset')
+
+    fields = request.args.getlist('fields[]')
+    page = [_project(r, fields) for r in records[start:start + page_size]]
+    body = {'records': page}
+    if start + page_size < len(records):
+        body['offset'] = f"itr{start + page_size}/{page[-1]['id']}"
+    return jsonify(body)
+
+
+@app.route('/v0/<base_id>/<table_name>/<record_id>', methods=['GET'])
+def get_record(base_id, table_name, record_id):
+    record = store.get(base_id, table_name, record_id)
+    if record is None:
+        return airtable_error(404, 'MODEL_ID_NOT_FOUND', 'Could not find a record with that ID')
+    return jsonify(record)
+
+
+@app.route('/v0/<base_id>/<table_name>', methods=['POST'])
+def create_records(base_id, table_name):
+    """Create a single record ({"fields": ...}) or a batch ({"records": [...]})"""
+    body = request.get_json(silent=True) or {}
+    if 'records' in body:
+        if len(body['records']) > MAX_BATCH_SIZE:
+            return airtable_error(422, 'INVALID_RECORDS', f"You can create up to {MAX_BATCH_SIZE} records per request")
+        created = [store.create(base_id, table_name, r.get('fields', {})) for r in body['records']]
+        return jsonify({'records': created})
+    return jsonify(store.create(base_id, table_name, body.get('fields', {})))
+
+
+@app.route('/v0/<base_id>/<table_name>/<record_id>', methods=['PATCH', 'PUT'])
+def update_record(base_id, table_name, record_id):
+    body = request.get_json(silent=True) or {}
+    record = store.update(base_id, table_name, record_id, body.get('fields', {}), replace=request.method == 'PUT')
+    if record is None:
+        return airtable_error(404, 'MODEL_ID_NOT_FOUND', 'Could not find a record with that ID')
+    return jsonify(record)
+
+
+@app.route('/v0/<base_id>/<table_name>', methods=['PATCH', 'PUT'])
+def update_records(base_id, table_name):
+    """Batch update up to 10 records, or upsert them when performUpsert is given"""
+    body = request.get_json(silent=True) or {}
+    records = body.get('records', [])
+    if len(records) > MAX_BATCH_SIZE:
+        return airtable_error(422, 'INVALID_RECORDS', f"You can update up to {MAX_BATCH_SIZE} records per request")
+    merge_on = (body.get('performUpsert') or {}).get('fieldsToMergeOn')
+    if merge_on:
+        return upsert_records(base_id, table_name, records, merge_on, replace=request.method == 'PUT')
+    updated = []
+    for item in records:
+        record = store.update(base_id, table_name, item.get('id'), item.get('fields', {}),
+                              replace=request.method == 'PUT')
+        if record is None:
+            return airtable_error(404, 'MODEL_ID_NOT_FOUND', f"Could not find a record with ID {item.get('id')}")
+        updated.append(record)
+    return jsonify({'records': updated})
+
+
+def upsert_records(base_id, table_name, records, merge_on, replace=False):
+    created_ids, updated_ids, results = [], [], []
+    for item in records:
+        fields = item.get('fields', {})
+        if any(fields.get(field) in (None, '') for field in merge_on):
+            return airtable_error(422, 'INVALID_VALUE_FOR_COLUMN', 'Every record must have a value for each fieldsToMergeOn field')
+        matches = [r for r in store.select(base_id, table_name)
+                   if all(r['fields'].get(field) == fields[field] for field in merge_on)]
+        if len(matches) > 1:
+            return airtable_error(422, 'INVALID_VALUE_FOR_COLUMN', 'More than one record matches the fieldsToMergeOn values')
+        if matches:
+            record = store.update(base_id, table_name, matches[0]['id'], fields, replace=replace)
+            updated_ids.append(record['id'])
+        else:
+            record = store.create(base_id, table_name, fields)
+            created_ids.append(record['id'])
+        results.append(record)
+    return jsonify({'records': results, 'createdRecords': created_ids, 'updatedRecords': updated_ids})
+
+
+@app.route('/v0/<base_id>/<table_name>/<record_id>', methods=['DELETE'])
+def delete_record(base_id, table_name, record_id):
+    if not store.delete(base_id, table_name, record_id):
+        return airtable_error(404, 'MODEL_ID_NOT_FOUND', 'Could not find a record with that ID')
+    return jsonify({'id': record_id, 'deleted': True})
+
+
+@app.route('/v0/<base_id>/<table_name>', methods=['DELETE'])
+def delete_records(base_id, table_name):
+    """Batch delete up to 10 records passed as records[]=..."""
+    record_ids = request.args.getlist('records[]') or request.args.getlist('records')
+    if len(record_ids) > MAX_BATCH_SIZE:
+        return airtable_error(422, 'INVALID_RECORDS', f"You can delete up to {MAX_BATCH_SIZE} records per request")
+    deleted = [{'id': record_id, 'deleted': store.delete(base_id, table_name, record_id)} for record_id in record_ids]
+    return jsonify({'records': deleted})
+
+
+def table_id(table_name):
+    """Stable stand-in for the tbl... ID Airtable gives each table"""
+    return 'tbl' + hashlib.sha1(table_name.encode()).hexdigest()[:14]
+
+
+class FakeWebhooks:
+    """Registered webhooks with their payload lists, pinging each notification URL after changes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hooks = {}
+        self.transactions = 0
+
+    def create(self, base_id, notification_url, specification):
+        hook = {
+            'id': 'ach' + ''.join(random.choices(string.ascii_letters + string.digits, k=14)),
+            'base_id': base_id,
+            'notification_url': notification_url,
+            'specification': specification,
+            'mac_secret': os.urandom(32),
+            'expires_at': time.time() + config['webhook_ttl'],
+            'payloads': [],
+            'ping_pending': False,
+        }
+        with self.lock:
+            self.hooks[hook['id']] = hook
+        return hook
+
+    def get(self, base_id, webhook_id):
+        """The webhook if it exists on this base and hasn't expired (expired ones are dropped)"""
+        with self.lock:
+            hook = self.hooks.get(webhook_id)
+            if hook and hook['expires_at'] <= time.time():
+                del self.hooks[webhook_id]
+                hook = None
+            return hook if hook and hook['base_id'] == base_id else None
+
+    def delete(self, base_id, webhook_id):
+        with self.lock:
+            return self.hooks.pop(webhook_id, None) is not None
+
+    def listed(self, base_id):
+        with self.lock:
+            return [hook for hook in self.hooks.values() if hook['base_id'] == base_id]
+
+    def record_change(self, base_id, table_name, kind, record_id):
+        """Append a payload for one record change to every live webhook on the base"""
+        # Writes sent with X-Fake-Source: client stand in for edits made in the Airtable UI
+        source = request.headers.get('X-Fake-Source', 'publicApi') if has_request_context() else 'publicApi'
+        if kind == 'created':
+            change = {'createdRecordsById': {record_id: {'createdTime': now_iso(), 'cellValuesByFieldId': {}}}}
+        elif kind == 'changed':
+            change = {'changedRecordsById': {record_id: {'current': {'cellValuesByFieldId': {}}}}}
+        else:
+            change = {'destroyedRecordIds': [record_id]}
+        now = time.time()
+        with self.lock:
+            self.transactions += 1
+            payload = {
+                'timestamp': now_iso(),
+                'baseTransactionNumber': self.transactions,
+                'payloadFormat': 'v0',
+                'actionMetadata': {'source': source, 'sourceMetadata': {}},
+                'changedTablesById': {table_id(table_name): change},
+            }
+            hooks = [hook for hook in self.hooks.values() if hook['base_id'] == base_id and hook['expires_at'] > now]
+            for hook in hooks:
+                hook['payloads'].append(payload)
+                if not hook['ping_pending']:
+                    # Changes in quick succession share one ping
+                    hook['ping_pending'] = True
+                    threading.Timer(0.1, self._ping, args=(hook,)).start()
+
+    def _ping(self, hook):
+        with self.lock:
+            hook['ping_pending'] = False
+        body = json.dumps({'base': {'id': hook['base_id']}, 'webhook': {'id': hook['id']}, 'timestamp': now_iso()}).encode()
+        mac = hmac.new(hook['mac_secret'], body, hashlib.sha256).hexdigest()
+        try:
+            requests.post(hook['notification_url'], data=body, timeout=5,
+                          headers={'Content-Type': 'application/json', 'X-Airtable-Content-MAC': f'hmac-sha256={mac}'})
+        except requests.RequestException:
+            pass
+
+    def reset(self):
+        with self.lock:
+            self.hooks = {}
+
+
+webhooks = FakeWebhooks()
+store.listeners.append(webhooks.record_change)
+
+
+def _webhook_json(hook):
+    return {
+        'id': hook['id'],
+        'notificationUrl': hook['notification_url'],
+        'specification': hook['specification'],
+        'expirationTime': datetime.fromtimestamp(hook['expires_at'], timezone.utc).isoformat().replace('+00:00', 'Z'),
+        'cursorForNextPayload': len(hook['payloads']) + 1,
+        'isHookEnabled': True,
+    }
+
+
+@app.route('/v0/bases/<base_id>/webhooks', methods=['POST'])
+def create_webhook(base_id):
+    body = request.get_json(silent=True) or {}
+    if not body.get('notificationUrl'):
+        return airtable_error(422, 'INVALID_REQUEST', 'notificationUrl is required')
+    hook = webhooks.create(base_id, body['notificationUrl'], body.get('specification', {}))
+    data = _webhook_json(hook)
+    return jsonify({'id': hook['id'], 'macSecretBase64': base64.b64encode(hook['mac_secret']).decode(),
+                    'expirationTime': data['expirationTime']})
+
+
+@app.route('/v0/bases/<base_id>/webhooks', methods=['GET'])
+def list_webhooks(base_id):
+    return jsonify({'webhooks': [_webhook_json(hook) for hook in webhooks.listed(base_id)]})
+
+
+@app.route('/v0/bases/<base_id>/webhooks/<webhook_id>', methods=['DELETE'])
+def delete_webhook(base_id, webhook_id):
+    if not webhooks.delete(base_id, webhook_id):
+        return airtable_error(404, 'NOT_FOUND', 'Could not find a webhook with that ID')
+    return jsonify({})
+
+
+@app.route('/v0/bases/<base_id>/webhooks/<webhook_id>/refresh', methods=['POST'])
+def refresh_webhook(base_id, webhook_id):
+    hook = webhooks.get(base_id, webhook_id)
+    if hook is None:
+        return airtable_error(404, 'NOT_FOUND', 'Could not find a webhook with that ID')
+    hook['expires_at'] = time.time() + config['webhook_ttl']
+    return jsonify({'expirationTime': _webhook_json(hook)['expirationTime']})
+
+
+@app.route('/v0/bases/<base_id>/webhooks/<webhook_id>/payloads', methods=['GET'])
+def list_webhook_payloads(base_id, webhook_id):
+    """Payloads from `cursor` on (the first one is 1), at most `limit` (50) per call"""
+    hook = webhooks.get(base_id, webhook_id)
+    if hook is None:
+        return airtable_error(404, 'NOT_FOUND', 'Could not find a webhook with that ID')
+    cursor = max(int(request.args.get('cursor', 1)), 1)
+    limit = min(int(request.args.get('limit', 50)), 50)
+    with webhooks.lock:
+        payloads = hook['payloads'][cursor - 1:cursor - 1 + limit]
+        more = cursor - 1 + limit < len(hook['payloads'])
+    return jsonify({'cursor': cursor + len(payloads), 'mightHaveMore': more, 'payloads': payloads})
+
+
+@app.route('/v0/meta/bases/<base_id>/tables', methods=['GET'])
+def list_tables(base_id):
+    with store.lock:
+        names = [name for (base, name) in store.tables if base == base_id]
+    return jsonify({'tables': [{'id': table_id(name), 'name': name, 'fields': []} for name in names]})
+
+
+cdn_files = {}
+
+
+@app.route('/api/v3/new', methods=['POST'])
+def cdn_new():
+    """Hack Club CDN v3: accepts a JSON list of source URLs"""
+    if not request.headers.get('Authorization', '').startswith('Bearer '):
+        return jsonify({'error': 'Unauthorized'}), 401
+    urls = request.get_json(silent=True)
+    if not isinstance(urls, list) or not urls:
+        return jsonify({'error': 'Expected a list of URLs'}), 400
+
+    files = []
+    for source_url in urls:
+        file_id = uuid.uuid4().hex
+        filename = os.path.basename(source_url.rstrip('/')) or 'file'
+        content = b''
+        if config['cdn_fetch']:
+            try:
+                source = requests.get(source_url, timeout=10, verify=False)
+                if source.status_code != 200:
+                    return jsonify({'error': f"Could not fetch {source_url}"}), 400
+                content = source.content
+            except requests.RequestException as e:
+                return jsonify({'error': f"Could not fetch {source_url}: {e}"}), 400
+        cdn_files[file_id] = content
+        files.append({
+            'deployedUrl': f"{request.url_root}cdn/{file_id}/{filename}",
+            'file': f"{file_id}_{filename}",
+            'sha': file_id,
+            'size': len(content),
+        })
+    return jsonify({'files': files, 'cdnBase': f"{request.url_root}cdn"})
+
+
+@app.route('/cdn/<file_id>/<filename>')
+def cdn_file(file_id, filename):
+    if file_id not in cdn_files:
+        abort(404)
+    return Response(cdn_files[file_id], mimetype='application/octet-stream')
+
+
+tmp_files = {}
+
+
+@app.route('/api/v1/upload', methods=['POST'])
+def tmpfiles_upload():
+    """tmpfiles.org upload: multipart 'file' field"""
+    upload = request.files.get('file')
+    if upload is None:
+        return jsonify({'status': 'error', 'message': 'No file'}), 400
+    file_id = len(tmp_files) + 1
+    tmp_files[file_id] = upload.read()
+    return jsonify({'status': 'success', 'data': {'url': f"{request.url_root}{file_id}/{upload.filename}"}})
+
+
+@app.route('/dl/<int:file_id>/<filename>')
+def tmpfiles_download(file_id, filename):
+    if file_id not in tmp_files:
+        abort(404)
+    return Response(tmp_files[file_id], mimetype='application/octet-stream')
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ('true', '1', 'yes', 'on'):
+        return True
+    if isinstance(value, str) and value.strip().lower() in ('false', '0', 'no', 'off'):
+        return False
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError("must be true or false")
+
+
+def _parse_number(cast, minimum=0, maximum=None):
+    def parse(value):
+        if isinstance(value, bool):
+            raise ValueError("must be a number")
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError("must be a finite number")
+        if cast is int:
+            if not number.is_integer():
+                raise ValueError("must be a whole number")
+            number = int(number)
+        if number < minimum or (maximum is not None and number > maximum):
+            raise ValueError(f"must be between {minimum} and {maximum}" if maximum is not None
+                             else f"must be {minimum} or more")
+        return number
+    return parse
+
+
+# Parser per setting accepted by /_fake/config (values may arrive as JSON numbers or strings)
+CONFIG_PARSERS = {
+    'latency_ms': _parse_number(float),
+    'jitter_ms': _parse_number(float),
+    'error_rate': _parse_number(float, 0, 1),
+    'rate_limit': _parse_number(int),
+    'cdn_fetch': _parse_bool,
+    'webhook_ttl': _parse_number(float, 1),
+}
+
+
+@app.route('/_fake/config', methods=['GET', 'POST'])
+def fake_config():
+    """Inspect or change injected latency/error settings at runtime"""
+    if request.method == 'POST':
+        updates = request.get_json(silent=True)
+        if not isinstance(updates, dict):
+            return jsonify({'error': 'Send a JSON object of settings'}), 400
+        parsed = {}
+        for key, value in updates.items():
+            if key not in CONFIG_PARSERS:
+                return jsonify({'error': f"Unknown setting {key!r}"}), 400
+            try:
+                parsed[key] = CONFIG_PARSERS[key](value)
+            except (TypeError, ValueError) as e:
+                return jsonify({'error': f"Invalid value for {key}: {e}"}), 400
+        config.update(parsed)
+    with stats_lock:
+        return jsonify({'config': config, 'stats': dict(stats)})
+
+
+@app.route('/_fake/reset', methods=['POST'])
+def fake_reset():
+    """Drop all records and uploaded files"""
+    store.reset()
+    webhooks.reset()
+    cdn_files.clear()
+    tmp_files.clear()
+    with stats_lock:
+        for key in stats:
+            stats[key] = 0
+    return jsonify({'success': True})
+
+
+def load_seed_file(path, base_id):
+    """Load {"<table>": [{<fields>}, ...]} into the store"""
+    with open(path) as f:
+        data = json.load(f)
+    for table_name, rows in data.items():
+        for fields in rows:
+            store.create(base_id, table_name, fields)
+
+
+def generate_dataset(base_id, users, projects_per_user, logs_per_project, seed):
+    """Create a deterministic synthetic dataset shaped like production data"""
+    gen = random.Random(seed)
+    users_table = os.environ.get('AIRTABLE_USERS_TABLE', 'Users')
+    projects_table = os.environ.get('AIRTABLE_PROJECTS_TABLE', 'Projects')
+    logs_table = os.environ.get('AIRTABLE_TABLE_NAME', 'Logs')
+    statuses = ['Pending', 'Approved', 'Rejected', 'In Review']
+
+    for u in range(users):
+        user_id = f"U{u:08d}"
+        user_name = f"Test User {u}"
+        store.create(base_id, users_table, {
+            'User ID': user_id,
+            'User Name': user_name,
+            'Email': f"user{u}@example.com",
+            'Is Admin': 'true' if u == 0 else 'false',
+            'Created At': f"2025-01-{(u % 28) + 1:02d}T10:00:00",
+        })
+        for p in range(projects_per_user):
+            project_name = f"Project {u}-{p}"
+            store.create(base_id, projects_table, {
+                'User ID': user_id,
+                'User Name': user_name,
+                'Project Name': project_name,
+                'Description': f"Synthetic project {p} for user {u}",
+                'Github Link': f"https://github.com/example/project-{u}-{p}",
+                'Cover Image URL': '/default_cover.png',
+                'Created At': f"2025-02-{(p % 28) + 1:02d}T09:00:00",
+            })
+            for l in range(logs_per_project):
+                store.create(base_id, logs_table, {
+                    'User ID': user_id,
+                    'User Name': user_name,
+                    'Project Name': project_name,
+                    'Title': f"Log {l}",
+                    'What I Did': ' '.join(gen.choice(['built', 'fixed', 'wired', 'tested', 'soldered', 'designed'])
+                                           for _ in range(20)),
+                    'Issues Faced': 'none' if l % 3 else 'flaky parts',
+                    'Next Steps': 'keep going',
+                    'Time Spent (minutes)': gen.randint(15, 240),
+                    'Created At': f"2025-03-{(l % 28) + 1:02d}T{gen.randint(8, 22):02d}:00:00",
+                    'Status': gen.choice(statuses),
+                })
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run a local Airtable/CDN/tmpfiles stand-in')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Latency added to every request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Extra random latency (0..jitter) per request')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing with 503')
+    parser.add_argument('--rate-limit', type=int, default=5, help='Airtable requests/second per base (0 disables)')
+    parser.add_argument('--cdn-fetch', action='store_true', help='Have the fake CDN download the submitted URLs')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for latency, errors and generated data')
+    parser.add_argument('--base-id', default=os.environ.get('AIRTABLE_BASE_ID', 'appFakeBase'))
+    parser.add_argument('--seed-file', help='JSON file of {"<table>": [{fields}, ...]} to preload')
+    parser.add_argument('--users', type=int, default=0, help='Generate this many synthetic users')
+    parser.add_argument('--projects-per-user', type=int, default=3)
+    parser.add_argument('--logs-per-project', type=int, default=20)
+    args = parser.parse_args()
+
+    config.update({
+        'latency_ms': args.latency_ms,
+        'jitter_ms': args.jitter_ms,
+        'error_rate': args.error_rate,
+        'rate_limit': args.rate_limit,
+        'cdn_fetch': args.cdn_fetch,
+    })
+    _rng.seed(args.seed)
+    random.seed(args.seed)
+
+    if args.seed_file:
+        load_seed_file(args.seed_file, args.base_id)
+    if args.users:
+        generate_dataset(args.base_id, args.users, args.projects_per_user, args.logs_per_project, args.seed)
+
+    print(f"Fake upstream listening on http://{args.host}:{args.port}")
+    print(f"  AIRTABLE_API_URL=http://{args.host}:{args.port}/v0")
+    print(f"  HACKCLUB_CDN_URL=http://{args.host}:{args.port}")
+    print(f"  TMPFILES_URL=http://{args.host}:{args.port}")
+    app.run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,12 @@
+"""
+Gunicorn settings for the Docker image (`gunicorn -c gunicorn.conf.py main:app`).
+
+Background threads (aggregates reconciliation, batch writer, Airtable change checks) are
+started per worker once it has loaded the app, rather than when `main` is imported, so
+scripts that import it don't run them.
+"""
+
+
+def post_worker_init(worker):
+    import main
+    main.init_background()
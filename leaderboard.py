@@ -0,0 +1,159 @@
+"""
+Top-K rankings of users and projects by minutes logged and by log count.
+
+Each worker keeps the rankings in memory: per window (all time and the rolling
+windows in `WINDOWS`) a score per user and per (user, project), plus the top
+`depth` entries of each ranking kept sorted, so a read is a slice of a list.
+
+The rankings are built from the `log_facts` rows of the log aggregates. Log writes in
+this worker are applied incrementally (`update()`), which only touches the changed
+user's and project's entries. The aggregates bump a shared version on every change,
+so when another worker (or a reconciliation) has changed the facts, or the rolling
+windows have moved on by more than `refresh_interval` seconds, the next read rebuilds
+everything from the facts.
+"""
+import bisect
+import heapq
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Rolling windows, in days (None = all time)
+WINDOWS = {'all': None, '7d': 7, '30d': 30}
+
+KINDS = ('users', 'projects')
+
+METRICS = ('minutes', 'logs')
+
+
+class Ranking:
+    """Scores for one window and kind, with the top `depth` of each metric kept sorted"""
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.scores = {}
+        self.top = {metric: [] for metric in METRICS}
+        self.members = {metric: set() for metric in METRICS}
+
+    def add(self, key, minutes, logs):
+        entry = self.scores.setdefault(key, [0, 0])
+        entry[0] += minutes
+        entry[1] += logs
+        if entry[1] <= 0:
+            del self.scores[key]
+
+    def score(self, key, metric):
+        entry = self.scores.get(key)
+        return entry[METRICS.index(metric)] if entry else None
+
+    def rebuild(self, metric=None):
+        """Select the top list(s) from all scores, O(n log depth)"""
+        for metric in (metric,) if metric else METRICS:
+            i = METRICS.index(metric)
+            self.top[metric] = heapq.nsmallest(self.depth, ((-entry[i], key) for key, entry in self.scores.items()))
+            self.members[metric] = {key for _, key in self.top[metric]}
+
+    def reposition(self, key):
+        """Move `key` to its place in each top list after its scores changed"""
+        for metric in METRICS:
+            top, members = self.top[metric], self.members[metric]
+            # Everything outside a full top list ranks below its last entry
+            bound = top[-1] if len(top) == self.depth else None
+            if key in members:
+                top.pop(next(i for i, (_, k) in enumerate(top) if k == key))
+                members.discard(key)
+            score = self.score(key, metric)
+            if score is not None:
+                item = (-score, key)
+                if bound is None or item <= bound:
+                    bisect.insort(top, item)
+                    members.add(key)
+                    if len(top) > self.depth:
+                        members.discard(top.pop()[1])
+            if len(top) < min(self.depth, len(self.scores)):
+                # Something dropped out of the top list and the next entry isn't known
+                self.rebuild(metric)
+
+    def leaders(self, metric, k):
+        return [(key, -score) for score, key in self.top[metric][:k]]
+
+
+class Leaderboard:
+    def __init__(self, depth=100, refresh_interval=300):
+        self.depth = depth
+        self.refresh_interval = refresh_interval
+        self.version = None
+        self.built_at = 0.0
+        self.cutoffs = {}
+        self.rankings = {}
+        self._lock = threading.Lock()
+
+    def rebuild(self, version, facts, now=None):
+        """Recompute every ranking from (user_id, project_name, minutes, status, created_at) facts"""
+        now = now or time.time()
+        cutoffs = {window: _cutoff(now, days) for window, days in WINDOWS.items()}
+        rankings = {(window, kind): Ranking(self.depth) for window in WINDOWS for kind in KINDS}
+        for fact in facts:
+            self._add(rankings, cutoffs, fact, 1)
+        for ranking in rankings.values():
+            ranking.rebuild()
+        with self._lock:
+            self.version, self.built_at, self.cutoffs, self.rankings = version, now, cutoffs, rankings
+
+    def update(self, old_fact, new_fact, version):
+        """
+        Apply one log change (either fact may be None) that moved the facts to `version`.
+        Changes that don't follow on from the version held here are left to the next rebuild.
+        """
+        with self._lock:
+            if self.version is None or version != self.version + 1:
+                self.version = None
+                return
+            touched = set()
+            if old_fact is not None:
+                touched |= self._add(self.rankings, self.cutoffs, old_fact, -1)
+            if new_fact is not None:
+                touched |= self._add(self.rankings, self.cutoffs, new_fact, 1)
+            for ranking_key, key in touched:
+                self.rankings[ranking_key].reposition(key)
+            self.version = version
+
+    @staticmethod
+    def _add(rankings, cutoffs, fact, sign):
+        user_id, project_name, minutes, _, created_at = fact
+        touched = set()
+        for window, cutoff in cutoffs.items():
+            if cutoff is not None and (created_at or '')[:19] < cutoff:
+                continue
+            rankings[(window, 'users')].add(user_id, sign * minutes, sign)
+            touched.add(((window, 'users'), user_id))
+            if project_name:
+                rankings[(window, 'projects')].add((user_id, project_name), sign * minutes, sign)
+                touched.add(((window, 'projects'), (user_id, project_name)))
+        return touched
+
+    def is_current(self, version, now=None):
+        return self.version == version and (now or time.time()) - self.built_at < self.refresh_interval
+
+    def top(self, window, kind, metric, k):
+        """The top `k` (at most `depth`) entries of a ranking as dicts, highest first"""
+        with self._lock:
+            ranking = self.rankings[(window, kind)]
+            leaders = ranking.leaders(metric, k)
+            entries = []
+            for rank, (key, _) in enumerate(leaders, 1):
+                minutes, logs = ranking.scores[key]
+                entry = {'rank': rank, 'minutes': minutes, 'logs': logs}
+                if kind == 'users':
+                    entry['user_id'] = key
+                else:
+                    entry['user_id'], entry['project_name'] = key
+                entries.append(entry)
+            return entries
+
+
+def _cutoff(now, days):
+    """Earliest Created At (local time, as compared against the stored ISO strings) inside a window"""
+    if days is None:
+        return None
+    return (datetime.fromtimestamp(now) - timedelta(days=days)).isoformat(timespec='seconds')
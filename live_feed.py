@@ -0,0 +1,194 @@
+"""
+Live log activity for the admin dashboard, sent as Server-Sent Events.
+
+Events (a log was created, a log's status changed) are appended to a table in the shared
+local store when the app records the change, whichever worker made it and including
+changes Airtable reports. Each worker runs one thread that reads new events every
+`poll_interval` seconds and hands them to that worker's connected dashboards, so any
+number of open dashboards cost one local query per interval and no Airtable calls.
+
+Event IDs are the table's sequence numbers. A reconnecting EventSource sends the last
+one it received as Last-Event-ID and is sent what it missed, as long as that is within
+`retention` seconds. A client that stops reading and lets its queue fill up is
+disconnected, and catches up the same way when it reconnects. Streams also end after
+`max_age` seconds, so that access is checked again when the browser reconnects.
+
+Every open stream holds one of the worker's threads, so each worker takes at most
+`max_subscribers` of them; `subscribe()` returns None beyond that. The newest
+`recent_count` created logs are kept past `retention`, so a dashboard can start from
+`recent_logs()` instead of listing Airtable.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS live_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS live_events_created_at ON live_events (created_at);
+""")
+
+LOG_CREATED = 'log_created'
+LOG_STATUS = 'log_status'
+
+# Most events replayed to a reconnecting client
+REPLAY_LIMIT = 500
+
+# Seconds a client turned away by a full worker should wait before trying again
+FULL_RETRY_AFTER = 30
+
+
+class _Subscriber:
+    def __init__(self, size):
+        self.queue = queue.Queue(maxsize=size)
+        self.dropped = False
+
+
+class LiveFeed:
+    def __init__(self, retention=3600, poll_interval=1.0, heartbeat=15.0, queue_size=200, max_age=300,
+                 max_subscribers=8, recent_count=10):
+        self.retention = retention
+        self.max_age = max_age
+        self.max_subscribers = max_subscribers
+        self.recent_count = recent_count
+        self.poll_interval = poll_interval
+        self.heartbeat = heartbeat
+        self.queue_size = queue_size
+        self.last_prune = 0.0
+        self._subscribers = set()
+        self._position = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def publish(self, kind, data):
+        now = time.time()
+        conn = local_store.connect()
+        conn.execute('INSERT INTO live_events (kind, data, created_at) VALUES (?, ?, ?)',
+                     (kind, json.dumps(data), now))
+        if now - self.last_prune >= min(self.retention, 300):
+            self.last_prune = now
+            conn.execute(
+                'DELETE FROM live_events WHERE created_at < ? AND seq < (SELECT COALESCE(MIN(seq), 9e18) FROM '
+                '(SELECT seq FROM live_events WHERE kind = ? ORDER BY seq DESC LIMIT ?))',
+                (now - self.retention, LOG_CREATED, self.recent_count))
+
+    def latest_seq(self):
+        return local_store.connect().execute('SELECT COALESCE(MAX(seq), 0) FROM live_events').fetchone()[0]
+
+    def events_since(self, seq, limit=REPLAY_LIMIT):
+        """Retained events after `seq` as (seq, kind, data JSON), oldest first"""
+        return [tuple(row) for row in local_store.connect().execute(
+            'SELECT seq, kind, data FROM live_events WHERE seq > ? AND created_at >= ? ORDER BY seq LIMIT ?',
+            (seq, time.time() - self.retention, limit))]
+
+    def recent_logs(self):
+        """
+        The newest `recent_count` created logs, newest first and with their current status,
+        and the event ID they are up to date with (for the stream's `last_event_id`)
+        """
+        conn = local_store.connect()
+        seq = self.latest_seq()
+        logs = {}
+        for row in conn.execute('SELECT data FROM live_events WHERE kind = ? AND seq <= ? ORDER BY seq DESC LIMIT ?',
+                                (LOG_CREATED, seq, self.recent_count)):
+            data = json.loads(row['data'])
+            logs.setdefault(data['id'], data)
+        if logs:
+            for row in conn.execute('SELECT data FROM live_events WHERE kind = ? AND seq <= ? ORDER BY seq',
+                                    (LOG_STATUS, seq)):
+                data = json.loads(row['data'])
+                if data['id'] in logs:
+                    logs[data['id']]['status'] = data['status']
+        return list(logs.values()), seq
+
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def subscribe(self):
+        """Register a client for `stream()`; None if this worker already has `max_subscribers`"""
+        with self._lock:
+            if self.max_subscribers and len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscriber = _Subscriber(self.queue_size)
+            self._subscribers.add(subscriber)
+            if self._position is None:
+                # Everything after this point reaches the queue; what came before is replayed by stream()
+                self._position = self.latest_seq()
+            self._start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def stream(self, subscriber, last_event_id=None):
+        """SSE text for one subscribed client: missed events after `last_event_id`, then new ones as they happen"""
+        ends_at = time.monotonic() + self.max_age
+        try:
+            sent = last_event_id if last_event_id is not None else self.latest_seq()
+            yield f"retry: {int(self.poll_interval * 5000)}\n\n"
+            for event in self.events_since(sent):
+                yield _frame(*event)
+                sent = event[0]
+            while time.monotonic() < ends_at and not (subscriber.dropped and subscriber.queue.empty()):
+                try:
+                    event = subscriber.queue.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    # Keeps proxies from timing the connection out and notices closed ones
+                    yield ': keepalive\n\n'
+                    continue
+                if event[0] > sent:
+                    yield _frame(*event)
+                    sent = event[0]
+        finally:
+            self.unsubscribe(subscriber)
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='live-feed', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self._broadcast()
+            except Exception as e:
+                logger.error("Live feed failed: %s", e)
+            time.sleep(self.poll_interval)
+
+    def _broadcast(self):
+        with self._lock:
+            if not self._subscribers:
+                self._position = None
+                return
+            position = self._position
+        events = self.events_since(position, limit=1000)
+        if not events:
+            return
+        self._position = events[-1][0]
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.dropped:
+                continue
+            for event in events:
+                try:
+                    subscriber.queue.put_nowait(event)
+                except queue.Full:
+                    subscriber.dropped = True
+                    logger.warning("Disconnecting a live feed client that fell behind")
+                    break
+
+
+def _frame(seq, kind, data):
+    return f"id: {seq}\nevent: {kind}\ndata: {data}\n\n"
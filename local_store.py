@@ -0,0 +1,124 @@
+"""
+SQLite-backed storage shared by every worker process on the host.
+
+Each thread gets its own connection to LOCAL_STORE_PATH (WAL mode, so readers never
+block the writer). Features register their tables with `register_schema` and get
+them created on first connection. Expired SharedCache rows are swept on writes, at most
+once every CACHE_SWEEP_INTERVAL seconds per process.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+LOCAL_STORE_PATH = os.environ.get('LOCAL_STORE_PATH', os.path.join(tempfile.gettempdir(), 'groundplane.sqlite3'))
+
+_schemas = []
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_version = 0
+
+
+def register_schema(ddl):
+    """Add CREATE ... IF NOT EXISTS statements to run on every new connection"""
+    global _schema_version
+    with _schema_lock:
+        _schemas.append(ddl)
+        _schema_version += 1
+
+
+def connect():
+    """Per-thread connection in autocommit mode; use `with transaction():` to group writes"""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(LOCAL_STORE_PATH, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        _local.conn = conn
+        _local.schema_version = 0
+    if _local.schema_version != _schema_version:
+        with _schema_lock:
+            for ddl in _schemas:
+                conn.executescript(ddl)
+            _local.schema_version = _schema_version
+    return conn
+
+
+class transaction:
+    """Context manager wrapping a BEGIN IMMEDIATE ... COMMIT/ROLLBACK block"""
+
+    def __enter__(self):
+        self.conn = connect()
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
+
+
+register_schema("""
+CREATE TABLE IF NOT EXISTS kv_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS kv_cache_expires_at ON kv_cache (expires_at);
+""")
+
+# Seconds between each process's sweeps of expired cache rows (all namespaces)
+CACHE_SWEEP_INTERVAL = 300
+
+_last_cache_sweep = 0.0
+
+
+def sweep_expired_cache():
+    """Delete expired cache rows of every namespace; returns the number removed"""
+    global _last_cache_sweep
+    _last_cache_sweep = time.time()
+    return connect().execute('DELETE FROM kv_cache WHERE expires_at <= ?', (_last_cache_sweep,)).rowcount
+
+
+def _maybe_sweep():
+    # Keys that are never read again (e.g. ones including a date or a generation) only go this way
+    if time.time() - _last_cache_sweep >= CACHE_SWEEP_INTERVAL:
+        sweep_expired_cache()
+
+
+class SharedCache:
+    """JSON key/value cache with a TTL, visible to all workers"""
+
+    def __init__(self, namespace, ttl):
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def get(self, key):
+        row = connect().execute(
+            'SELECT value FROM kv_cache WHERE namespace = ? AND key = ? AND expires_at > ?',
+            (self.namespace, key, time.time())).fetchone()
+        return json.loads(row['value']) if row else None
+
+    def set(self, key, value, ttl=None):
+        connect().execute(
+            'INSERT OR REPLACE INTO kv_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)',
+            (self.namespace, key, json.dumps(value), time.time() + (ttl or self.ttl)))
+        _maybe_sweep()
+
+    def set_many(self, items, ttl=None):
+        expires_at = time.time() + (ttl or self.ttl)
+        with transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO kv_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)',
+                [(self.namespace, key, json.dumps(value), expires_at) for key, value in items.items()])
+        _maybe_sweep()
+
+    def delete(self, key):
+        connect().execute('DELETE FROM kv_cache WHERE namespace = ? AND key = ?', (self.namespace, key))
+
+    def clear(self):
+        connect().execute('DELETE FROM kv_cache WHERE namespace = ?', (self.namespace,))
@@ -0,0 +1,167 @@
+"""
+Non-blocking structured logging.
+
+Request threads only run cheap filters and push the LogRecord onto a bounded queue;
+a QueueListener thread does the message formatting, JSON encoding and I/O. Records
+are not pre-formatted on the request thread, so `logger.debug("x %s", obj)` costs
+nothing when DEBUG is off and only a queue put when it is on.
+
+Environment:
+    LOG_LEVEL          root level (default INFO)
+    LOG_LEVELS         per-logger overrides, e.g. "main=DEBUG,werkzeug=WARNING"
+    LOG_FORMAT         json (default) or text
+    LOG_SAMPLE_LIMIT   max records per message template per window at INFO and
+                       below before further ones are dropped (default 20, 0 = off)
+    LOG_SAMPLE_WINDOW  window length in seconds (default 60)
+    LOG_QUEUE_SIZE     records buffered before new ones are dropped (default 10000)
+"""
+from flask import has_request_context, request
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str, separators=(',', ':'))
+
+
+class RequestContextFilter(logging.Filter):
+    """Attach the current request's method and path while still on the request thread"""
+
+    def filter(self, record):
+        if has_request_context():
+            record.method = request.method
+            record.path = request.path
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most `limit` records per (logger, message template) per window.
+    Only applies at or below `max_level`, so warnings and errors are never dropped.
+    The first record after a window with drops carries a `suppressed` count.
+    """
+
+    def __init__(self, limit, window, max_level=logging.INFO):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self.max_level = max_level
+        self.lock = threading.Lock()
+        self.counters = {}
+
+    def filter(self, record):
+        if not self.limit or record.levelno > self.max_level:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self.lock:
+            counter = self.counters.get(key)
+            if counter is None or now - counter[0] >= self.window:
+                suppressed = counter[2] if counter else 0
+                self.counters[key] = [now, 1, 0]
+                if len(self.counters) > 10000:
+                    self.counters = {k: v for k, v in self.counters.items() if now - v[0] < self.window}
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if counter[1] < self.limit:
+                counter[1] += 1
+                return True
+            counter[2] += 1
+            return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks or formats on the calling thread"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The listener runs in this process, so the record can be passed as-is and
+        # formatted lazily on the listener thread.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener = None
+_queue_handler = None
+
+
+def dropped_records():
+    """Records dropped because the log queue was full"""
+    return _queue_handler.dropped if _queue_handler else 0
+
+
+def parse_levels(spec):
+    """"a=DEBUG,b.c=WARNING" -> {'a': 'DEBUG', 'b.c': 'WARNING'}"""
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging():
+    """Replace the root handlers with the queue pipeline; safe to call more than once"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if os.environ.get('LOG_FORMAT', 'json').lower() == 'text':
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    else:
+        stream_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.Queue(maxsize=int(os.environ.get('LOG_QUEUE_SIZE', '10000')))
+    queue_handler = _queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(int(os.environ.get('LOG_SAMPLE_LIMIT', '20')),
+                                            float(os.environ.get('LOG_SAMPLE_WINDOW', '60'))))
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    for name, level in parse_levels(os.environ.get('LOG_LEVELS')).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
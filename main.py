@@ -1,10 +1,31 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, send_file, after_this_request
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, send_file, after_this_request, g, Response, copy_current_request_context
 from flask_cors import CORS
 import os
-import requests
-from datetime import datetime
+import upstream
+from traffic import TrafficRecorder
+import metrics
+import server_timing
+import profiling
+from log_config import configure_logging, dropped_records
+from local_store import SharedCache
+from sessions import SqliteSessionInterface, session_count, detached_copy, merge as merge_session
+from compression import Compress
+from change_log import ChangeLog, ExpiredToken, decode_token, UPSERT, DELETE
+from aggregates import LogAggregates, FACT_FIELDS, log_fact
+from search import SearchIndex, SEARCH_FIELDS
+from batch_writer import BatchWriter, CREATE, DELETE as BATCH_DELETE
+from airtable_webhooks import ChangeWatcher, MAC_HEADER
+from live_feed import LiveFeed, LOG_CREATED, LOG_STATUS, FULL_RETRY_AFTER
+import bulk_import
+from bulk_import import LOG_STATUSES
+from leaderboard import Leaderboard, WINDOWS, KINDS, METRICS
+import analytics
+from datetime import datetime, timezone, date
+from concurrent.futures import ThreadPoolExecutor
 import time
 from werkzeug.utils import secure_filename
+from werkzeug.test import EnvironBuilder
+from werkzeug.exceptions import HTTPException
 from functools import wraps
 import logging
 import ssl
@@ -13,6 +34,9 @@ import uuid
 import threading
 import shutil
 import json
+import hashlib
+import base64
+from urllib.parse import urlparse
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -31,14 +55,173 @@ AIRTABLE_API_KEY = os.environ.get('AIRTABLE_API_KEY')
 AIRTABLE_USER_SETTINGS_TABLE = os.environ.get('AIRTABLE_USER_SETTINGS_TABLE', 'UserSettings')
 AIRTABLE_USERS_TABLE = os.environ.get('AIRTABLE_USERS_TABLE', 'Users')
 
+# Upstream base URLs; point these at fake_upstream.py for offline/perf testing
+AIRTABLE_API_URL = os.environ.get('AIRTABLE_API_URL', 'https://api.airtable.com/v0').rstrip('/')
+HACKCLUB_CDN_URL = os.environ.get('HACKCLUB_CDN_URL', 'https://cdn.hackclub.com').rstrip('/')
+TMPFILES_URL = os.environ.get('TMPFILES_URL', 'https://tmpfiles.org').rstrip('/')
+
+upstream.register_service('airtable', AIRTABLE_API_URL)
+upstream.register_service('cdn', HACKCLUB_CDN_URL)
+upstream.register_service('tmpfiles', TMPFILES_URL)
+upstream.register_service('slack', 'https://slack.com/api')
+
+# Opt-in traffic capture for replay.py, e.g. TRAFFIC_RECORD_FILE=/data/traffic-{pid}.ndjson
+TRAFFIC_RECORD_FILE = os.environ.get('TRAFFIC_RECORD_FILE')
+TRAFFIC_RECORD_SAMPLE_RATE = float(os.environ.get('TRAFFIC_RECORD_SAMPLE_RATE', '1.0'))
+TRAFFIC_RECORD_MAX_MB = int(os.environ.get('TRAFFIC_RECORD_MAX_MB', '500'))
+
+# Who gets the Server-Timing header: 'admin' (default), 'true' for everyone or 'false'; it names upstream
+# tables and timings. Requests slower than SLOW_REQUEST_MS are logged with the same breakdown either way.
+SERVER_TIMING_HEADER = os.environ.get('SERVER_TIMING_HEADER', 'admin').lower()
+SLOW_REQUEST_MS = float(os.environ['SLOW_REQUEST_MS']) if os.environ.get('SLOW_REQUEST_MS') else None
+
+# Admin-triggered (?_profile=cprofile|sample) and randomly sampled request profiles
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'groundplane-profiles'))
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_SAMPLE_MODE = os.environ.get('PROFILE_SAMPLE_MODE', 'sample')
+
+# How long a cached admin role is trusted before the users table is re-read
+ADMIN_ROLE_TTL = int(os.environ.get('ADMIN_ROLE_TTL', '300'))
+
+# Slack profiles are reused at login for this long instead of calling users.info
+SLACK_PROFILE_TTL = int(os.environ.get('SLACK_PROFILE_TTL', '86400'))
+
+# Threads for work deferred off the request path (profile sync after login)
+BACKGROUND_WORKERS = int(os.environ.get('BACKGROUND_WORKERS', '4'))
+
+# Threads shared by requests that fetch several upstream resources at once (page hydration)
+FANOUT_WORKERS = int(os.environ.get('FANOUT_WORKERS', '16'))
+
+# How long a project ID -> name mapping is reused to start the project page's log query early
+PROJECT_NAME_TTL = int(os.environ.get('PROJECT_NAME_TTL', '86400'))
+
+# How long user display names (shown on admin pages by User ID) are cached
+USER_NAME_TTL = int(os.environ.get('USER_NAME_TTL', '86400'))
+
+# How long deletions are remembered for delta sync (`since=`); older sync tokens need a full refetch
+CHANGE_LOG_RETENTION = int(os.environ.get('CHANGE_LOG_RETENTION', str(30 * 86400)))
+
+# Seconds of overlap applied to `since` so clock drift between us and Airtable can't drop changes
+SYNC_CLOCK_SKEW = float(os.environ.get('SYNC_CLOCK_SKEW', '5'))
+
+# Seconds between rebuilds of the log aggregates from a full listing (0 disables the background job)
+AGGREGATES_RECONCILE_INTERVAL = int(os.environ.get('AGGREGATES_RECONCILE_INTERVAL', '3600'))
+
+# How long computed analytics are reused (new logs invalidate them sooner)
+ANALYTICS_CACHE_TTL = int(os.environ.get('ANALYTICS_CACHE_TTL', '600'))
+
+# Longest a leaderboard is served before its rolling windows are recomputed
+LEADERBOARD_REFRESH_INTERVAL = int(os.environ.get('LEADERBOARD_REFRESH_INTERVAL', '300'))
+
+# Most entries kept per leaderboard ranking (the largest `k` that can be asked for)
+LEADERBOARD_DEPTH = int(os.environ.get('LEADERBOARD_DEPTH', '100'))
+
+# Airtable calls per second made by the background batch writer (Airtable allows 5 per base)
+BATCH_WRITE_RATE = float(os.environ.get('BATCH_WRITE_RATE', '3'))
+
+# Logs shown per page of the admin review queue
+REVIEW_PAGE_SIZE = int(os.environ.get('REVIEW_PAGE_SIZE', '50'))
+
+# Most logs one review action can change
+REVIEW_MAX_RECORDS = 1000
+
+# Concurrent Airtable calls the batch writer keeps in flight (still within BATCH_WRITE_RATE)
+BATCH_WRITE_CONCURRENCY = int(os.environ.get('BATCH_WRITE_CONCURRENCY', '3'))
+
+# Seconds a batch write call may take; kept well below the writer lease's 60s, which is renewed between rounds
+BATCH_WRITE_TIMEOUT = float(os.environ.get('BATCH_WRITE_TIMEOUT', '20'))
+
+# Public URL of /api/airtable/webhook for Airtable change notifications (unset: poll for changes instead)
+AIRTABLE_WEBHOOK_URL = os.environ.get('AIRTABLE_WEBHOOK_URL')
+
+# Seconds between checks for changes made in Airtable directly, besides webhook pings (0 disables them)
+CHANGE_POLL_INTERVAL = int(os.environ.get('CHANGE_POLL_INTERVAL', '60'))
+
+# Poll the tables for changes while there is no working webhook (lists every watched table each interval)
+CHANGE_POLLING = os.environ.get('CHANGE_POLLING', 'false').lower() == 'true'
+
+# Seconds between each worker's checks for new events for live admin dashboards
+LIVE_FEED_POLL_INTERVAL = float(os.environ.get('LIVE_FEED_POLL_INTERVAL', '1'))
+
+# Live dashboard streams each worker serves at once; each holds one of its threads for up to 5 minutes
+LIVE_FEED_MAX_CLIENTS = int(os.environ.get('LIVE_FEED_MAX_CLIENTS', '8'))
+
+# Most sub-requests accepted by one /api/batch call
+BATCH_MAX_REQUESTS = int(os.environ.get('BATCH_MAX_REQUESTS', '50'))
+
+# Largest `limit` on list endpoints (Airtable's maximum pageSize)
+LIST_PAGE_MAX = 100
+
+# Projects per dashboard page, loaded incrementally as the user scrolls
+DASHBOARD_PAGE_SIZE = int(os.environ.get('DASHBOARD_PAGE_SIZE', '24'))
+
+# The only project fields the dashboard renders
+DASHBOARD_PROJECT_FIELDS = ['Project Name', 'Description', 'Github Link', 'Cover Image URL', 'Created At']
+
+# 'sqlite' keeps session data server-side (only a signed ID in the cookie); 'cookie' is Flask's default
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'sqlite').lower()
+SESSION_SWEEP_INTERVAL = int(os.environ.get('SESSION_SWEEP_INTERVAL', '300'))
+
+# gzip/brotli for text responses of at least COMPRESS_MIN_SIZE bytes; brotli needs the optional brotli package
+COMPRESS_RESPONSES = os.environ.get('COMPRESS_RESPONSES', 'true').lower() == 'true'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '1024'))
+COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', '6'))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', '4'))
+
+# Bearer token required to scrape /metrics; leave unset to allow anonymous scrapes
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'mp4', 'mov', 'avi', 'webm'}
 
 TEMP_DIR = tempfile.gettempdir()
 temp_files = {} 
 
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+if TRAFFIC_RECORD_FILE:
+    TrafficRecorder(TRAFFIC_RECORD_FILE, sample_rate=TRAFFIC_RECORD_SAMPLE_RATE,
+                    max_bytes=TRAFFIC_RECORD_MAX_MB * 1024 * 1024).init_app(app)
+
+if SESSION_BACKEND == 'sqlite':
+    app.session_interface = SqliteSessionInterface(sweep_interval=SESSION_SWEEP_INTERVAL)
+    metrics.Gauge('groundplane_sessions', 'Live server-side sessions', function=session_count)
+
+upstream.add_observer(metrics.observe_upstream_call)
+server_timing.ServerTiming(emit_header=SERVER_TIMING_HEADER in ('admin', 'true'), slow_request_ms=SLOW_REQUEST_MS,
+                           is_authorized=(lambda: 'user_id' in session and is_admin(session['user_id']))
+                           if SERVER_TIMING_HEADER == 'admin' else None).init_app(app)
+profiling.RequestProfiler(PROFILE_DIR, sample_rate=PROFILE_SAMPLE_RATE, sample_mode=PROFILE_SAMPLE_MODE,
+                          is_authorized=lambda: 'user_id' in session and is_admin(session['user_id'])).init_app(app)
+if COMPRESS_RESPONSES:
+    # Registered after the other hooks so it runs first and its cost shows up in Server-Timing
+    Compress(min_size=COMPRESS_MIN_SIZE, gzip_level=COMPRESS_GZIP_LEVEL, brotli_quality=COMPRESS_BROTLI_QUALITY,
+             exclude_paths=('/temp/', '/default_cover.png')).init_app(app)
+metrics.Gauge('groundplane_temp_files', 'Temporary files currently waiting for the CDN to pull them',
+              function=lambda: len(temp_files))
+metrics.Gauge('groundplane_log_records_dropped', 'Log records dropped because the log queue was full',
+              function=dropped_records)
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.get('request_start')
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else '<unmatched>'
+        metrics.HTTP_REQUESTS.inc(request.method, route, str(response.status_code))
+        metrics.HTTP_LATENCY.observe(time.perf_counter() - start, request.method, route)
+    return response
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    if METRICS_TOKEN and request.headers.get('Authorization') != f'Bearer {METRICS_TOKEN}':
+        return "Unauthorized", 401
+    return Response(metrics.render_all(), mimetype='text/plain; version=0.0.4')
+
 
 
 def login_required(f):
@@ -55,16 +238,49 @@ def admin_required(f):
         if 'user_id' not in session:
             return redirect(url_for('login'))
         
-        if not session.get('is_admin', False) and not is_admin(session['user_id']):
+        # Always checked against the shared role cache so revocations apply to existing sessions
+        if not is_admin(session['user_id']):
+            session.pop('is_admin', None)
             flash('You do not have permission to access this page.', 'error')
             return redirect(url_for('index'))
             
-        if 'is_admin' not in session:
-            session['is_admin'] = True
+        session['is_admin'] = True
             
         return f(*args, **kwargs)
     return decorated_function
 
+background_executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix='background')
+
+def run_in_background(fn, *args, **kwargs):
+    """Run fn on the background pool, logging any exception instead of losing it in the Future"""
+    def job():
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.error("Background job %s failed: %s", fn.__name__, e)
+    return background_executor.submit(job)
+
+fanout_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix='fanout')
+
+def run_concurrently(calls):
+    """
+    Run {name: (fn, *args)} in parallel inside copies of the current request context and
+    return {name: result}. Exceptions are re-raised in the caller.
+    """
+    timings = g.get('server_timing')
+    
+    def in_request_context(fn):
+        @copy_current_request_context
+        def call(*args):
+            # Share the Server-Timing entries with the worker thread's fresh app context
+            if timings is not None:
+                g.server_timing = timings
+            return fn(*args)
+        return call
+    
+    futures = {name: fanout_executor.submit(in_request_context(fn), *args) for name, (fn, *args) in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
 def cleanup_temp_file(file_id, delay=300):
     """Clean up temporary file after delay (5 minutes by default)"""
     def cleanup():
@@ -73,7 +289,7 @@ def cleanup_temp_file(file_id, delay=300):
             file_path = temp_files[file_id]
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(f"Cleaned up temporary file: {file_path}")
+                logger.info("Cleaned up temporary file: %s", file_path)
             del temp_files[file_id]
     
     thread = threading.Thread(target=cleanup)
@@ -99,18 +315,19 @@ def create_temp_file_url(file_path):
         shutil.copy2(file_path, temp_file_path)
         
         temp_files[file_id] = temp_file_path
+        metrics.TEMP_FILES_CREATED.inc()
         
         base_url = request.url_root if request else "https://localhost:5000/"
         temp_url = f"{base_url}temp/{file_id}"
         
-        logger.info(f"Created temp URL: {temp_url}")
+        logger.debug("Created temp URL: %s", temp_url)
         
         cleanup_temp_file(file_id)
         
         return temp_url
         
     except Exception as e:
-        logger.error(f"Error creating temp file URL: {str(e)}")
+        logger.error("Error creating temp file URL: %s", e)
         return None
 
 def upload_to_hackclub_cdn(file_path):
@@ -121,7 +338,7 @@ def upload_to_hackclub_cdn(file_path):
             logger.error("Failed to create temporary URL for file")
             return None
         
-        url = 'https://cdn.hackclub.com/api/v3/new'
+        url = f'{HACKCLUB_CDN_URL}/api/v3/new'
         headers = {
             'Authorization': f'Bearer {HACKCLUB_CDN_TOKEN}',
             'Content-Type': 'application/json'
@@ -129,35 +346,31 @@ def upload_to_hackclub_cdn(file_path):
         
         payload = [temp_url]
         
-        logger.info(f"Uploading to CDN: {os.path.basename(file_path)}")
-        logger.info(f"Using temp URL: {temp_url}")
+        logger.debug("Uploading %s to CDN via %s", os.path.basename(file_path), temp_url)
         
-        response = requests.post(url, headers=headers, json=payload)
-        
-        logger.info(f"CDN response status: {response.status_code}")
+        response = upstream.post(url, headers=headers, json=payload)
         
         if response.status_code == 200:
             data = response.json()
-            logger.info(f"CDN response: {data}")
+            logger.debug("CDN response: %s", data)
             
             if 'files' in data and len(data['files']) > 0:
                 deployed_url = data['files'][0]['deployedUrl']
                 original_filename = os.path.basename(file_path)
                 cdn_filename = data['files'][0].get('file', 'unknown')
                 
-                logger.info(f"Successfully uploaded: {original_filename} -> {cdn_filename}")
-                logger.info(f"Deployed URL: {deployed_url}")
+                logger.info("Uploaded %s to CDN as %s: %s", original_filename, cdn_filename, deployed_url)
                 
                 return deployed_url
             else:
-                logger.error(f"Unexpected response format: {data}")
+                logger.error("Unexpected response format: %s", data)
                 return None
         else:
-            logger.error(f"CDN upload failed with status {response.status_code}: {response.text}")
+            logger.error("CDN upload failed with status %s: %s", response.status_code, response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Error uploading to CDN: {str(e)}")
+        logger.error("Error uploading to CDN: %s", e)
         return None
 
 def upload_file_to_cdn_alternative(file_path):
@@ -169,48 +382,69 @@ def upload_file_to_cdn_alternative(file_path):
         with open(file_path, 'rb') as f:
             files = {'file': f}
             
-            temp_response = requests.post('https://tmpfiles.org/api/v1/upload', files=files)
+            temp_response = upstream.post(f'{TMPFILES_URL}/api/v1/upload', files=files)
             
             if temp_response.status_code == 200:
                 temp_data = temp_response.json()
                 if temp_data.get('status') == 'success':
-                    temp_url = temp_data['data']['url'].replace('tmpfiles.org/', 'tmpfiles.org/dl/')
+                    # tmpfiles serves the raw file under /dl/<id>/<name>
+                    parsed_url = urlparse(temp_data['data']['url'])
+                    temp_url = parsed_url._replace(path='/dl' + parsed_url.path).geturl()
                     
-                    logger.info(f"Uploaded to tmpfiles.org: {temp_url}")
+                    logger.debug("Uploaded to tmpfiles: %s", temp_url)
                     
-                    cdn_url = 'https://cdn.hackclub.com/api/v3/new'
+                    cdn_url = f'{HACKCLUB_CDN_URL}/api/v3/new'
                     headers = {
                         'Authorization': f'Bearer {HACKCLUB_CDN_TOKEN}',
                         'Content-Type': 'application/json'
                     }
                     
                     payload = [temp_url]
-                    cdn_response = requests.post(cdn_url, headers=headers, json=payload)
+                    cdn_response = upstream.post(cdn_url, headers=headers, json=payload)
                     
                     if cdn_response.status_code == 200:
                         cdn_data = cdn_response.json()
                         if 'files' in cdn_data and len(cdn_data['files']) > 0:
                             deployed_url = cdn_data['files'][0]['deployedUrl']
-                            logger.info(f"Successfully uploaded to CDN: {deployed_url}")
+                            logger.info("Successfully uploaded to CDN: %s", deployed_url)
                             return deployed_url
                     else:
-                        logger.error(f"CDN upload failed: {cdn_response.text}")
+                        logger.error("CDN upload failed: %s", cdn_response.text)
                         return None
                 else:
-                    logger.error(f"Temporary upload failed: {temp_data}")
+                    logger.error("Temporary upload failed: %s", temp_data)
                     return None
             else:
-                logger.error(f"Temporary upload failed with status {temp_response.status_code}")
+                logger.error("Temporary upload failed with status %s", temp_response.status_code)
                 return None
                 
     except Exception as e:
-        logger.error(f"Error in alternative upload: {str(e)}")
+        logger.error("Error in alternative upload: %s", e)
         return None
 
+def timed_upload(target, upload_function, file_path):
+    """Run one upload attempt and record its size, duration and outcome"""
+    size = os.path.getsize(file_path)
+    start = time.perf_counter()
+    media_url = upload_function(file_path)
+    metrics.UPLOAD_LATENCY.observe(time.perf_counter() - start, target)
+    metrics.UPLOADS.inc(target, 'success' if media_url else 'failure')
+    if media_url:
+        metrics.UPLOAD_BYTES.inc(target, amount=size)
+        metrics.UPLOAD_SIZE.observe(size, target)
+    return media_url
+
+def upload_media_file(file_path):
+    """Upload via tmpfiles.org first, falling back to serving the file from /temp for the CDN"""
+    media_url = timed_upload('tmpfiles', upload_file_to_cdn_alternative, file_path)
+    if not media_url:
+        media_url = timed_upload('temp_url', upload_to_hackclub_cdn, file_path)
+    return media_url
+
 def save_to_airtable(log_data):
     """Save dev log entry to Airtable using Personal Access Token"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -233,55 +467,549 @@ def save_to_airtable(log_data):
             }
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = upstream.post(url, headers=headers, json=data)
         
         if response.status_code == 200:
-            return response.json()
+            record = response.json()
+            track_change(AIRTABLE_TABLE_NAME, record)
+            return record
         else:
-            logger.error(f"Airtable save failed: {response.text}")
+            logger.error("Airtable save failed: %s", response.text)
             return None
     except Exception as e:
-        logger.error(f"Error saving to Airtable: {str(e)}")
+        logger.error("Error saving to Airtable: %s", e)
+        return None
+
+def session_cache_lookup(key):
+    """Read a session-cached record list, counting the hit/miss and the time it took"""
+    with server_timing.timing('cache'):
+        cached = session.get(key)
+    metrics.record_cache_lookup(key, cached is not None)
+    return cached
+
+def current_session_cache(key, table_name):
+    """
+    A session record cache, first brought up to date if the change log has newer changes to the
+    user's records (e.g. edits made in Airtable directly). Returns None when there is no usable cache.
+    """
+    cached = session_cache_lookup(key)
+    token = session.get(f'{key}_token')
+    if cached is None or token is None:
+        return cached
+    try:
+        seq = decode_token(token)[0]
+    except ValueError:
+        return None
+    if record_changes.has_changes(table_name, session['user_id'], seq):
+        refresh_session_cache(key, table_name)
+        cached = session.get(key)
+    return cached
+
+def record_version(record):
+    """Modification marker for a record: its 'Last Modified' field when the table has one, else a content hash"""
+    fields = record.get('fields', {})
+    if fields.get('Last Modified'):
+        return fields['Last Modified']
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()
+
+def records_etag(records):
+    """Stable ETag for a record or list of records, built from record IDs and versions"""
+    if isinstance(records, dict):
+        records = [records]
+    digest = hashlib.sha1()
+    for record in records:
+        digest.update(f"{record.get('id')}:{record_version(record)}\n".encode())
+    return digest.hexdigest()
+
+def conditional_json(records):
+    """JSON response with an ETag; answers 304 Not Modified when If-None-Match matches"""
+    response = jsonify(records)
+    response.set_etag(records_etag(records))
+    # Cached by the browser only, and always revalidated
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+def user_list_params(formula=None):
+    """List params for the current user's records (optionally narrowed by `formula`), newest first"""
+    user_formula = f"{{User ID}} = '{session['user_id']}'"
+    return {
+        'filterByFormula': f"AND({user_formula}, {formula})" if formula else user_formula,
+        'sort[0][field]': 'Created At',
+        'sort[0][direction]': 'desc'
+    }
+
+def encode_cursor(offset, limit):
+    """Opaque cursor for the next page: Airtable's offset plus the page size"""
+    return base64.urlsafe_b64encode(json.dumps([offset, limit]).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    try:
+        offset, limit = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    # Cursors come back from clients, so their page size gets the same bounds as `limit`
+    if not isinstance(offset, str) or not isinstance(limit, int) or isinstance(limit, bool) \
+            or not 1 <= limit <= LIST_PAGE_MAX:
+        raise ValueError("Invalid cursor")
+    return offset, limit
+
+def parse_list_query():
+    """
+    The `limit`, `cursor` and `fields` parameters of a list request, or None when none are
+    given (the endpoint then returns every record as before). Raises ValueError on bad input.
+    """
+    args = request.args
+    if not any(name in args for name in ('limit', 'cursor', 'fields')):
+        return None
+    
+    query = {'limit': None, 'offset': None, 'fields': []}
+    if args.get('cursor'):
+        query['offset'], query['limit'] = decode_cursor(args['cursor'])
+    if 'limit' in args:
+        try:
+            query['limit'] = int(args['limit'])
+        except ValueError:
+            raise ValueError("limit must be an integer")
+    if query['limit'] is not None and not 1 <= query['limit'] <= LIST_PAGE_MAX:
+        raise ValueError(f"limit must be between 1 and {LIST_PAGE_MAX}")
+    if args.get('fields'):
+        query['fields'] = [name.strip() for name in args['fields'].split(',') if name.strip()]
+    return query
+
+def fetch_records_page(table_name, params, page_size=None, offset=None):
+    """
+    One page of a list call as (records, next_offset). Raises ValueError when Airtable rejects
+    the query (unknown field, expired offset); returns None on other failures.
+    """
+    url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{table_name}"
+    headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+    params = dict(params)
+    if page_size:
+        params['pageSize'] = page_size
+    if offset:
+        params['offset'] = offset
+    
+    response = upstream.get(url, headers=headers, params=params)
+    
+    if response.status_code == 422:
+        error = response.json().get('error', {})
+        raise ValueError(f"Rejected by Airtable: {error.get('message') or error.get('type') or response.text}")
+    if response.status_code != 200:
+        logger.error("Airtable list of %s failed: %s", table_name, response.text)
+        return None
+    
+    data = response.json()
+    return data.get('records', []), data.get('offset')
+
+def query_records(table_name, params, query):
+    """
+    Run a parsed list query. With a limit (or cursor) returns one page as
+    {'records': [...], 'next_cursor': ...}; with only `fields` returns every projected record.
+    Returns None on upstream failure.
+    """
+    params = dict(params)
+    if query['fields']:
+        params['fields[]'] = query['fields']
+    
+    if query['limit'] is not None:
+        page = fetch_records_page(table_name, params, query['limit'], query['offset'])
+        if page is None:
+            return None
+        records, next_offset = page
+        return {'records': records,
+                'next_cursor': encode_cursor(next_offset, query['limit']) if next_offset else None}
+    
+    records, offset = [], None
+    while True:
+        page = fetch_records_page(table_name, params, offset=offset)
+        if page is None:
+            return None
+        records.extend(page[0])
+        offset = page[1]
+        if not offset:
+            return records
+
+def list_query_response(query, result):
+    """JSON response for query_records' result, with the usual empty fallback on failure"""
+    if result is None:
+        return jsonify({'records': [], 'next_cursor': None} if query['limit'] is not None else [])
+    if isinstance(result, dict):
+        # Cursors embed a fresh Airtable offset each time, so pages are not ETag'd
+        return jsonify(result)
+    return conditional_json(result)
+
+record_changes = ChangeLog(retention=CHANGE_LOG_RETENTION)
+
+log_aggregates = LogAggregates(reconcile_interval=AGGREGATES_RECONCILE_INTERVAL)
+
+search_index = SearchIndex()
+log_aggregates.reconcile_listeners.append(search_index.rebuild)
+
+leaderboard = Leaderboard(depth=LEADERBOARD_DEPTH, refresh_interval=LEADERBOARD_REFRESH_INTERVAL)
+
+def current_leaderboard():
+    """This worker's leaderboard, rebuilt from the log facts if they changed elsewhere or the windows moved on"""
+    if not leaderboard.is_current(log_aggregates.facts_version()):
+        with server_timing.timing('leaderboard'):
+            leaderboard.rebuild(*log_aggregates.snapshot())
+    return leaderboard
+
+def track_change(table_name, record, op=UPSERT):
+    """Record a successful write in the change log, the log aggregates and the search index; never fails the write"""
+    try:
+        record_changes.record(table_name, record['id'], record.get('fields', {}).get('User ID'), op)
+        if table_name == AIRTABLE_TABLE_NAME:
+            if op == DELETE:
+                change = log_aggregates.remove(record['id'])
+                search_index.remove(record['id'])
+            else:
+                change = log_aggregates.apply(record)
+                search_index.index(record)
+            if change is not None:
+                leaderboard.update(*change)
+                publish_log_event(record, *change[:2])
+            invalidate_analytics(record.get('fields', {}).get('User ID'))
+    except Exception as e:
+        logger.error("Failed to record change to %s %s: %s", table_name, record.get('id'), e)
+
+live_feed = LiveFeed(poll_interval=LIVE_FEED_POLL_INTERVAL, max_subscribers=LIVE_FEED_MAX_CLIENTS)
+metrics.Gauge('groundplane_live_feed_clients', 'Admin dashboards connected to the live feed in this worker',
+              function=live_feed.subscriber_count)
+
+def publish_log_event(record, old_fact, new_fact):
+    """Tell live admin dashboards about a new log or a log whose status changed"""
+    if new_fact is None:
+        return
+    if old_fact is None:
+        kind = LOG_CREATED
+    elif old_fact[3] != new_fact[3]:
+        kind = LOG_STATUS
+    else:
+        return
+    fields = record.get('fields', {})
+    live_feed.publish(kind, {
+        'id': record['id'],
+        'user_id': new_fact[0],
+        'user_name': fields.get('User Name'),
+        'project_name': new_fact[1],
+        'title': fields.get('Title'),
+        'status': new_fact[3],
+        'previous_status': old_fact[3] if old_fact else None,
+        'created_at': new_fact[4],
+    })
+
+analytics_cache = SharedCache('analytics', ANALYTICS_CACHE_TTL)
+analytics_generation = SharedCache('analytics_generation', ANALYTICS_CACHE_TTL)
+
+def invalidate_analytics(user_id):
+    """Move the user's and the global analytics to a new cache generation"""
+    generation = time.time()
+    analytics_generation.set_many({user_id or '*': generation, '*': generation})
+
+def bounded_int_arg(name, default, maximum):
+    try:
+        value = int(request.args.get(name, default))
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if not 1 <= value <= maximum:
+        raise ValueError(f"{name} must be between 1 and {maximum}")
+    return value
+
+def load_analytics(user_id=None):
+    """Analytics for one user (or everyone), from the shared cache when the data hasn't changed"""
+    days = bounded_int_arg('days', 90, 366)
+    weeks = bounded_int_arg('weeks', 26, 104)
+    scope = user_id or '*'
+    key = f"{scope}:{analytics_generation.get(scope) or 0}:{date.today().isoformat()}:{days}:{weeks}"
+    
+    with server_timing.timing('cache'):
+        cached = analytics_cache.get(key)
+    metrics.record_cache_lookup('analytics', cached is not None)
+    if cached is not None:
+        return cached
+    
+    if log_aggregates.is_ready():
+        rows = log_aggregates.fact_rows(user_id)
+    else:
+        params = {'fields[]': FACT_FIELDS}
+        if user_id:
+            params['filterByFormula'] = f"{{User ID}} = '{user_id}'"
+        records = fetch_all_records(AIRTABLE_TABLE_NAME, params)
+        if records is None:
+            return None
+        rows = [(fact[4], fact[2], fact[3]) for fact in map(log_fact, records) if fact is not None]
+    
+    result = analytics.compute(rows, days=days, weeks=weeks)
+    analytics_cache.set(key, result)
+    return result
+
+def fetch_logs_for_aggregates():
+    """Every log, with only the fields the aggregates and the search index use"""
+    return fetch_all_records(AIRTABLE_TABLE_NAME, {'fields[]': list(dict.fromkeys(FACT_FIELDS + SEARCH_FIELDS))})
+
+def send_records(table_name, op, items):
+    """Create (POST), update (PATCH) or delete up to 10 (record_id, fields) items in one Airtable call; returns the response"""
+    url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{table_name}"
+    headers = {
+        'Authorization': f'Bearer {AIRTABLE_API_KEY}',
+        'Content-Type': 'application/json'
+    }
+    if op == BATCH_DELETE:
+        return upstream.delete(url, headers=headers, params={'records[]': [record_id for record_id, _ in items]},
+                               timeout=BATCH_WRITE_TIMEOUT)
+    if op == CREATE:
+        return upstream.post(url, headers=headers, json={'records': [{'fields': fields} for _, fields in items]},
+                             timeout=BATCH_WRITE_TIMEOUT)
+    return upstream.patch(url, headers=headers, json={'records': [{'id': record_id, 'fields': fields}
+                                                                  for record_id, fields in items]},
+                          timeout=BATCH_WRITE_TIMEOUT)
+
+def track_batch_changes(table_name, op, records):
+    for record in records:
+        track_change(table_name, record, DELETE if op == BATCH_DELETE else UPSERT)
+
+batch_writer = BatchWriter(send_records, on_success=track_batch_changes, requests_per_second=BATCH_WRITE_RATE,
+                           concurrency=BATCH_WRITE_CONCURRENCY)
+
+def queue_import(operations, created_by=None):
+    """Queue validated bulk_import operations as one batch-writer job per table and op; returns the job IDs"""
+    tables = {'logs': AIRTABLE_TABLE_NAME, 'projects': AIRTABLE_PROJECTS_TABLE}
+    return [batch_writer.enqueue('import', tables[table], items, op=op, created_by=created_by)
+            for (table, op), items in sorted(operations.items())]
+
+def log_deletion_items(logs):
+    """Batch-writer items deleting `logs`, keeping their owner for the change log"""
+    return {log['id']: {'User ID': log.get('fields', {}).get('User ID')} for log in logs}
+
+def queue_log_deletion(kind, logs, created_by=None):
+    """Queue logs for batched deletion; returns the job ID"""
+    return batch_writer.enqueue(kind, AIRTABLE_TABLE_NAME, log_deletion_items(logs), op=BATCH_DELETE,
+                                created_by=created_by)
+
+def project_name_formula(user_id, project_name):
+    return f"AND({{User ID}} = {formula_string(user_id)}, {{Project Name}} = {formula_string(project_name)})"
+
+def other_projects_named(user_id, project_name, record_id):
+    """The owner's projects other than `record_id` with this name; None on failure"""
+    projects = fetch_all_records(AIRTABLE_PROJECTS_TABLE, {
+        'filterByFormula': project_name_formula(user_id, project_name),
+        'fields[]': ['Project Name'],
+    })
+    return None if projects is None else [project for project in projects if project['id'] != record_id]
+
+def cascade_project_deletion(job_id, record_id, user_id, project_name):
+    """
+    Background part of deleting a project: find its logs and add them to the cascade job.
+    Logs are matched by owner and project name, so while the owner still has another project
+    of that name they can't be told apart and are all kept.
+    """
+    items = {}
+    try:
+        others = other_projects_named(user_id, project_name, record_id)
+        if others:
+            logger.info("Keeping the logs of deleted project %s: %s has another project named %r",
+                        record_id, user_id, project_name)
+            record_changes.forget_deleted_projects([record_id])
+            return
+        logs = None if others is None else fetch_all_records(AIRTABLE_TABLE_NAME, {
+            'filterByFormula': project_name_formula(user_id, project_name),
+            'fields[]': ['User ID'],
+        })
+        if logs is None:
+            logger.error("Could not list logs of deleted project %s; leaving them to the orphan cleanup", record_id)
+            return
+        items = log_deletion_items(logs)
+    finally:
+        batch_writer.extend(job_id, items)
+
+def find_orphaned_logs(unmatched=False):
+    """
+    Logs left behind by deleted projects, grouped as {(user_id, project_name): [log, ...]}, and
+    the project tombstones as {(user_id, project_name): [record_id, ...]}. By default only
+    tombstoned names the owner no longer has a project for. With `unmatched`, every named log
+    whose (owner, name) matches no existing project, which also finds logs of projects deleted
+    before the tombstones (or without a cascade) as well as renamed projects' old logs.
+    Returns (None, None) on failure.
+    """
+    tombstones = record_changes.deleted_projects()
+    if not tombstones and not unmatched:
+        return {}, {}
+    projects = fetch_all_records(AIRTABLE_PROJECTS_TABLE, {'fields[]': ['User ID', 'Project Name']})
+    if projects is None:
+        return None, None
+    existing = {(project['fields'].get('User ID'), project['fields'].get('Project Name')) for project in projects}
+    orphans = {}
+    if unmatched:
+        logs = fetch_all_records(AIRTABLE_TABLE_NAME, {'fields[]': ['User ID', 'Project Name']})
+        if logs is None:
+            return None, None
+        for log in logs:
+            key = (log['fields'].get('User ID'), log['fields'].get('Project Name'))
+            if key[1] and key not in existing:
+                orphans.setdefault(key, []).append(log)
+        return orphans, tombstones
+    deleted = sorted(set(tombstones) - existing)
+    for start in range(0, len(deleted), 20):
+        chunk = deleted[start:start + 20]
+        logs = fetch_all_records(AIRTABLE_TABLE_NAME, {
+            'filterByFormula': 'OR(' + ', '.join(project_name_formula(*key) for key in chunk) + ')',
+            'fields[]': ['User ID', 'Project Name'],
+        })
+        if logs is None:
+            return None, None
+        for log in logs:
+            orphans.setdefault((log['fields'].get('User ID'), log['fields'].get('Project Name')), []).append(log)
+    return orphans, tombstones
+
+def formula_string(value):
+    """Quote a value for use inside filterByFormula"""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+def review_queue_params(user_id=None, project_name=None):
+    """List params for Pending logs, oldest first, optionally for one user and/or project"""
+    conditions = ["{Status} = 'Pending'"]
+    if user_id:
+        conditions.append(f"{{User ID}} = {formula_string(user_id)}")
+    if project_name:
+        conditions.append(f"{{Project Name}} = {formula_string(project_name)}")
+    return {
+        'filterByFormula': f"AND({', '.join(conditions)})",
+        'sort[0][field]': 'Created At',
+        'sort[0][direction]': 'asc',
+    }
+
+def search_logs(user_id=None):
+    """
+    One page of `q` matches as a response dict, optionally limited to one owner's logs.
+    Filters: `status`, `from`/`to` (YYYY-MM-DD, inclusive). Raises ValueError on bad input.
+    """
+    args = request.args
+    offset, limit = 0, bounded_int_arg('limit', 20, LIST_PAGE_MAX)
+    if args.get('cursor'):
+        offset, limit = decode_cursor(args['cursor'])
+        if not offset.isdigit():
+            raise ValueError("Invalid cursor")
+        offset = int(offset)
+    for name in ('from', 'to'):
+        if args.get(name):
+            try:
+                date.fromisoformat(args[name])
+            except ValueError:
+                raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+    
+    with server_timing.timing('search'):
+        hits, total = search_index.search(args.get('q', ''), user_id=user_id, status=args.get('status') or None,
+                                          date_from=args.get('from') or None, date_to=args.get('to') or None,
+                                          offset=offset, limit=limit)
+    next_offset = offset + len(hits)
+    return {
+        'results': hits,
+        'total': total,
+        'next_cursor': encode_cursor(str(next_offset), limit) if next_offset < total else None,
+    }
+
+def parse_since(value):
+    """(seq, timestamp) for a `since` value: a sync token, or an ISO 8601 timestamp (seq None). Raises ValueError."""
+    try:
+        when = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        seq, issued_at = decode_token(value)
+        record_changes.check_token(issued_at)
+        return seq, issued_at
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return None, when.timestamp()
+
+def load_delta(table_name, params, since_seq, since_time):
+    """
+    The current user's records created or modified after a point, plus tombstones for those
+    deleted since. Modifications come from Airtable's LAST_MODIFIED_TIME(), so edits made
+    outside the app are included; deletions only come from the change log. Returns None on failure.
+    """
+    after = datetime.fromtimestamp(since_time - SYNC_CLOCK_SKEW, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+    params = dict(params)
+    params['filterByFormula'] = f"AND({params['filterByFormula']}, IS_AFTER(LAST_MODIFIED_TIME(), '{after}'))"
+    
+    records = fetch_all_records(table_name, params)
+    if records is None:
         return None
+    
+    deleted = [
+        {'id': change['record_id'], 'deleted': True,
+         'deleted_at': datetime.fromtimestamp(change['changed_at'], timezone.utc).isoformat()}
+        for change in record_changes.since(table_name, session['user_id'], since_seq, since_time)
+        if change['op'] == DELETE
+    ]
+    return {'records': records, 'deleted': deleted}
+
+def merge_delta(records, delta):
+    """Apply a delta to a cached record list, keeping it newest first"""
+    replaced = {record['id'] for record in delta['records']} | {tombstone['id'] for tombstone in delta['deleted']}
+    merged = [record for record in records if record['id'] not in replaced] + delta['records']
+    merged.sort(key=lambda record: record.get('fields', {}).get('Created At') or '', reverse=True)
+    return merged
+
+def sync_response(table_name, params):
+    """Answer a `since=` request with the delta and a token for the next poll"""
+    since_seq, since_time = parse_since(request.args['since'])
+    sync_token = record_changes.issue_token()
+    delta = load_delta(table_name, params, since_seq, since_time)
+    if delta is None:
+        return jsonify({"success": False, "message": "Failed to fetch changes"}), 500
+    delta['sync_token'] = sync_token
+    return with_sync_token(jsonify(delta), sync_token)
+
+def with_sync_token(response, sync_token):
+    """Tell clients where to resume delta sync from"""
+    if sync_token:
+        response.headers['X-Sync-Token'] = sync_token
+    return response
+
+def load_user_logs():
+    """
+    Current user's logs, newest first (session-cached with static props), and the sync token
+    they are current as of. Returns (None, None) on failure.
+    """
+    user_settings = get_user_settings(session['user_id'])
+    use_static_props = user_settings.get('use_static_props', False)
+    
+    if use_static_props:
+        cached = current_session_cache('logs_cache', AIRTABLE_TABLE_NAME)
+        if cached is not None:
+            logger.debug("Using cached logs data")
+            return cached, session.get('logs_cache_token')
+    
+    sync_token = record_changes.issue_token()
+    records = fetch_all_records(AIRTABLE_TABLE_NAME, user_list_params())
+    
+    if records is not None and use_static_props:
+        session['logs_cache'] = records
+        session['logs_cache_token'] = sync_token
+        logger.info("Cached logs data")
+    
+    return records, sync_token
 
 @app.route('/api/logs')
 @login_required
 def get_logs():
     """Get user's dev logs from Airtable using Personal Access Token"""
     try:
-        user_settings = get_user_settings(session['user_id'])
-        use_static_props = user_settings.get('use_static_props', False)
+        if 'since' in request.args:
+            return sync_response(AIRTABLE_TABLE_NAME, user_list_params())
         
-        if use_static_props and 'logs_cache' in session:
-            logger.info("Using cached logs data")
-            return jsonify(session['logs_cache'])
+        query = parse_list_query()
+        if query is not None:
+            return list_query_response(query, query_records(AIRTABLE_TABLE_NAME, user_list_params(), query))
         
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-        
-        params = {
-            'filterByFormula': f"{{User ID}} = '{session['user_id']}'",
-            'sort[0][field]': 'Created At',
-            'sort[0][direction]': 'desc'
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            records = data['records']
-            
-            if use_static_props:
-                session['logs_cache'] = records
-                logger.info("Cached logs data")
-            
-            return jsonify(records)
-        else:
-            logger.error(f"Airtable fetch failed: {response.text}")
-            return jsonify([])
-            
+        records, sync_token = load_user_logs()
+        return with_sync_token(conditional_json(records), sync_token) if records is not None else jsonify([])
+    
+    except ExpiredToken as e:
+        return jsonify({"success": False, "message": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error fetching logs: {str(e)}")
+        logger.error("Error fetching logs: %s", e)
         return jsonify([])
 
 @app.route('/api/logs/<record_id>', methods=['DELETE'])
@@ -289,32 +1017,33 @@ def get_logs():
 def delete_log(record_id):
     """Delete a dev log entry from Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code != 200:
-            logger.error(f"Failed to fetch log for deletion verification: {response.text}")
+            logger.error("Failed to fetch log for deletion verification: %s", response.text)
             return jsonify({"success": False, "message": "Log not found"}), 404
             
         log_data = response.json()
         if log_data.get('fields', {}).get('User ID') != session['user_id']:
             return jsonify({"success": False, "message": "Unauthorized"}), 403
         
-        delete_response = requests.delete(url, headers=headers)
+        delete_response = upstream.delete(url, headers=headers)
         
         if delete_response.status_code == 200:
+            track_change(AIRTABLE_TABLE_NAME, log_data, DELETE)
             if 'logs_cache' in session:
                 session.pop('logs_cache')
                 logger.info("Cleared logs cache after deleting log")
             return jsonify({"success": True, "message": "Log deleted successfully"})
         else:
-            logger.error(f"Airtable delete failed: {delete_response.text}")
+            logger.error("Airtable delete failed: %s", delete_response.text)
             return jsonify({"success": False, "message": "Failed to delete log"}), 500
             
     except Exception as e:
-        logger.error(f"Error deleting log: {str(e)}")
+        logger.error("Error deleting log: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 @app.route('/api/logs/<record_id>', methods=['GET'])
@@ -322,23 +1051,23 @@ def delete_log(record_id):
 def get_log(record_id):
     """Get a specific dev log entry from Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code == 200:
             log_data = response.json()
             if log_data.get('fields', {}).get('User ID') != session['user_id']:
                 return jsonify({"success": False, "message": "Unauthorized"}), 403
                 
-            return jsonify(log_data)
+            return conditional_json(log_data)
         else:
-            logger.error(f"Airtable fetch failed: {response.text}")
+            logger.error("Airtable fetch failed: %s", response.text)
             return jsonify({"success": False, "message": "Log not found"}), 404
             
     except Exception as e:
-        logger.error(f"Error fetching log: {str(e)}")
+        logger.error("Error fetching log: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 @app.route('/api/logs/<record_id>', methods=['PATCH'])
@@ -346,16 +1075,16 @@ def get_log(record_id):
 def update_log(record_id):
     """Update a dev log entry in Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code != 200:
-            logger.error(f"Failed to fetch log for update verification: {response.text}")
+            logger.error("Failed to fetch log for update verification: %s", response.text)
             return jsonify({"success": False, "message": "Log not found"}), 404
             
         log_data = response.json()
@@ -380,19 +1109,21 @@ def update_log(record_id):
             'fields': fields
         }
         
-        update_response = requests.patch(url, headers=headers, json=update_payload)
+        update_response = upstream.patch(url, headers=headers, json=update_payload)
         
         if update_response.status_code == 200:
+            updated = update_response.json()
+            track_change(AIRTABLE_TABLE_NAME, updated)
             if 'logs_cache' in session:
                 session.pop('logs_cache')
                 logger.info("Cleared logs cache after updating log")
-            return jsonify({"success": True, "message": "Log updated successfully", "data": update_response.json()})
+            return jsonify({"success": True, "message": "Log updated successfully", "data": updated})
         else:
-            logger.error(f"Airtable update failed: {update_response.text}")
+            logger.error("Airtable update failed: %s", update_response.text)
             return jsonify({"success": False, "message": "Failed to update log"}), 500
             
     except Exception as e:
-        logger.error(f"Error updating log: {str(e)}")
+        logger.error("Error updating log: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 import re
@@ -402,7 +1133,7 @@ AIRTABLE_PROJECTS_TABLE = os.environ.get('AIRTABLE_PROJECTS_TABLE', 'Projects')
 def save_project_to_airtable(project_data):
     """Save project to Airtable using Personal Access Token"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -424,55 +1155,86 @@ def save_project_to_airtable(project_data):
             }
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = upstream.post(url, headers=headers, json=data)
         
         if response.status_code == 200:
-            return response.json()
+            record = response.json()
+            track_change(AIRTABLE_PROJECTS_TABLE, record)
+            return record
         else:
-            logger.error(f"Airtable project save failed: {response.text}")
+            logger.error("Airtable project save failed: %s", response.text)
             return None
     except Exception as e:
-        logger.error(f"Error saving project to Airtable: {str(e)}")
+        logger.error("Error saving project to Airtable: %s", e)
         return None
 
+project_name_cache = SharedCache('project_name', PROJECT_NAME_TTL)
+
+def remember_project_names(records):
+    """Record project ID -> name so the project page can query logs without fetching the project first"""
+    names = {r['id']: r['fields']['Project Name'] for r in records if r.get('fields', {}).get('Project Name')}
+    if names:
+        project_name_cache.set_many(names)
+
+def load_user_projects():
+    """
+    Current user's projects, newest first (session-cached with static props), and the sync
+    token they are current as of. Returns (None, None) on failure.
+    """
+    user_settings = get_user_settings(session['user_id'])
+    use_static_props = user_settings.get('use_static_props', False)
+    
+    if use_static_props:
+        cached = current_session_cache('projects_cache', AIRTABLE_PROJECTS_TABLE)
+        if cached is not None:
+            logger.debug("Using cached projects data")
+            return cached, session.get('projects_cache_token')
+    
+    sync_token = record_changes.issue_token()
+    records = fetch_all_records(AIRTABLE_PROJECTS_TABLE, user_list_params())
+    if records is None:
+        return None, None
+    remember_project_names(records)
+    
+    if use_static_props:
+        session['projects_cache'] = records
+        session['projects_cache_token'] = sync_token
+        logger.info("Cached projects data")
+    
+    return records, sync_token
+
+def load_user_projects_page(limit, fields, cursor=None):
+    """One page of the current user's projects with only `fields`. Returns None on failure."""
+    offset = decode_cursor(cursor)[0] if cursor else None
+    page = query_records(AIRTABLE_PROJECTS_TABLE, user_list_params(), {'limit': limit, 'offset': offset, 'fields': fields})
+    if page is not None:
+        remember_project_names(page['records'])
+    return page
+
 @app.route('/api/projects')
 @login_required
 def get_projects():
     """Get user's projects from Airtable"""
     try:
-        user_settings = get_user_settings(session['user_id'])
-        use_static_props = user_settings.get('use_static_props', False)
-        
-        if use_static_props and 'projects_cache' in session:
-            logger.info("Using cached projects data")
-            return jsonify(session['projects_cache'])
-        
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-        
-        params = {
-            'filterByFormula': f"{{User ID}} = '{session['user_id']}'",
-            'sort[0][field]': 'Created At',
-            'sort[0][direction]': 'desc'
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            records = data['records']
-            
-            if use_static_props:
-                session['projects_cache'] = records
-                logger.info("Cached projects data")
-            
-            return jsonify(records)
-        else:
-            logger.error(f"Airtable fetch failed: {response.text}")
-            return jsonify([])
-            
+        if 'since' in request.args:
+            return sync_response(AIRTABLE_PROJECTS_TABLE, user_list_params())
+        
+        query = parse_list_query()
+        if query is not None:
+            result = query_records(AIRTABLE_PROJECTS_TABLE, user_list_params(), query)
+            if result is not None:
+                remember_project_names(result['records'] if isinstance(result, dict) else result)
+            return list_query_response(query, result)
+        
+        records, sync_token = load_user_projects()
+        return with_sync_token(conditional_json(records), sync_token) if records is not None else jsonify([])
+    
+    except ExpiredToken as e:
+        return jsonify({"success": False, "message": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error fetching projects: {str(e)}")
+        logger.error("Error fetching projects: %s", e)
         return jsonify([])
 
 @app.route('/api/projects', methods=['POST'])
@@ -505,31 +1267,43 @@ def create_project():
             return jsonify({"success": False, "message": "Failed to create project"}), 500
             
     except Exception as e:
-        logger.error(f"Error creating project: {str(e)}")
+        logger.error("Error creating project: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
+def fetch_project(record_id):
+    """Fetch a project owned by the current user. Returns (record, 200), (None, 403) or (None, 404)."""
+    url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
+    headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+    
+    response = upstream.get(url, headers=headers)
+    
+    if response.status_code != 200:
+        logger.error("Airtable fetch failed: %s", response.text)
+        return None, 404
+    
+    project_data = response.json()
+    if project_data.get('fields', {}).get('User ID') != session['user_id']:
+        return None, 403
+    
+    remember_project_names([project_data])
+    return project_data, 200
+
 @app.route('/api/projects/<record_id>', methods=['GET'])
 @login_required
 def get_project(record_id):
     """Get a specific project from Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-        
-        response = requests.get(url, headers=headers)
+        project_data, status = fetch_project(record_id)
         
-        if response.status_code == 200:
-            project_data = response.json()
-            if project_data.get('fields', {}).get('User ID') != session['user_id']:
-                return jsonify({"success": False, "message": "Unauthorized"}), 403
-                
-            return jsonify(project_data)
+        if status == 200:
+            return conditional_json(project_data)
+        elif status == 403:
+            return jsonify({"success": False, "message": "Unauthorized"}), 403
         else:
-            logger.error(f"Airtable fetch failed: {response.text}")
             return jsonify({"success": False, "message": "Project not found"}), 404
             
     except Exception as e:
-        logger.error(f"Error fetching project: {str(e)}")
+        logger.error("Error fetching project: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 @app.route('/api/projects/<record_id>', methods=['PATCH'])
@@ -537,16 +1311,16 @@ def get_project(record_id):
 def update_project(record_id):
     """Update a project in Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code != 200:
-            logger.error(f"Failed to fetch project for update verification: {response.text}")
+            logger.error("Failed to fetch project for update verification: %s", response.text)
             return jsonify({"success": False, "message": "Project not found"}), 404
             
         project_data = response.json()
@@ -568,19 +1342,21 @@ def update_project(record_id):
             'fields': fields
         }
         
-        update_response = requests.patch(url, headers=headers, json=update_payload)
+        update_response = upstream.patch(url, headers=headers, json=update_payload)
         
         if update_response.status_code == 200:
+            updated = update_response.json()
+            track_change(AIRTABLE_PROJECTS_TABLE, updated)
             if 'projects_cache' in session:
                 session.pop('projects_cache')
                 logger.info("Cleared projects cache after updating project")
-            return jsonify({"success": True, "message": "Project updated successfully", "data": update_response.json()})
+            return jsonify({"success": True, "message": "Project updated successfully", "data": updated})
         else:
-            logger.error(f"Airtable update failed: {update_response.text}")
+            logger.error("Airtable update failed: %s", update_response.text)
             return jsonify({"success": False, "message": "Failed to update project"}), 500
             
     except Exception as e:
-        logger.error(f"Error updating project: {str(e)}")
+        logger.error("Error updating project: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 @app.route('/api/projects/<record_id>', methods=['DELETE'])
@@ -588,32 +1364,44 @@ def update_project(record_id):
 def delete_project(record_id):
     """Delete a project from Airtable"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code != 200:
-            logger.error(f"Failed to fetch project for deletion verification: {response.text}")
+            logger.error("Failed to fetch project for deletion verification: %s", response.text)
             return jsonify({"success": False, "message": "Project not found"}), 404
             
         project_data = response.json()
         if project_data.get('fields', {}).get('User ID') != session['user_id']:
             return jsonify({"success": False, "message": "Unauthorized"}), 403
         
-        delete_response = requests.delete(url, headers=headers)
+        delete_response = upstream.delete(url, headers=headers)
         
         if delete_response.status_code == 200:
+            track_change(AIRTABLE_PROJECTS_TABLE, project_data, DELETE)
             if 'projects_cache' in session:
                 session.pop('projects_cache')
                 logger.info("Cleared projects cache after deleting project")
-            return jsonify({"success": True, "message": "Project deleted successfully"})
+            
+            # The project's logs go too: found and deleted in batches in the background
+            project_name = project_data['fields'].get('Project Name', '')
+            if not project_name:
+                return jsonify({"success": True, "message": "Project deleted successfully", "cleanup_job": None})
+            record_changes.record_project_deletion(record_id, session['user_id'], project_name)
+            job_id = batch_writer.enqueue('project-cascade', AIRTABLE_TABLE_NAME, {}, op=BATCH_DELETE,
+                                          created_by=session['user_id'])
+            run_in_background(cascade_project_deletion, job_id, record_id, session['user_id'], project_name)
+            session.pop('logs_cache', None)
+            return jsonify({"success": True, "cleanup_job": job_id,
+                            "message": "Project deleted; its logs are being removed in the background"})
         else:
-            logger.error(f"Airtable delete failed: {delete_response.text}")
+            logger.error("Airtable delete failed: %s", delete_response.text)
             return jsonify({"success": False, "message": "Failed to delete project"}), 500
             
     except Exception as e:
-        logger.error(f"Error deleting project: {str(e)}")
+        logger.error("Error deleting project: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 @app.route('/create-project', methods=['GET', 'POST'])
@@ -635,17 +1423,14 @@ def create_project_page():
                     filename = secure_filename(file.filename)
                     timestamp = str(int(time.time()))
                     filename = f"{timestamp}_{filename}"
-                    logger.info(f"Cover image URL being saved to Airtable: {cover_image_url}")
+                    logger.debug("Replacing default cover image %s with upload", cover_image_url)
 
                     with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
                         file.save(temp_file.name)
                         temp_file_path = temp_file.name
                     
                     try:
-                        media_url = upload_file_to_cdn_alternative(temp_file_path)
-                        
-                        if not media_url:
-                            media_url = upload_to_hackclub_cdn(temp_file_path)
+                        media_url = upload_media_file(temp_file_path)
                         
                         if media_url:
                             cover_image_url = media_url
@@ -680,7 +1465,7 @@ def create_project_page():
                 flash('Error saving project. Please try again.', 'error')
                 
         except Exception as e:
-            logger.error(f"Error creating project: {str(e)}")
+            logger.error("Error creating project: %s", e)
             flash('Error creating project. Please try again.', 'error')
     
     return render_template('create_project.html')
@@ -699,8 +1484,13 @@ def edit_project_page():
 @app.route('/project/<project_id>')
 @login_required
 def project_detail(project_id):
-    """Render the project detail page"""
-    return render_template('project_detail.html', project_id=project_id)
+    """Render the project detail page with its data embedded for hydration"""
+    try:
+        hydration = load_project_page(project_id)
+    except Exception as e:
+        logger.error("Error loading project page data: %s", e)
+        hydration = {}
+    return render_template('project_detail.html', project_id=project_id, hydration=hydration)
 
 
 def get_user_settings(user_id):
@@ -718,7 +1508,7 @@ def get_user_settings(user_id):
     }
     
     session['user_settings'] = default_settings
-    logger.info("Created default user settings in local cache")
+    logger.debug("Created default user settings in local cache")
     return default_settings
 
 def save_user_settings(user_id, settings):
@@ -733,7 +1523,7 @@ def save_user_settings(user_id, settings):
     }
     
     session['user_settings'] = session_settings
-    logger.info("Saved user settings to local cache")
+    logger.debug("Saved user settings to local cache")
     return True
 
 def get_status_class(status):
@@ -755,25 +1545,53 @@ def inject_user_settings():
     context = {}
     if 'user_id' in session:
         context['user_settings'] = get_user_settings(session['user_id'])
-        context['is_admin'] = session.get('is_admin', False)
+        context['is_admin'] = is_admin(session['user_id'])
     else:
         context['user_settings'] = {'enable_animations': True, 'reduced_motion': False, 'project_reminders': True, 'use_static_props': False, 'last_refreshed': None}
         context['is_admin'] = False
     
     context['get_status_class'] = get_status_class
+    context['asset_url'] = asset_url
+    context['batch_max_requests'] = BATCH_MAX_REQUESTS
     return context
 
+def load_asset_manifest():
+    """Source name -> fingerprinted name map written by build_assets.py; empty if assets were not built"""
+    try:
+        with open(os.path.join(app.static_folder, 'dist', 'manifest.json')) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.info("No static asset manifest, serving unbuilt assets")
+        return {}
+
+asset_manifest = load_asset_manifest()
+
+def asset_url(name):
+    """URL of a static asset, using its minified, fingerprinted build when there is one"""
+    return url_for('static', filename=asset_manifest.get(name, name))
+
+@app.after_request
+def cache_static_assets(response):
+    """Fingerprinted assets never change under the same name, so let browsers keep them for a year"""
+    if request.endpoint == 'static' and response.status_code in (200, 304) \
+            and request.view_args.get('filename', '').startswith('dist/'):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
 def get_user_from_airtable(user_id):
     """Get user from Airtable Users table"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
         params = {
             'filterByFormula': f"{{User ID}} = '{user_id}'"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = upstream.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -782,60 +1600,105 @@ def get_user_from_airtable(user_id):
             else:
                 return None
         else:
-            logger.error(f"Airtable user fetch failed: {response.text}")
+            logger.error("Airtable user fetch failed: %s", response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Error fetching user: {str(e)}")
+        logger.error("Error fetching user: %s", e)
         return None
 
-def get_all_users():
-    """Get all users from Airtable Users table"""
-    try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+def fetch_all_records(table_name, params=None):
+    """List every record in a table, following Airtable's offset pagination. Returns None on failure."""
+    url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{table_name}"
+    headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+    params = dict(params or {})
+    records = []
+    
+    while True:
+        response = upstream.get(url, headers=headers, params=params)
         
-        response = requests.get(url, headers=headers)
+        if response.status_code != 200:
+            logger.error("Airtable list of %s failed: %s", table_name, response.text)
+            return None
         
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('records', [])
+        data = response.json()
+        records.extend(data.get('records', []))
+        
+        if not data.get('offset'):
+            return records
+        params['offset'] = data['offset']
+
+user_name_cache = SharedCache('user_name', USER_NAME_TTL)
+
+def user_names(user_ids):
+    """User ID -> display name for a few users, from the shared cache with one filtered Airtable call for misses"""
+    names, missing = {}, []
+    for user_id in dict.fromkeys(user_ids):
+        name = user_name_cache.get(user_id)
+        if name is None:
+            missing.append(user_id)
         else:
-            logger.error(f"Airtable users fetch failed: {response.text}")
+            names[user_id] = name
+    metrics.record_cache_lookup('user_name', not missing)
+    if missing:
+        users = fetch_all_records(AIRTABLE_USERS_TABLE, {
+            'filterByFormula': 'OR(' + ', '.join(f"{{User ID}} = {formula_string(user_id)}" for user_id in missing) + ')',
+            'fields[]': ['User ID', 'User Name'],
+        })
+        if users is not None:
+            found = {user['fields']['User ID']: user['fields'].get('User Name') or ''
+                     for user in users if user.get('fields', {}).get('User ID')}
+            # Unknown IDs are cached as '' so they aren't looked up on every view
+            found.update({user_id: '' for user_id in missing if user_id not in found})
+            user_name_cache.set_many(found)
+            names.update(found)
+    return names
+
+def get_all_users():
+    """Get all users from Airtable Users table"""
+    try:
+        users = fetch_all_records(AIRTABLE_USERS_TABLE)
+        if users is None:
             return []
+        
+        refresh_admin_roles(users)
+        return users
             
     except Exception as e:
-        logger.error(f"Error fetching users: {str(e)}")
+        logger.error("Error fetching users: %s", e)
         return []
 
-def save_user_to_airtable(user_data):
-    """Save user to Airtable Users table"""
+def upsert_user_in_airtable(user_data):
+    """Create or update the Users record matching user_data['User ID'] in one call. Returns (record, created)."""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
         }
         
         data = {
-            'fields': user_data
+            'performUpsert': {'fieldsToMergeOn': ['User ID']},
+            'records': [{'fields': user_data}]
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = upstream.patch(url, headers=headers, json=data)
         
         if response.status_code == 200:
-            return response.json()
+            result = response.json()
+            record = result['records'][0]
+            return record, record['id'] in result.get('createdRecords', [])
         else:
-            logger.error(f"Airtable user save failed: {response.text}")
-            return None
+            logger.error("Airtable user upsert failed: %s", response.text)
+            return None, False
     except Exception as e:
-        logger.error(f"Error saving user: {str(e)}")
-        return None
+        logger.error("Error upserting user: %s", e)
+        return None, False
 
 def update_user_in_airtable(record_id, user_data):
     """Update user in Airtable Users table"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -845,28 +1708,206 @@ def update_user_in_airtable(record_id, user_data):
             'fields': user_data
         }
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = upstream.patch(url, headers=headers, json=data)
         
         if response.status_code == 200:
             return response.json()
         else:
-            logger.error(f"Airtable user update failed: {response.text}")
+            logger.error("Airtable user update failed: %s", response.text)
             return None
     except Exception as e:
-        logger.error(f"Error updating user: {str(e)}")
+        logger.error("Error updating user: %s", e)
         return None
 
+admin_role_cache = SharedCache('admin_role', ADMIN_ROLE_TTL)
+admin_role_refresh_lock = threading.Lock()
+
+def admin_flag(fields):
+    """Interpret the Users table 'Is Admin' field, stored as 'true'/'false' or a checkbox"""
+    admin_value = fields.get('Is Admin', 'false')
+    return admin_value is True or admin_value == 'true'
+
+def refresh_admin_roles(users=None):
+    """Reload every user's role into the admin role cache with one paginated list call"""
+    if users is None:
+        try:
+            users = fetch_all_records(AIRTABLE_USERS_TABLE, {'fields[]': ['User ID', 'Is Admin']})
+        except Exception as e:
+            logger.error("Error refreshing admin roles: %s", e)
+            return False
+        if users is None:
+            return False
+    
+    roles = {}
+    for user in users:
+        user_id = user.get('fields', {}).get('User ID')
+        if user_id:
+            roles[user_id] = 'admin' if admin_flag(user['fields']) else 'user'
+    
+    admin_role_cache.set_many(roles)
+    logger.info("Refreshed admin roles for %d users", len(roles))
+    return True
+
+def get_admin_role(user_id):
+    """Return 'admin' or 'user' from the shared role cache, refreshing it in bulk on a miss"""
+    with server_timing.timing('cache'):
+        role = admin_role_cache.get(user_id)
+    metrics.record_cache_lookup('admin_role', role is not None)
+    if role is not None:
+        return role
+    
+    # One thread per worker refreshes; the others wait and then read the fresh cache
+    with admin_role_refresh_lock:
+        role = admin_role_cache.get(user_id)
+        if role is None:
+            if not refresh_admin_roles():
+                # Airtable unreachable: deny for now without caching, so the next request retries
+                return 'user'
+            role = admin_role_cache.get(user_id)
+            if role is None:
+                # Unknown user: cache the non-admin answer too
+                role = 'user'
+                admin_role_cache.set(user_id, role)
+    return role
+
 def is_admin(user_id):
     """Check if user is an admin"""
-    user = get_user_from_airtable(user_id)
-    admin_value = user.get('fields', {}).get('Is Admin', 'false') if user else 'false'
-    return admin_value is True or admin_value == True or admin_value == 'true'
+    return get_admin_role(user_id) == 'admin'
+
+def fetch_matching_records(table_name, formula):
+    return fetch_all_records(table_name, {'filterByFormula': formula})
+
+def apply_upstream_changes(table_name, records, destroyed_ids):
+    """Bring the local copies of records changed in Airtable directly up to date, record by record"""
+    if table_name == AIRTABLE_USERS_TABLE:
+        roles = {record['fields']['User ID']: 'admin' if admin_flag(record['fields']) else 'user'
+                 for record in records if record.get('fields', {}).get('User ID')}
+        if roles:
+            admin_role_cache.set_many(roles)
+            user_name_cache.set_many({record['fields']['User ID']: record['fields'].get('User Name') or ''
+                                      for record in records if record.get('fields', {}).get('User ID')})
+        if destroyed_ids:
+            # Whose record it was is unknown; roles are reloaded on the next lookup
+            admin_role_cache.clear()
+        return
+    for record in records:
+        track_change(table_name, record)
+    for record_id in destroyed_ids:
+        user_id = record_changes.owner(record_id)
+        if user_id is None and table_name == AIRTABLE_TABLE_NAME:
+            user_id = log_aggregates.owner(record_id)
+        track_change(table_name, {'id': record_id, 'fields': {'User ID': user_id}}, op=DELETE)
+        project_name = project_name_cache.get(record_id) if table_name == AIRTABLE_PROJECTS_TABLE else None
+        if user_id and project_name:
+            # Its logs are left for the orphan cleanup, where an admin reviews them first
+            record_changes.record_project_deletion(record_id, user_id, project_name)
+    if table_name == AIRTABLE_PROJECTS_TABLE:
+        remember_project_names(records)
+        for record_id in destroyed_ids:
+            project_name_cache.delete(record_id)
+    logger.info("Applied %d changed and %d deleted %s records from Airtable", len(records), len(destroyed_ids), table_name)
+
+change_watcher = ChangeWatcher(AIRTABLE_API_URL, AIRTABLE_BASE_ID, AIRTABLE_API_KEY,
+                               [AIRTABLE_TABLE_NAME, AIRTABLE_PROJECTS_TABLE, AIRTABLE_USERS_TABLE],
+                               fetch_matching_records, apply_upstream_changes, notification_url=AIRTABLE_WEBHOOK_URL,
+                               poll_interval=CHANGE_POLL_INTERVAL, polling=CHANGE_POLLING, clock_skew=SYNC_CLOCK_SKEW,
+                               last_change_at=record_changes.last_changed)
+
+@app.route('/api/airtable/webhook', methods=['POST'])
+def airtable_webhook():
+    """Airtable change notification: verify its MAC, then read the webhook's new payloads in the background"""
+    try:
+        body = request.get_data()
+        notification = request.get_json(silent=True) or {}
+        webhook_id = (notification.get('webhook') or {}).get('id')
+        if not change_watcher.verify(body, request.headers.get(MAC_HEADER), webhook_id):
+            logger.warning("Rejected Airtable notification with an invalid MAC for webhook %s", webhook_id)
+            return jsonify({"success": False, "message": "Invalid signature"}), 401
+        run_in_background(change_watcher.sync)
+        return jsonify({"success": True})
+    except Exception as e:
+        logger.error("Error handling Airtable notification: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+slack_profile_cache = SharedCache('slack_profile', SLACK_PROFILE_TTL)
+
+def fetch_slack_profile(access_token, user_id):
+    """Call Slack users.info and cache the fields login needs"""
+    user_info_response = upstream.get(
+        'https://slack.com/api/users.info',
+        headers={'Authorization': f'Bearer {access_token}'},
+        params={'user': user_id}
+    )
+    
+    user_info = user_info_response.json()
+    
+    if not user_info.get('ok'):
+        logger.error("Slack users.info failed for %s: %s", user_id, user_info.get('error'))
+        return None
+    
+    slack_user = user_info['user']
+    profile = {
+        'id': slack_user['id'],
+        'real_name': slack_user['real_name'],
+        'team_id': slack_user.get('team_id', ''),
+        'email': slack_user.get('profile', {}).get('email', ''),
+        'image_192': slack_user.get('profile', {}).get('image_192', '')
+    }
+    slack_profile_cache.set(user_id, profile)
+    return profile
+
+def sync_user_profile(access_token, user_id, profile=None):
+    """Background half of login: refresh the Slack profile if needed and upsert the Users record"""
+    if profile is None:
+        profile = fetch_slack_profile(access_token, user_id)
+        if profile is None:
+            return
+    
+    # Is Admin and Created At are left out so a login never overwrites them
+    record, created = upsert_user_in_airtable({
+        'User ID': profile['id'],
+        'User Name': profile['real_name'],
+        'Email': profile['email'],
+        'Avatar URL': profile['image_192'],
+        'Slack Team ID': profile['team_id'],
+        'Last Login': datetime.now().isoformat()
+    })
+    if record is None:
+        return
+    
+    if created:
+        update_user_in_airtable(record['id'], {
+            'Is Admin': 'false',  # Default to non-admin (string value for Airtable)
+            'Created At': datetime.now().isoformat()
+        })
+        logger.info("Created new user: %s", user_id)
+    else:
+        logger.debug("Updated existing user: %s", user_id)
+    admin_role_cache.set(user_id, 'admin' if admin_flag(record.get('fields', {})) else 'user')
+    user_name_cache.set(user_id, profile['real_name'] or '')
 
 @app.route('/admin')
 @admin_required
 def admin_dashboard():
-    """Admin dashboard home page"""
-    return render_template('admin/dashboard.html')
+    """Admin dashboard home page, starting from the live feed's newest logs"""
+    logs, last_event_id = live_feed.recent_logs()
+    if len(logs) < live_feed.recent_count:
+        # A new or restarted store doesn't hold enough events yet
+        try:
+            records = fetch_recent_logs(live_feed.recent_count)
+        except Exception as e:
+            logger.error("Error fetching recent logs: %s", e)
+            records = None
+        if records:
+            logs = [{
+                'id': record['id'],
+                'user_name': record['fields'].get('User Name'),
+                'project_name': record['fields'].get('Project Name'),
+                'title': record['fields'].get('Title'),
+                'status': record['fields'].get('Status'),
+                'created_at': record['fields'].get('Created At'),
+            } for record in records]
+    return render_template('admin/dashboard.html', hydration={'recentLogs': logs, 'lastEventId': last_event_id})
 
 @app.route('/admin/users')
 @admin_required
@@ -875,25 +1916,75 @@ def admin_users():
     users = get_all_users()
     return render_template('admin/users.html', users=users)
 
+@app.route('/admin/leaderboard')
+@admin_required
+def admin_leaderboard():
+    """Admin page ranking the most active users and projects"""
+    window = request.args.get('window', 'all')
+    metric = request.args.get('by', 'minutes')
+    if window not in WINDOWS:
+        window = 'all'
+    if metric not in METRICS:
+        metric = 'minutes'
+    board = current_leaderboard()
+    users = board.top(window, 'users', metric, 25)
+    projects = board.top(window, 'projects', metric, 25)
+    names = user_names([entry['user_id'] for entry in users + projects])
+    return render_template('admin/leaderboard.html', window=window, metric=metric, windows=list(WINDOWS),
+                           metrics=METRICS, user_names=names, users=users, projects=projects)
+
+@app.route('/admin/search')
+@admin_required
+def admin_search():
+    """Admin log search page"""
+    results, error = None, None
+    if request.args.get('q'):
+        try:
+            results = search_logs(request.args.get('user_id') or None)
+        except ValueError as e:
+            error = str(e)
+    return render_template('admin/search.html', results=results, error=error, args=request.args)
+
+@app.route('/admin/review')
+@admin_required
+def admin_review():
+    """Admin queue of Pending logs with bulk approve/reject"""
+    user_id = request.args.get('user_id', '').strip()
+    project_name = request.args.get('project', '').strip()
+    logs, next_cursor = [], None
+    try:
+        offset = decode_cursor(request.args['cursor'])[0] if request.args.get('cursor') else None
+        page = fetch_records_page(AIRTABLE_TABLE_NAME, review_queue_params(user_id, project_name),
+                                  REVIEW_PAGE_SIZE, offset)
+        if page is None:
+            flash('Failed to fetch pending logs', 'error')
+        else:
+            logs, next_offset = page
+            next_cursor = encode_cursor(next_offset, REVIEW_PAGE_SIZE) if next_offset else None
+    except ValueError as e:
+        flash(str(e), 'error')
+    return render_template('admin/review.html', logs=logs, next_cursor=next_cursor, user_id=user_id,
+                           project_name=project_name, max_records=REVIEW_MAX_RECORDS)
+
 @app.route('/admin/users/<record_id>/projects')
 @admin_required
 def admin_user_projects(record_id):
     """Admin user projects page"""
     try:
-        user_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
+        user_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        user_response = requests.get(user_url, headers=headers)
+        user_response = upstream.get(user_url, headers=headers)
         
         if user_response.status_code != 200:
-            logger.error(f"Failed to fetch user: {user_response.text}")
+            logger.error("Failed to fetch user: %s", user_response.text)
             flash('User not found', 'error')
             return redirect(url_for('admin_users'))
         
         user_data = user_response.json()
         user_name = user_data['fields']['User Name']
         
-        projects_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
+        projects_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
         
         params = {
             'filterByFormula': f"{{User Name}} = '{user_name}'",
@@ -901,18 +1992,18 @@ def admin_user_projects(record_id):
             'sort[0][direction]': 'desc'
         }
         
-        projects_response = requests.get(projects_url, headers=headers, params=params)
+        projects_response = upstream.get(projects_url, headers=headers, params=params)
         
         if projects_response.status_code == 200:
             projects_data = projects_response.json()
             projects = projects_data.get('records', [])
             return render_template('admin/user_projects.html', user=user_data, projects=projects)
         else:
-            logger.error(f"Airtable projects fetch failed: {projects_response.text}")
+            logger.error("Airtable projects fetch failed: %s", projects_response.text)
             flash('Failed to fetch user projects', 'warning')
             return render_template('admin/user_projects.html', user=user_data, projects=[])
     except Exception as e:
-        logger.error(f"Error fetching user projects: {str(e)}")
+        logger.error("Error fetching user projects: %s", e)
         flash('An error occurred while fetching user projects', 'error')
         return redirect(url_for('admin_users'))
 
@@ -925,7 +2016,7 @@ def admin_toggle_user_admin(record_id):
         
         is_admin_str = 'true' if is_admin_value == 'True' else 'false'
         
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_USERS_TABLE}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -937,16 +2028,21 @@ def admin_toggle_user_admin(record_id):
             }
         }
         
-        response = requests.patch(url, headers=headers, json=update_payload)
+        response = upstream.patch(url, headers=headers, json=update_payload)
         
         if response.status_code == 200:
+            # Propagate immediately: every worker reads roles from the shared cache
+            updated_user = response.json()
+            user_id = updated_user.get('fields', {}).get('User ID')
+            if user_id:
+                admin_role_cache.set(user_id, 'admin' if is_admin_str == 'true' else 'user')
             flash('User admin status updated successfully', 'success')
         else:
-            logger.error(f"Airtable user update failed: {response.text}")
+            logger.error("Airtable user update failed: %s", response.text)
             flash('Failed to update user admin status', 'error')
             
     except Exception as e:
-        logger.error(f"Error updating user admin status: {str(e)}")
+        logger.error("Error updating user admin status: %s", e)
         flash('An error occurred while updating user admin status', 'error')
         
     return redirect(url_for('admin_users'))
@@ -956,22 +2052,22 @@ def admin_toggle_user_admin(record_id):
 def admin_projects():
     """Admin projects management page"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code == 200:
             data = response.json()
             projects = data.get('records', [])
             return render_template('admin/projects.html', projects=projects)
         else:
-            logger.error(f"Airtable projects fetch failed: {response.text}")
+            logger.error("Airtable projects fetch failed: %s", response.text)
             flash('Failed to fetch projects', 'error')
             return render_template('admin/projects.html', projects=[])
             
     except Exception as e:
-        logger.error(f"Error fetching projects: {str(e)}")
+        logger.error("Error fetching projects: %s", e)
         flash('An error occurred while fetching projects', 'error')
         return render_template('admin/projects.html', projects=[])
 
@@ -980,20 +2076,20 @@ def admin_projects():
 def admin_project_detail(record_id):
     """Admin project detail page"""
     try:
-        project_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
+        project_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        project_response = requests.get(project_url, headers=headers)
+        project_response = upstream.get(project_url, headers=headers)
         
         if project_response.status_code != 200:
-            logger.error(f"Failed to fetch project: {project_response.text}")
+            logger.error("Failed to fetch project: %s", project_response.text)
             flash('Project not found', 'error')
             return redirect(url_for('admin_projects'))
         
         project_data = project_response.json()
         project_name = project_data['fields']['Project Name']
         
-        logs_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+        logs_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         
         params = {
             'filterByFormula': f"{{Project Name}} = '{project_name}'",
@@ -1001,18 +2097,18 @@ def admin_project_detail(record_id):
             'sort[0][direction]': 'desc'
         }
         
-        logs_response = requests.get(logs_url, headers=headers, params=params)
+        logs_response = upstream.get(logs_url, headers=headers, params=params)
         
         if logs_response.status_code == 200:
             logs_data = logs_response.json()
             logs = logs_data.get('records', [])
             return render_template('admin/project_detail.html', project=project_data, logs=logs)
         else:
-            logger.error(f"Airtable logs fetch failed: {logs_response.text}")
+            logger.error("Airtable logs fetch failed: %s", logs_response.text)
             flash('Failed to fetch project logs', 'warning')
             return render_template('admin/project_detail.html', project=project_data, logs=[])
     except Exception as e:
-        logger.error(f"Error fetching project details: {str(e)}")
+        logger.error("Error fetching project details: %s", e)
         flash('An error occurred while fetching project details', 'error')
         return redirect(url_for('admin_projects'))
 
@@ -1021,73 +2117,276 @@ def admin_project_detail(record_id):
 def api_admin_project_log_count(project_id):
     """API endpoint to get the count of logs for a specific project."""
     try:
-        logs_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        project_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{project_id}"
-        project_response = requests.get(project_url, headers=headers)
+        project_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{project_id}"
+        project_response = upstream.get(project_url, headers=headers)
         
         if project_response.status_code != 200:
-            logger.error(f"Failed to fetch project: {project_response.text}")
+            logger.error("Failed to fetch project: %s", project_response.text)
             return jsonify({'count': 0})
         
         project_data = project_response.json()
         project_name = project_data['fields']['Project Name']
         
-        params = {
-            'filterByFormula': f"{{Project Name}} = '{project_name}'"
-        }
-        
-        logs_response = requests.get(logs_url, headers=headers, params=params)
+        user_id = project_data['fields'].get('User ID', '')
+        if log_aggregates.is_ready():
+            return jsonify({'count': log_aggregates.get(user_id, project_name)['log_count']})
         
-        if logs_response.status_code == 200:
-            logs_data = logs_response.json()
-            logs = logs_data.get('records', [])
-            return jsonify({'count': len(logs)})
-        else:
-            logger.error(f"Airtable logs fetch failed: {logs_response.text}")
+        # Same scope as the aggregates: the owner's logs with the project's name, every page
+        logs = fetch_all_records(AIRTABLE_TABLE_NAME, {
+            'filterByFormula': project_name_formula(user_id, project_name),
+            'fields[]': ['User ID'],
+        })
+        if logs is None:
             return jsonify({'count': 0})
+        return jsonify({'count': len(logs)})
             
     except Exception as e:
-        logger.error(f"Error fetching log count: {str(e)}")
+        logger.error("Error fetching log count: %s", e)
         return jsonify({'count': 0})
 
+@app.route('/api/admin/users/<user_id>/stats', methods=['GET'])
+@admin_required
+def api_admin_user_stats(user_id):
+    """Log aggregates for any user and their projects"""
+    try:
+        return jsonify(log_aggregates.for_user(user_id))
+    except Exception as e:
+        logger.error("Error reading user stats: %s", e)
+        return jsonify({"success": False, "message": "Failed to read stats"}), 500
+
+@app.route('/api/admin/analytics', methods=['GET'])
+@admin_required
+def api_admin_analytics():
+    """Activity analytics across all users, or for `?user_id=`"""
+    try:
+        result = load_analytics(request.args.get('user_id') or None)
+        if result is None:
+            return jsonify({"success": False, "message": "Failed to load logs"}), 500
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error computing analytics: %s", e)
+        return jsonify({"success": False, "message": "Failed to compute analytics"}), 500
+
+@app.route('/api/admin/leaderboard', methods=['GET'])
+@admin_required
+def api_admin_leaderboard():
+    """Top `k` users and projects by minutes or log count, all time or over a rolling window"""
+    try:
+        window = request.args.get('window', 'all')
+        metric = request.args.get('by', 'minutes')
+        kinds = [request.args['kind']] if request.args.get('kind') else list(KINDS)
+        if window not in WINDOWS or metric not in METRICS or any(kind not in KINDS for kind in kinds):
+            return jsonify({"success": False, "message": f"window must be one of {', '.join(WINDOWS)}, "
+                                                         f"by one of {', '.join(METRICS)} and kind one of {', '.join(KINDS)}"}), 400
+        k = bounded_int_arg('k', 10, LEADERBOARD_DEPTH)
+        board = current_leaderboard()
+        return jsonify({'window': window, 'by': metric,
+                        **{kind: board.top(window, kind, metric, k) for kind in kinds}})
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error reading leaderboard: %s", e)
+        return jsonify({"success": False, "message": "Failed to read leaderboard"}), 500
+
+@app.route('/api/admin/search', methods=['GET'])
+@admin_required
+def api_admin_search():
+    """Full-text search over everyone's logs, optionally filtered by `user_id`"""
+    try:
+        return jsonify(search_logs(request.args.get('user_id') or None))
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error searching logs: %s", e)
+        return jsonify({"success": False, "message": "Search failed"}), 500
+
+@app.route('/api/admin/review', methods=['POST'])
+@admin_required
+def api_admin_review():
+    """Queue a status change for many logs; returns the job to poll"""
+    try:
+        data = request.get_json(silent=True) or {}
+        record_ids = data.get('record_ids')
+        status = data.get('status')
+        if status not in LOG_STATUSES:
+            return jsonify({"success": False, "message": f"status must be one of {', '.join(LOG_STATUSES)}"}), 400
+        if not isinstance(record_ids, list) or not record_ids or not all(isinstance(r, str) and r for r in record_ids):
+            return jsonify({"success": False, "message": "record_ids must be a non-empty list of log IDs"}), 400
+        if len(record_ids) > REVIEW_MAX_RECORDS:
+            return jsonify({"success": False, "message": f"At most {REVIEW_MAX_RECORDS} logs per request"}), 413
+        
+        job_id = batch_writer.enqueue('review', AIRTABLE_TABLE_NAME,
+                                      {record_id: {'Status': status} for record_id in record_ids},
+                                      created_by=session['user_id'])
+        return jsonify({"success": True, "job": batch_writer.job(job_id)}), 202
+    except Exception as e:
+        logger.error("Error queueing review: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+@app.route('/api/admin/import', methods=['POST'])
+@admin_required
+def api_admin_import():
+    """
+    Bulk-create or update logs and projects from CSV or NDJSON (an uploaded `file` or the
+    request body). Everything is validated first; `?dry_run=1` stops there.
+    """
+    try:
+        upload = request.files.get('file')
+        if upload is not None:
+            data = upload.read().decode('utf-8-sig')
+            fmt = request.args.get('format') or bulk_import.detect_format(upload.filename, upload.mimetype)
+        else:
+            data = request.get_data(as_text=True)
+            fmt = request.args.get('format') or bulk_import.detect_format(content_type=request.content_type)
+        
+        operations, errors = bulk_import.validate(data, fmt)
+        if errors:
+            return jsonify({"success": False, "message": f"{len(errors)} problem(s) found; nothing was imported",
+                            "errors": errors[:100]}), 400
+        counts = [{'table': table, 'op': op, 'count': len(items)} for (table, op), items in sorted(operations.items())]
+        if request.args.get('dry_run') in ('1', 'true'):
+            return jsonify({"success": True, "dry_run": True, "operations": counts})
+        
+        job_ids = queue_import(operations, session['user_id'])
+        return jsonify({"success": True, "operations": counts, "jobs": [batch_writer.job(job_id) for job_id in job_ids]}), 202
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error importing records: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+@app.route('/api/admin/cleanup/orphans', methods=['POST'])
+@admin_required
+def api_admin_cleanup_orphans():
+    """
+    Find logs left behind by deleted projects. Only previews what was found unless sent
+    {"confirm": true}; then they are queued for batched deletion and the tombstones dropped.
+    {"scope": "unmatched"} looks at every log whose project name its owner doesn't use; those
+    can include renamed projects' logs, so confirming deletes only the groups listed back
+    from the preview as "projects".
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        scope = data.get('scope', 'deleted')
+        if scope not in ('deleted', 'unmatched'):
+            return jsonify({"success": False, "message": "scope must be 'deleted' or 'unmatched'"}), 400
+        orphans, tombstones = find_orphaned_logs(unmatched=scope == 'unmatched')
+        if orphans is None:
+            return jsonify({"success": False, "message": "Failed to list projects and logs"}), 500
+        confirmed = data.get('confirm') and request.args.get('dry_run') not in ('1', 'true')
+        if confirmed and scope == 'unmatched':
+            reviewed = data.get('projects')
+            if not isinstance(reviewed, list) or not reviewed:
+                return jsonify({"success": False, "message": "List the reviewed groups to delete in 'projects'"}), 400
+            selected = {(item.get('user_id'), item.get('project_name')) for item in reviewed if isinstance(item, dict)}
+            orphans = {key: group for key, group in orphans.items() if key in selected}
+            tombstones = {key: record_ids for key, record_ids in tombstones.items() if key in selected}
+        logs = [log for group in orphans.values() for log in group]
+        found = sorted(({'user_id': user_id, 'project_name': project_name, 'count': len(group)}
+                        for (user_id, project_name), group in orphans.items()), key=lambda item: -item['count'])
+        if not confirmed:
+            return jsonify({"success": True, "dry_run": True, "scope": scope, "total": len(logs), "projects": found,
+                            "job": None})
+        
+        job_id = queue_log_deletion('orphan-cleanup', logs, session['user_id']) if logs else None
+        record_changes.forget_deleted_projects([record_id for record_ids in tombstones.values() for record_id in record_ids])
+        if job_id is None:
+            return jsonify({"success": True, "dry_run": False, "scope": scope, "total": 0, "projects": [], "job": None})
+        return jsonify({"success": True, "dry_run": False, "scope": scope, "total": len(logs), "projects": found,
+                        "job": batch_writer.job(job_id)}), 202
+    except Exception as e:
+        logger.error("Error cleaning up orphaned logs: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+@app.route('/api/admin/jobs/<int:job_id>', methods=['GET'])
+@admin_required
+def api_admin_job(job_id):
+    """Progress and throughput of a queued batch write (review or import)"""
+    try:
+        job = batch_writer.job(job_id)
+        if job is None:
+            return jsonify({"success": False, "message": "Job not found"}), 404
+        return jsonify(job)
+    except Exception as e:
+        logger.error("Error reading job: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+@app.route('/api/admin/aggregates/reconcile', methods=['POST'])
+@admin_required
+def api_admin_reconcile_aggregates():
+    """Rebuild the log aggregates from Airtable now"""
+    try:
+        if log_aggregates.run_reconciliation(fetch_logs_for_aggregates, force=True):
+            return jsonify({"success": True, "message": "Aggregates reconciled"})
+        return jsonify({"success": False, "message": "Failed to list logs"}), 500
+    except Exception as e:
+        logger.error("Error reconciling aggregates: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+def fetch_recent_logs(count=10):
+    """The newest logs from Airtable; None on failure"""
+    url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+    headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+    
+    params = {
+        'sort[0][field]': 'Created At',
+        'sort[0][direction]': 'desc',
+        'maxRecords': count
+    }
+    
+    response = upstream.get(url, headers=headers, params=params)
+    
+    if response.status_code == 200:
+        return response.json().get('records', [])
+    logger.error("Airtable fetch failed: %s", response.text)
+    return None
+
 @app.route('/api/admin/recent-logs', methods=['GET'])
 @admin_required
 def api_admin_recent_logs():
     """API endpoint to get recent logs for the admin dashboard."""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-        
-        params = {
-            'sort[0][field]': 'Created At',
-            'sort[0][direction]': 'desc',
-            'maxRecords': 10
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            return jsonify(data.get('records', []))
-        else:
-            logger.error(f"Airtable fetch failed: {response.text}")
-            return jsonify([])
-            
+        return jsonify(fetch_recent_logs() or [])
     except Exception as e:
-        logger.error(f"Error fetching recent logs: {str(e)}")
+        logger.error("Error fetching recent logs: %s", e)
         return jsonify([])
 
+@app.route('/api/admin/live')
+@admin_required
+def api_admin_live():
+    """Server-Sent Events stream of new logs and status changes for the admin dashboard"""
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id', ''))
+    except ValueError:
+        last_event_id = None
+    subscriber = live_feed.subscribe()
+    if subscriber is None:
+        # Every stream holds a thread, so a full worker turns new ones away rather than starve other requests
+        response = Response(f"retry: {FULL_RETRY_AFTER * 1000}\n\n", status=503, mimetype='text/event-stream')
+        response.headers['Retry-After'] = str(FULL_RETRY_AFTER)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    response = Response(live_feed.stream(subscriber, last_event_id), mimetype='text/event-stream')
+    # Also when the stream is closed before it starts
+    response.call_on_close(lambda: live_feed.unsubscribe(subscriber))
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx and similar proxies from holding events back in their buffers
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/admin/logs/<record_id>', methods=['GET'])
 @admin_required
 def admin_log_detail(record_id):
     """Admin log detail page"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        response = requests.get(url, headers=headers)
+        response = upstream.get(url, headers=headers)
         
         if response.status_code == 200:
             log_data = response.json()
@@ -1115,24 +2414,18 @@ def admin_log_detail(record_id):
             if 'Media URL' in log_data['fields'] and log_data['fields']['Media URL'] and 'Media' not in log_data['fields']:
                 media_url = log_data['fields']['Media URL']
                 log_data['fields']['Media'] = [{'url': media_url, 'filename': 'media.jpg'}]
-                logger.info(f"Added Media field from Media URL: {media_url}")
+                logger.debug("Added Media field from Media URL: %s", media_url)
             
-            logger.info(f"Log data fields: {log_data['fields'].keys()}")
-            if 'Media' in log_data['fields']:
-                logger.info(f"Media field: {log_data['fields']['Media']}")
-            if 'Media URL' in log_data['fields']:
-                logger.info(f"Media URL field: {log_data['fields']['Media URL']}")
-                
-            logger.info(f"Complete log data: {log_data}")
+            logger.debug("Complete log data: %s", log_data)
             
             return render_template('admin/log_detail.html', log=log_data, project_name=project_name, project_id=project_id)
         else:
-            logger.error(f"Airtable fetch failed: {response.text}")
+            logger.error("Airtable fetch failed: %s", response.text)
             flash('Log not found', 'error')
             return redirect(url_for('admin_dashboard'))
             
     except Exception as e:
-        logger.error(f"Error fetching log: {str(e)}")
+        logger.error("Error fetching log: %s", e)
         flash('An error occurred while fetching log details', 'error')
         return redirect(url_for('admin_dashboard'))
 
@@ -1141,7 +2434,7 @@ def admin_log_detail(record_id):
 def admin_update_log(record_id):
     """Update log status as admin"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -1159,18 +2452,19 @@ def admin_update_log(record_id):
             }
         }
         
-        update_response = requests.patch(url, headers=headers, json=update_payload)
+        update_response = upstream.patch(url, headers=headers, json=update_payload)
         
         if update_response.status_code == 200:
+            track_change(AIRTABLE_TABLE_NAME, update_response.json())
             flash('Log updated successfully', 'success')
             return redirect(url_for('admin_log_detail', record_id=record_id))
         else:
-            logger.error(f"Airtable update failed: {update_response.text}")
+            logger.error("Airtable update failed: %s", update_response.text)
             flash('Failed to update log', 'error')
             return redirect(url_for('admin_log_detail', record_id=record_id))
             
     except Exception as e:
-        logger.error(f"Error updating log: {str(e)}")
+        logger.error("Error updating log: %s", e)
         flash('An error occurred while updating log', 'error')
         return redirect(url_for('admin_log_detail', record_id=record_id))
 
@@ -1179,7 +2473,7 @@ def admin_update_log(record_id):
 def admin_update_log_time(record_id):
     """Update log time spent as admin"""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{record_id}"
         headers = {
             'Authorization': f'Bearer {AIRTABLE_API_KEY}',
             'Content-Type': 'application/json'
@@ -1205,26 +2499,76 @@ def admin_update_log_time(record_id):
             }
         }
         
-        update_response = requests.patch(url, headers=headers, json=update_payload)
+        update_response = upstream.patch(url, headers=headers, json=update_payload)
         
         if update_response.status_code == 200:
+            track_change(AIRTABLE_TABLE_NAME, update_response.json())
             flash('Log time updated successfully', 'success')
             return redirect(url_for('admin_log_detail', record_id=record_id))
         else:
-            logger.error(f"Airtable update failed: {update_response.text}")
+            logger.error("Airtable update failed: %s", update_response.text)
             flash('Failed to update log time', 'error')
             return redirect(url_for('admin_log_detail', record_id=record_id))
             
     except Exception as e:
-        logger.error(f"Error updating log time: {str(e)}")
+        logger.error("Error updating log time: %s", e)
         flash('An error occurred while updating log time', 'error')
         return redirect(url_for('admin_log_detail', record_id=record_id))
 
+@app.route('/admin/profiles')
+@admin_required
+def admin_profiles():
+    """List saved request profiles"""
+    profiles = profiling.list_profiles(PROFILE_DIR)
+    for profile in profiles:
+        profile['modified_at'] = datetime.fromtimestamp(profile['modified']).strftime('%Y-%m-%d %H:%M:%S')
+    return render_template('admin/profiles.html', profiles=profiles, sample_rate=PROFILE_SAMPLE_RATE)
+
+@app.route('/admin/profiles/<name>')
+@admin_required
+def admin_profile_detail(name):
+    """Show a saved profile as a pstats or sampled-stack report"""
+    path = profiling.profile_path(PROFILE_DIR, name)
+    if not path:
+        flash('Profile not found', 'error')
+        return redirect(url_for('admin_profiles'))
+    
+    sort = request.args.get('sort', 'cumulative')
+    if sort not in ('cumulative', 'tottime', 'ncalls'):
+        sort = 'cumulative'
+    
+    try:
+        report = profiling.render_profile(path, sort=sort)
+    except Exception as e:
+        logger.error("Error reading profile %s: %s", name, e)
+        flash('Could not read profile', 'error')
+        return redirect(url_for('admin_profiles'))
+    
+    return render_template('admin/profile_detail.html', name=name, report=report, sort=sort)
+
+@app.route('/admin/profiles/<name>/download')
+@admin_required
+def admin_profile_download(name):
+    """Download the raw .pstats or .collapsed file"""
+    path = profiling.profile_path(PROFILE_DIR, name)
+    if not path:
+        return "Profile not found", 404
+    return send_file(path, as_attachment=True, download_name=name)
+
 @app.route('/')
 def index():
     if 'user_id' not in session:
         return render_template('landing.html')
-    return render_template('dashboard.html', user=session)
+    
+    hydration = {}
+    try:
+        page = load_user_projects_page(DASHBOARD_PAGE_SIZE, DASHBOARD_PROJECT_FIELDS)
+        if page is not None:
+            hydration['projectsPage'] = page
+    except Exception as e:
+        logger.error("Error loading dashboard data: %s", e)
+    return render_template('dashboard.html', user=session, hydration=hydration,
+                           page_size=DASHBOARD_PAGE_SIZE, project_fields=DASHBOARD_PROJECT_FIELDS)
 
 @app.route('/settings')
 @login_required
@@ -1244,9 +2588,7 @@ def save_settings():
     use_static_props_value = request.form.get('use_static_props', 'off')
     use_static_props = (use_static_props_value == 'on')
     
-    logger.info(f"Form data: {dict(request.form)}")
-    logger.info(f"use_static_props value: {use_static_props_value}")
-    logger.info(f"use_static_props boolean: {use_static_props}")
+    logger.debug("Settings form: %s (use_static_props=%s)", request.form, use_static_props)
     
     current_settings = get_user_settings(session['user_id'])
     last_refreshed = current_settings.get('last_refreshed')
@@ -1259,7 +2601,7 @@ def save_settings():
         'last_refreshed': last_refreshed
     }
     
-    logger.info(f"Settings to save: {settings}")
+    logger.debug("Settings to save: %s", settings)
     
     success = save_user_settings(session['user_id'], settings)
     
@@ -1270,15 +2612,33 @@ def save_settings():
     
     return redirect(url_for('settings_page'))
 
+def refresh_session_cache(key, table_name):
+    """Bring a session record cache up to date with a delta; drop it when that isn't possible"""
+    cached = session.get(key)
+    token = session.get(f'{key}_token')
+    if cached is None or token is None:
+        session.pop(key, None)
+        return
+    try:
+        since_seq, since_time = parse_since(token)
+        sync_token = record_changes.issue_token()
+        delta = load_delta(table_name, user_list_params(), since_seq, since_time)
+    except ValueError:
+        delta = None
+    if delta is None:
+        session.pop(key, None)
+        return
+    session[key] = merge_delta(cached, delta)
+    session[f'{key}_token'] = sync_token
+    logger.info("Refreshed %s with %d changed and %d deleted records", key, len(delta['records']), len(delta['deleted']))
+
 @app.route('/settings/refresh-data', methods=['POST'])
 @login_required
 def refresh_data():
     """Refresh data from Airtable and update last_refreshed timestamp"""
     try:
-        if 'projects_cache' in session:
-            session.pop('projects_cache')
-        if 'logs_cache' in session:
-            session.pop('logs_cache')
+        refresh_session_cache('projects_cache', AIRTABLE_PROJECTS_TABLE)
+        refresh_session_cache('logs_cache', AIRTABLE_TABLE_NAME)
         
         current_settings = get_user_settings(session['user_id'])
         current_settings['last_refreshed'] = datetime.now().isoformat()
@@ -1290,7 +2650,7 @@ def refresh_data():
         else:
             return jsonify({"success": False, "message": "Failed to update refresh timestamp"}), 500
     except Exception as e:
-        logger.error(f"Error refreshing data: {str(e)}")
+        logger.error("Error refreshing data: %s", e)
         return jsonify({"success": False, "message": "An error occurred while refreshing data"}), 500
 
 @app.route('/login')
@@ -1309,7 +2669,7 @@ def auth_callback():
         return redirect(url_for('login'))
     
     try:
-        response = requests.post('https://slack.com/api/oauth.v2.access', data={
+        response = upstream.post('https://slack.com/api/oauth.v2.access', data={
             'client_id': SLACK_CLIENT_ID,
             'client_secret': SLACK_CLIENT_SECRET,
             'code': code,
@@ -1320,48 +2680,25 @@ def auth_callback():
         
         if auth_data.get('ok'):
             user_id = auth_data['authed_user']['id']
+            access_token = auth_data['access_token']
+            
+            # A cached profile skips users.info; it is refreshed in the background instead
+            cached_profile = slack_profile_cache.get(user_id)
+            metrics.record_cache_lookup('slack_profile', cached_profile is not None)
+            if cached_profile:
+                slack_user = cached_profile
+                run_in_background(sync_user_profile, access_token, user_id)
+            else:
+                slack_user = fetch_slack_profile(access_token, user_id)
+                if slack_user:
+                    run_in_background(sync_user_profile, access_token, user_id, slack_user)
             
-            user_info_response = requests.get(
-                'https://slack.com/api/users.info',
-                headers={'Authorization': f'Bearer {auth_data["access_token"]}'},
-                params={'user': user_id}
-            )
-            
-            user_info = user_info_response.json()
-            
-            if user_info.get('ok'):
-                slack_user = user_info['user']
+            if slack_user:
+                if hasattr(session, 'regenerate'):
+                    session.regenerate()
                 session['user_id'] = slack_user['id']
                 session['user_name'] = slack_user['real_name']
-                session['access_token'] = auth_data['access_token']
-                
-                existing_user = get_user_from_airtable(slack_user['id'])
-                
-                if not existing_user:
-                    user_data = {
-                        'User ID': slack_user['id'],
-                        'User Name': slack_user['real_name'],
-                        'Email': slack_user.get('profile', {}).get('email', ''),
-                        'Avatar URL': slack_user.get('profile', {}).get('image_192', ''),
-                        'Slack Team ID': slack_user.get('team_id', ''),
-                        'Is Admin': 'false',  # Default to non-admin (string value for Airtable)
-                        'Created At': datetime.now().isoformat()
-                    }
-                    save_user_to_airtable(user_data)
-                    logger.info(f"Created new user: {slack_user['id']}")
-                else:
-                    record_id = existing_user['id']
-                    user_data = {
-                        'User Name': slack_user['real_name'],
-                        'Email': slack_user.get('profile', {}).get('email', ''),
-                        'Avatar URL': slack_user.get('profile', {}).get('image_192', ''),
-                        'Last Login': datetime.now().isoformat()
-                    }
-                    update_user_in_airtable(record_id, user_data)
-                    logger.info(f"Updated existing user: {slack_user['id']}")
-                    
-                    admin_value = existing_user.get('fields', {}).get('Is Admin', 'false')
-                    session['is_admin'] = admin_value == True or admin_value == 'true'
+                session['access_token'] = access_token
                 
                 flash(f'Welcome, {session["user_name"]}!', 'success')
                 return redirect(url_for('index'))
@@ -1370,7 +2707,7 @@ def auth_callback():
         return redirect(url_for('login'))
         
     except Exception as e:
-        logger.error(f"Auth callback error: {str(e)}")
+        logger.error("Auth callback error: %s", e)
         flash('Authentication error. Please try again.', 'error')
         return redirect(url_for('login'))
 
@@ -1378,6 +2715,8 @@ def auth_callback():
 @login_required
 def logout():
     session.clear()
+    if hasattr(session, 'regenerate'):
+        session.regenerate()
     flash('You have been logged out.', 'info')
     return redirect(url_for('login'))
 
@@ -1411,10 +2750,7 @@ def create_log():
                         temp_file_path = temp_file.name
                     
                     try:
-                        media_url = upload_file_to_cdn_alternative(temp_file_path)
-                        
-                        if not media_url:
-                            media_url = upload_to_hackclub_cdn(temp_file_path)
+                        media_url = upload_media_file(temp_file_path)
                         
                         if not media_url:
                             flash('Failed to upload media file. Continuing without media.', 'warning')
@@ -1453,7 +2789,7 @@ def create_log():
                 flash('Error saving dev log. Please try again.', 'error')
                 
         except Exception as e:
-            logger.error(f"Error creating log: {str(e)}")
+            logger.error("Error creating log: %s", e)
             flash('Error creating dev log. Please try again.', 'error')
     
     return render_template('create_log.html', project_name=project_name, project_tag=project_tag)
@@ -1469,54 +2805,244 @@ def edit_log():
         
     return render_template('edit_log.html')
 
+@app.route('/api/stats')
+@login_required
+def get_stats():
+    """Current user's log aggregates: totals and per-project"""
+    try:
+        return jsonify(log_aggregates.for_user(session['user_id']))
+    except Exception as e:
+        logger.error("Error reading stats: %s", e)
+        return jsonify({"success": False, "message": "Failed to read stats"}), 500
+
+@app.route('/api/analytics')
+@login_required
+def get_analytics():
+    """Current user's activity: minutes per day/week, weekday x hour heatmap, streaks and status trends"""
+    try:
+        result = load_analytics(session['user_id'])
+        if result is None:
+            return jsonify({"success": False, "message": "Failed to load logs"}), 500
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error computing analytics: %s", e)
+        return jsonify({"success": False, "message": "Failed to compute analytics"}), 500
+
+@app.route('/api/search')
+@login_required
+def get_search():
+    """Full-text search over the current user's logs"""
+    try:
+        return jsonify(search_logs(session['user_id']))
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        logger.error("Error searching logs: %s", e)
+        return jsonify({"success": False, "message": "Search failed"}), 500
+
+@app.route('/api/jobs/<int:job_id>')
+@login_required
+def get_job(job_id):
+    """Progress of a background job the current user started (e.g. removing a deleted project's logs)"""
+    try:
+        job = batch_writer.job(job_id)
+        if job is None or job['created_by'] != session['user_id']:
+            return jsonify({"success": False, "message": "Job not found"}), 404
+        return jsonify(job)
+    except Exception as e:
+        logger.error("Error reading job: %s", e)
+        return jsonify({"success": False, "message": "An error occurred"}), 500
+
+@app.route('/api/projects/<project_id>/stats')
+@login_required
+def get_project_stats(project_id):
+    """Log aggregates for one of the current user's projects"""
+    try:
+        project_data, status = fetch_project(project_id)
+        if status != 200:
+            return jsonify({"success": False, "message": "Unauthorized" if status == 403 else "Project not found"}), status
+        return jsonify(log_aggregates.get(session['user_id'], project_data['fields'].get('Project Name', '')))
+    except Exception as e:
+        logger.error("Error reading project stats: %s", e)
+        return jsonify({"success": False, "message": "Failed to read stats"}), 500
+
 @app.route('/api/projects/<project_id>/logs')
 @login_required
 def get_project_logs(project_id):
     try:
-        logger.info(f"Fetching logs for project ID: {project_id}")
+        logger.debug("Fetching logs for project ID: %s", project_id)
         
-        project_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}/{project_id}"
-        headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+        query = parse_list_query()
+        project_data, status = fetch_project(project_id)
         
-        project_response = requests.get(project_url, headers=headers)
-        
-        if project_response.status_code != 200:
-            logger.error(f"Failed to fetch project: {project_response.text}")
+        if status != 200:
             return jsonify([])
         
-        project_data = project_response.json()
         project_name = project_data['fields']['Project Name']
-        logger.info(f"Project name: {project_name}")
-        
-        logs_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
-        
-        params = {
-            'filterByFormula': f"AND({{User ID}} = '{session['user_id']}', {{Project Name}} = '{project_name}', {{What I Did}} != '')",
-            'sort[0][field]': 'Created At',
-            'sort[0][direction]': 'desc'
-        }
-        
-        logger.info(f"Filter formula: {params['filterByFormula']}")
-        
-        logs_response = requests.get(logs_url, headers=headers, params=params)
-        
-        if logs_response.status_code == 200:
-            data = logs_response.json()
-            logger.info(f"Found {len(data['records'])} logs for project {project_name}")
-            
-            return jsonify(data['records'])
-        else:
-            logger.error(f"Airtable logs fetch failed: {logs_response.text}")
-            return jsonify([])
-            
+        if 'since' in request.args:
+            return sync_response(AIRTABLE_TABLE_NAME, project_logs_params(project_name))
+        if query is not None:
+            return list_query_response(query, query_records(AIRTABLE_TABLE_NAME, project_logs_params(project_name), query))
+        
+        sync_token = record_changes.issue_token()
+        records = load_project_logs(project_name)
+        return with_sync_token(conditional_json(records), sync_token) if records is not None else jsonify([])
+    
+    except ExpiredToken as e:
+        return jsonify({"success": False, "message": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error fetching project logs: {str(e)}")
+        logger.error("Error fetching project logs: %s", e)
         return jsonify([])
 
+def load_project_logs(project_name):
+    """Current user's logs for the named project, newest first. Returns None on failure."""
+    params = project_logs_params(project_name)
+    logger.debug("Filter formula: %s", params['filterByFormula'])
+    
+    records = fetch_all_records(AIRTABLE_TABLE_NAME, params)
+    if records is not None:
+        logger.debug("Found %d logs for project %s", len(records), project_name)
+    return records
+
+def project_logs_params(project_name):
+    return user_list_params(f"{{Project Name}} = '{project_name}', {{What I Did}} != ''")
+
+def load_project_page(project_id):
+    """
+    Project and its logs for server-side hydration. When the project's name is already
+    known the two Airtable calls run concurrently; the name is re-checked afterwards.
+    """
+    cached_name = project_name_cache.get(project_id)
+    if cached_name:
+        results = run_concurrently({
+            'project': (fetch_project, project_id),
+            'logs': (load_project_logs, cached_name),
+        })
+        project, status = results['project']
+        logs = results['logs']
+    else:
+        project, status = fetch_project(project_id)
+        logs = None
+    
+    if status != 200:
+        return {}
+    
+    project_name = project['fields'].get('Project Name', '')
+    if not cached_name or cached_name != project_name:
+        logs = load_project_logs(project_name)
+    
+    hydration = {'project': project}
+    if logs is not None:
+        hydration['logs'] = logs
+    return hydration
+
+# Idempotent JSON GET routes /api/batch may run; anything else (streams, downloads, writes) is refused
+BATCHABLE_ENDPOINTS = frozenset({
+    'get_logs', 'get_log', 'get_projects', 'get_project', 'get_project_stats', 'get_project_logs',
+    'get_stats', 'get_analytics', 'get_search', 'get_job',
+    'api_admin_project_log_count', 'api_admin_user_stats', 'api_admin_analytics', 'api_admin_leaderboard',
+    'api_admin_search', 'api_admin_job', 'api_admin_recent_logs',
+})
+
+def batchable(path):
+    """Whether `path` resolves to a GET route in BATCHABLE_ENDPOINTS"""
+    parsed = urlparse(path)
+    if parsed.scheme or parsed.netloc:
+        return False
+    try:
+        endpoint, _ = app.create_url_adapter(request).match(parsed.path, method='GET')
+    except HTTPException:
+        return False
+    return endpoint in BATCHABLE_ENDPOINTS
+
+def dispatch_subrequest(path, if_none_match, base_url, sub_session):
+    """
+    Run one GET API route for /api/batch in its own request context, with the batch request's
+    before/after hooks and a detached copy of its session (merged back by the caller).
+    Returns (status, etag, body, Server-Timing entries).
+    """
+    headers = {'Accept': 'application/json'}
+    if if_none_match:
+        headers['If-None-Match'] = if_none_match
+    environ = EnvironBuilder(path=path, method='GET', base_url=base_url, headers=headers).get_environ()
+    ctx = app.request_context(environ)
+    ctx.session = sub_session
+    with ctx:
+        try:
+            response = app.full_dispatch_request()
+        except Exception as e:
+            logger.error("Batch sub-request %s failed: %s", path, e)
+            return 500, None, {"success": False, "message": "Internal error"}, None
+        body = response.get_json(silent=True) if response.is_json and response.status_code != 304 else None
+        return response.status_code, response.get_etag()[0], body, g.get('server_timing')
+
+@app.route('/api/batch', methods=['POST'])
+@login_required
+def api_batch():
+    """Run several read-only API GETs in one round trip, fetching from upstream concurrently"""
+    try:
+        data = request.get_json(silent=True) or {}
+        subrequests = data.get('requests')
+        if not isinstance(subrequests, list) or not subrequests:
+            return jsonify({"success": False, "message": "Expected a non-empty 'requests' list"}), 400
+        if len(subrequests) > BATCH_MAX_REQUESTS:
+            return jsonify({"success": False, "message": f"At most {BATCH_MAX_REQUESTS} requests per batch"}), 413
+        
+        current_session = session._get_current_object()
+        base_session = dict(current_session)
+        results = []
+        futures = []
+        sub_sessions = []
+        for index, sub in enumerate(subrequests):
+            sub = sub if isinstance(sub, dict) else {'path': sub}
+            path = sub.get('path')
+            result = {'id': sub.get('id', index)}
+            results.append(result)
+            if not isinstance(path, str) or not batchable(path):
+                result.update(status=400, body={"success": False, "message": "This path can't be batched"})
+                futures.append(None)
+                sub_sessions.append(None)
+                continue
+            sub_session = detached_copy(current_session)
+            sub_sessions.append(sub_session)
+            # API routes don't fan out themselves, so sharing the pool can't starve nested work
+            futures.append(fanout_executor.submit(dispatch_subrequest, path, sub.get('if_none_match'),
+                                                  request.host_url, sub_session))
+        
+        timings = g.get('server_timing')
+        for result, future, sub_session in zip(results, futures, sub_sessions):
+            if future is None:
+                continue
+            status, etag, body, sub_timings = future.result()
+            # In request order, so a later sub-request's session change wins
+            merge_session(session, sub_session, base_session)
+            if timings is not None and sub_timings:
+                for name, (duration, count, desc) in sub_timings.items():
+                    entry = timings.setdefault(name, [0.0, 0, desc])
+                    entry[0] += duration
+                    entry[1] += count
+            result['status'] = status
+            if etag:
+                result['etag'] = etag
+            result['body'] = body
+        
+        return jsonify({'responses': results})
+    except Exception as e:
+        logger.error("Error running batch: %s", e)
+        return jsonify({"success": False, "message": "Error running batch"}), 500
+
 @app.route('/default_cover.png')
 def serve_default_cover():
-    """Serve the default cover image"""
-    return send_file('default_cover.png')
+    """Serve the default cover image at the stable URL saved in project records"""
+    response = app.send_static_file('img/default_cover.png')
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
 
 
 @app.route('/api/projects/<record_id>/export-markdown')
@@ -1524,13 +3050,13 @@ def serve_default_cover():
 def export_project_markdown(record_id):
     """Export project details and logs as a markdown file"""
     try:
-        project_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
+        project_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{record_id}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        project_response = requests.get(project_url, headers=headers)
+        project_response = upstream.get(project_url, headers=headers)
         
         if project_response.status_code != 200:
-            logger.error(f"Failed to fetch project for markdown export: {project_response.text}")
+            logger.error("Failed to fetch project for markdown export: %s", project_response.text)
             return jsonify({"success": False, "message": "Project not found"}), 404
             
         project_data = project_response.json()
@@ -1550,9 +3076,9 @@ def export_project_markdown(record_id):
                 date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
                 project_date = date_obj.strftime('%B %d, %Y')
         except Exception as e:
-            logger.error(f"Error formatting project date: {str(e)}")
+            logger.error("Error formatting project date: %s", e)
         
-        logs_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+        logs_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         
         params = {
             'filterByFormula': f"AND({{User ID}} = '{session['user_id']}', {{Project Name}} = '{project_name}')",
@@ -1560,10 +3086,10 @@ def export_project_markdown(record_id):
             'sort[0][direction]': 'asc'
         }
         
-        logs_response = requests.get(logs_url, headers=headers, params=params)
+        logs_response = upstream.get(logs_url, headers=headers, params=params)
         
         if logs_response.status_code != 200:
-            logger.error(f"Failed to fetch logs for markdown export: {logs_response.text}")
+            logger.error("Failed to fetch logs for markdown export: %s", logs_response.text)
             logs = []
         else:
             logs_data = logs_response.json()
@@ -1590,7 +3116,7 @@ def export_project_markdown(record_id):
                     date_obj = datetime.fromisoformat(last_log_created.replace('Z', '+00:00'))
                     end_date = date_obj.strftime('%b %d, %Y')
             except Exception as e:
-                logger.error(f"Error determining date range: {str(e)}")
+                logger.error("Error determining date range: %s", e)
         
         date_range = ''
         if start_date and end_date:
@@ -1665,7 +3191,7 @@ def export_project_markdown(record_id):
                     formatted_date = 'Unknown Date'
                     short_date = 'unknown'
             except Exception as e:
-                logger.error(f"Error formatting date: {str(e)}")
+                logger.error("Error formatting date: %s", e)
                 formatted_date = 'Unknown Date'
                 short_date = 'unknown'
             
@@ -1719,10 +3245,20 @@ def export_project_markdown(record_id):
         )
             
     except Exception as e:
-        logger.error(f"Error exporting project markdown: {str(e)}")
+        logger.error("Error exporting project markdown: %s", e)
         return jsonify({"success": False, "message": "An error occurred"}), 500
 
 
+def init_background():
+    """
+    Start this process's background threads: aggregates reconciliation, the batch writer and
+    Airtable change checks. Called per worker from gunicorn.conf.py, or below when run directly;
+    scripts importing this module start only what they need.
+    """
+    log_aggregates.start_reconciler(fetch_logs_for_aggregates)
+    batch_writer.start()
+    change_watcher.start()
+
 if __name__ == '__main__':
     import argparse
     
@@ -1730,6 +3266,8 @@ if __name__ == '__main__':
     parser.add_argument('--port', type=int, default=5000, help='Port to run the server on')
     args = parser.parse_args()
     
+    init_background()
+    
     port = args.port
     
     print("\n" + "=" * 50)
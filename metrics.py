@@ -0,0 +1,162 @@
+"""
+Minimal in-process metrics registry rendered in the Prometheus text exposition format.
+
+Counters, gauges and histograms keep their samples in plain dicts keyed by label
+values, so recording a sample is a dict lookup plus an add under a lock. Each worker
+process keeps its own registry; scrape every worker (or run a single worker) to get
+complete numbers.
+"""
+from bisect import bisect_left
+import threading
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 5 * 1024 ** 2, 20 * 1024 ** 2, 100 * 1024 ** 2)
+
+REGISTRY = []
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.samples = {}
+        REGISTRY.append(self)
+
+    def header(self, family=None):
+        family = family or self.name
+        return [f"# HELP {family} {self.documentation}", f"# TYPE {family} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, *labelvalues, amount=1):
+        with self.lock:
+            self.samples[labelvalues] = self.samples.get(labelvalues, 0) + amount
+
+    def render(self):
+        # Text format 0.0.4 ties samples to the family by exact name, so it is declared with the suffix
+        lines = self.header(f"{self.name}_total")
+        with self.lock:
+            items = list(self.samples.items())
+        for labelvalues, value in items:
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=(), function=None):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def set(self, value, *labelvalues):
+        with self.lock:
+            self.samples[labelvalues] = value
+
+    def render(self):
+        lines = self.header()
+        if self.function is not None:
+            lines.append(f"{self.name} {_format_value(self.function())}")
+            return lines
+        with self.lock:
+            items = list(self.samples.items())
+        for labelvalues, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, *labelvalues):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            sample = self.samples.get(labelvalues)
+            if sample is None:
+                # Per-bucket (non-cumulative) counts, then sum and count
+                sample = self.samples[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            sample[0][index] += 1
+            sample[1] += value
+            sample[2] += 1
+
+    def render(self):
+        lines = self.header()
+        with self.lock:
+            items = [(labels, (list(s[0]), s[1], s[2])) for labels, s in self.samples.items()]
+        for labelvalues, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labelvalues)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labelvalues)} {count}")
+        return lines
+
+
+def render_all():
+    """Render every registered metric as Prometheus text"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+HTTP_REQUESTS = Counter('groundplane_http_requests', 'HTTP requests handled', ('method', 'route', 'status'))
+HTTP_LATENCY = Histogram('groundplane_http_request_duration_seconds', 'HTTP request latency', ('method', 'route'))
+
+UPSTREAM_REQUESTS = Counter('groundplane_upstream_requests', 'Calls to Airtable, Slack, the CDN and tmpfiles',
+                            ('service', 'resource', 'method', 'status'))
+UPSTREAM_LATENCY = Histogram('groundplane_upstream_request_duration_seconds', 'Upstream call latency',
+                             ('service', 'resource', 'method'))
+
+CACHE_LOOKUPS = Counter('groundplane_cache_lookups', 'Cache lookups by cache name and result (hit/miss)',
+                        ('cache', 'result'))
+
+UPLOADS = Counter('groundplane_uploads', 'Media uploads by target and result', ('target', 'result'))
+UPLOAD_BYTES = Counter('groundplane_upload_bytes', 'Bytes uploaded to the CDN', ('target',))
+UPLOAD_SIZE = Histogram('groundplane_upload_size_bytes', 'Upload size distribution', ('target',),
+                        buckets=SIZE_BUCKETS)
+UPLOAD_LATENCY = Histogram('groundplane_upload_duration_seconds', 'Upload duration', ('target',))
+
+TEMP_FILES_CREATED = Counter('groundplane_temp_files_created', 'Temporary files created for CDN pulls')
+
+
+def observe_upstream_call(call):
+    """upstream.py observer"""
+    status = str(call.status)
+    UPSTREAM_REQUESTS.inc(call.service, call.resource, call.method, status)
+    UPSTREAM_LATENCY.observe(call.duration, call.service, call.resource, call.method)
+
+
+def record_cache_lookup(cache, hit):
+    CACHE_LOOKUPS.inc(cache, 'hit' if hit else 'miss')
@@ -0,0 +1,201 @@
+"""
+On-demand request profiling.
+
+An admin can profile a single request by adding `?_profile=cprofile` (or `sample`)
+to the URL or sending an `X-Profile: cprofile|sample` header. A small fraction of
+all requests can also be sampled at random. Results are written to PROFILE_DIR:
+
+- cprofile: a deterministic cProfile run saved as `.pstats`
+- sample:   a wall-clock stack sampler saved as `.collapsed` (one "frame;frame;... count"
+            line per stack, the input format for flamegraph tools)
+
+Profiles are listed and viewed from /admin/profiles.
+"""
+from flask import g, request
+from collections import Counter
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MODES = ('cprofile', 'sample')
+EXTENSIONS = {'cprofile': '.pstats', 'sample': '.collapsed'}
+PROFILE_NAME = re.compile(r'^[\w.-]+\.(pstats|collapsed)$')
+
+# cProfile hooks are process-wide on newer Pythons, so only one runs at a time
+_cprofile_lock = threading.Lock()
+
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval from a background thread"""
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def collapsed(self):
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class RequestProfiler:
+    """Flask extension profiling flagged or randomly sampled requests"""
+
+    def __init__(self, profile_dir, sample_rate=0.0, sample_mode='sample', max_files=200, is_authorized=None):
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.sample_mode = sample_mode
+        self.max_files = max_files
+        self.is_authorized = is_authorized or (lambda: False)
+
+    def init_app(self, app):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def _requested_mode(self):
+        mode = request.args.get('_profile') or request.headers.get('X-Profile')
+        if not mode:
+            return None
+        mode = mode.lower()
+        if mode in ('1', 'true'):
+            mode = 'cprofile'
+        if mode not in MODES or not self.is_authorized():
+            return None
+        return mode
+
+    def _before_request(self):
+        if request.path.startswith(('/static/', '/temp/', '/admin/profiles')):
+            return
+        mode = self._requested_mode()
+        if mode is None and self.sample_rate and random.random() < self.sample_rate:
+            mode = self.sample_mode
+        if mode is None:
+            return
+
+        if mode == 'cprofile':
+            if not _cprofile_lock.acquire(blocking=False):
+                logger.info("Skipping cProfile run, another request is being profiled")
+                return
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = StackSampler(threading.get_ident())
+            profiler.start()
+        g.profiler = (mode, profiler, time.perf_counter())
+
+    def _after_request(self, response):
+        active = g.pop('profiler', None)
+        if active is None:
+            return response
+        mode, profiler, start = active
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        try:
+            if mode == 'cprofile':
+                profiler.disable()
+                _cprofile_lock.release()
+            else:
+                profiler.stop()
+            name = self._save(mode, profiler, elapsed_ms)
+            response.headers['X-Profile-Id'] = name
+        except Exception as e:
+            logger.error("Error saving profile: %s", e)
+        return response
+
+    def _save(self, mode, profiler, elapsed_ms):
+        route = request.url_rule.rule if request.url_rule else request.path
+        slug = re.sub(r'[^\w]+', '_', route).strip('_') or 'root'
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}_{request.method}_{slug}_{elapsed_ms:.0f}ms_{os.getpid()}{EXTENSIONS[mode]}"
+        path = os.path.join(self.profile_dir, name)
+        if mode == 'cprofile':
+            profiler.dump_stats(path)
+        else:
+            with open(path, 'w') as f:
+                f.write(profiler.collapsed())
+        logger.info("Saved %s profile for %s %s: %s", mode, request.method, request.path, name)
+        self._prune()
+        return name
+
+    def _prune(self):
+        profiles = list_profiles(self.profile_dir)
+        for profile in profiles[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.profile_dir, profile['name']))
+            except OSError:
+                pass
+
+
+def list_profiles(profile_dir):
+    """Profiles in profile_dir, newest first"""
+    if not os.path.isdir(profile_dir):
+        return []
+    profiles = []
+    for name in os.listdir(profile_dir):
+        if not PROFILE_NAME.match(name):
+            continue
+        path = os.path.join(profile_dir, name)
+        stat = os.stat(path)
+        profiles.append({'name': name, 'size': stat.st_size, 'modified': stat.st_mtime,
+                         'kind': 'cprofile' if name.endswith('.pstats') else 'sample'})
+    profiles.sort(key=lambda p: p['modified'], reverse=True)
+    return profiles
+
+
+def profile_path(profile_dir, name):
+    """Resolve a profile name to a path, or None if it is not a valid profile"""
+    if not PROFILE_NAME.match(name):
+        return None
+    path = os.path.join(profile_dir, name)
+    return path if os.path.isfile(path) else None
+
+
+def render_profile(path, sort='cumulative', limit=80):
+    """Human-readable report for a saved profile"""
+    if path.endswith('.pstats'):
+        output = io.StringIO()
+        stats = pstats.Stats(path, stream=output)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+    with open(path) as f:
+        lines = [line.rsplit(' ', 1) for line in f if line.strip()]
+    total = sum(int(count) for _, count in lines) or 1
+    leaf_counts = Counter()
+    for stack, count in lines:
+        leaf_counts[stack.split(';')[-1]] += int(count)
+    report = [f"{total} samples\n", "Top frames (self time):"]
+    for frame, count in leaf_counts.most_common(limit):
+        report.append(f"{count:>7} {100.0 * count / total:5.1f}%  {frame}")
+    report.append("\nHottest stacks:")
+    for stack, count in lines[:20]:
+        report.append(f"{int(count):>7} {100.0 * int(count) / total:5.1f}%  {stack.replace(';', ' > ')}")
+    return '\n'.join(report)
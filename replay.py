@@ -0,0 +1,179 @@
+"""
+Replay traffic captured by the TrafficRecorder (see traffic.py) against a running app.
+
+    python replay.py traces.ndjson --target https://127.0.0.1:5000 --speed 2 \\
+        --cookie "session=..." --insecure
+
+Requests are issued at their original relative times divided by --speed (0 sends
+them as fast as --concurrency allows). Only GET requests are replayed unless
+--include-writes is given, in which case recorded form/JSON bodies are re-created
+with placeholder values of the original sizes. The report compares recorded and
+replayed latency per route.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def load_traces(paths):
+    entries = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+    entries.sort(key=lambda e: e['t'])
+    return entries
+
+
+def placeholder_body(body):
+    """Rebuild a request body with dummy values matching the recorded shape"""
+    if not body:
+        return {}
+    values = {}
+    for name, shape in body.get('fields', {}).items():
+        if isinstance(shape, str) and shape.startswith('s'):
+            values[name] = 'x' * int(shape[1:])
+        else:
+            values[name] = shape
+    if body['kind'] == 'json':
+        return {'json': values}
+    files = {name: (f"replay{ext}", b'\0' * size) for name, (ext, size) in body.get('files', {}).items()}
+    return {'data': values, 'files': files or None}
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def replay(entries, target, speed, concurrency, cookies, verify, include_writes):
+    """Re-issue entries on their original schedule; returns a list of result dicts"""
+    sessions = threading.local()
+    results = []
+    results_lock = threading.Lock()
+
+    def http():
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+            sessions.session.verify = verify
+        return sessions.session
+
+    def send(entry):
+        headers = {}
+        cookie = cookies.get(entry.get('u')) or cookies.get('*')
+        if cookie:
+            headers['Cookie'] = cookie
+        kwargs = placeholder_body(entry.get('b')) if entry['m'] != 'GET' else {}
+        start = time.perf_counter()
+        try:
+            response = http().request(entry['m'], target + entry['p'], params=entry.get('q'),
+                                      headers=headers, allow_redirects=False, **kwargs)
+            status = response.status_code
+        except requests.RequestException as e:
+            print(f"Request failed: {entry['m']} {entry['p']}: {e}", file=sys.stderr)
+            status = 0
+        elapsed = (time.perf_counter() - start) * 1000
+        with results_lock:
+            results.append({'route': f"{entry['m']} {entry.get('r') or entry['p']}",
+                            'recorded_ms': entry['d'], 'replayed_ms': elapsed,
+                            'recorded_status': entry['s'], 'replayed_status': status})
+
+    selected = [e for e in entries if include_writes or e['m'] == 'GET']
+    if not selected:
+        return results
+
+    origin = selected[0]['t']
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for entry in selected:
+            if speed > 0:
+                due = (entry['t'] - origin) / speed
+                wait = due - (time.monotonic() - started)
+                if wait > 0:
+                    time.sleep(wait)
+            pool.submit(send, entry)
+    return results
+
+
+def summarize(results):
+    by_route = defaultdict(list)
+    for result in results:
+        by_route[result['route']].append(result)
+
+    summary = []
+    for route, items in sorted(by_route.items(), key=lambda item: -len(item[1])):
+        recorded = [i['recorded_ms'] for i in items]
+        replayed = [i['replayed_ms'] for i in items]
+        summary.append({
+            'route': route,
+            'count': len(items),
+            'recorded_p50': percentile(recorded, 50),
+            'replayed_p50': percentile(replayed, 50),
+            'recorded_p95': percentile(recorded, 95),
+            'replayed_p95': percentile(replayed, 95),
+            'delta_p50': percentile(replayed, 50) - percentile(recorded, 50),
+            'delta_p95': percentile(replayed, 95) - percentile(recorded, 95),
+            'status_mismatches': sum(1 for i in items if i['recorded_status'] != i['replayed_status']),
+        })
+    return summary
+
+
+def print_report(summary, wall_time):
+    total = sum(row['count'] for row in summary)
+    print(f"\nReplayed {total} requests in {wall_time:.1f}s ({total / wall_time if wall_time else 0:.1f} req/s)\n")
+    header = f"{'route':<55} {'n':>5} {'rec p50':>9} {'new p50':>9} {'Δp50':>8} {'rec p95':>9} {'new p95':>9} {'Δp95':>8} {'status≠':>8}"
+    print(header)
+    print('-' * len(header))
+    for row in summary:
+        print(f"{row['route'][:55]:<55} {row['count']:>5} {row['recorded_p50']:>9.1f} {row['replayed_p50']:>9.1f} "
+              f"{row['delta_p50']:>+8.1f} {row['recorded_p95']:>9.1f} {row['replayed_p95']:>9.1f} "
+              f"{row['delta_p95']:>+8.1f} {row['status_mismatches']:>8}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replay recorded traffic against the app')
+    parser.add_argument('traces', nargs='+', help='Trace files written by TRAFFIC_RECORD_FILE')
+    parser.add_argument('--target', default='https://127.0.0.1:5000', help='Base URL of the app under test')
+    parser.add_argument('--speed', type=float, default=1.0, help='Time scale: 2 replays twice as fast, 0 as fast as possible')
+    parser.add_argument('--concurrency', type=int, default=16, help='Maximum requests in flight')
+    parser.add_argument('--cookie', help='Cookie header sent with every request (e.g. "session=...")')
+    parser.add_argument('--cookie-map', help='JSON file mapping recorded user hashes to Cookie headers')
+    parser.add_argument('--include-writes', action='store_true', help='Also replay POST/PATCH/DELETE requests')
+    parser.add_argument('--insecure', action='store_true', help='Skip TLS verification (self-signed dev certs)')
+    parser.add_argument('--report', help='Write the per-route summary as JSON to this path')
+    args = parser.parse_args()
+
+    cookies = {}
+    if args.cookie_map:
+        with open(args.cookie_map) as f:
+            cookies.update(json.load(f))
+    if args.cookie:
+        cookies['*'] = args.cookie
+
+    if args.insecure:
+        requests.packages.urllib3.disable_warnings()
+
+    entries = load_traces(args.traces)
+    print(f"Loaded {len(entries)} recorded requests from {', '.join(os.path.basename(p) for p in args.traces)}")
+
+    wall_start = time.monotonic()
+    results = replay(entries, args.target.rstrip('/'), args.speed, args.concurrency, cookies,
+                     not args.insecure, args.include_writes)
+    summary = summarize(results)
+    print_report(summary, time.monotonic() - wall_start)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(summary, f, indent=2)
@@ -0,0 +1,145 @@
+"""
+Full-text search over dev logs, kept in an SQLite FTS5 index in the shared local store.
+
+Title, What I Did, Issues Faced, Next Steps and Project Name are indexed. The owner,
+status and Created At are stored alongside for filtering. Results are ranked by
+BM25, with a match in the title or project name worth more than one in the body.
+
+The write paths call `index()`/`remove()` after Airtable accepts a change. Rebuilds
+from a full listing run with the log aggregates' reconciliation and follow the same
+rule: entries written after the listing started are kept.
+"""
+import hashlib
+import html
+import logging
+import re
+import time
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE VIRTUAL TABLE IF NOT EXISTS log_search USING fts5 (
+    record_id UNINDEXED,
+    user_id UNINDEXED,
+    status UNINDEXED,
+    created_at UNINDEXED,
+    deleted UNINDEXED,
+    updated_at UNINDEXED,
+    title,
+    what_did,
+    issues_faced,
+    next_steps,
+    project_name,
+    tokenize = 'porter unicode61'
+);
+""")
+
+# Airtable field per indexed column, in column order
+TEXT_FIELDS = {
+    'title': 'Title',
+    'what_did': 'What I Did',
+    'issues_faced': 'Issues Faced',
+    'next_steps': 'Next Steps',
+    'project_name': 'Project Name',
+}
+
+# Fields a rebuild needs from each log
+SEARCH_FIELDS = ['User ID', 'Status', 'Created At', *TEXT_FIELDS.values()]
+
+# bm25() weights for the indexed columns (the UNINDEXED ones first count as 0)
+_WEIGHTS = '0, 0, 0, 0, 0, 0, 4.0, 1.0, 1.0, 1.0, 2.0'
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+# Highlight delimiters handed to snippet(); the text around them is escaped before they become <mark> tags
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+_COLUMNS = 'rowid, record_id, user_id, status, created_at, deleted, updated_at, ' + ', '.join(TEXT_FIELDS)
+
+
+def match_expression(text):
+    """FTS5 query for free text: every word must appear, the last one as a prefix (search-as-you-type)"""
+    words = _TOKEN.findall(text or '')
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' AND '.join(terms)
+
+
+def _doc_id(record_id):
+    """Stable FTS rowid for a record, so replacing an entry is a rowid lookup rather than a scan"""
+    return int.from_bytes(hashlib.blake2b(record_id.encode(), digest_size=8).digest(), 'big') >> 1
+
+
+def _row(record, updated_at):
+    fields = record.get('fields', {})
+    return (_doc_id(record['id']), record['id'], fields.get('User ID') or '', fields.get('Status') or 'Pending', fields.get('Created At'),
+            0, updated_at, *(str(fields.get(name) or '') for name in TEXT_FIELDS.values()))
+
+
+class SearchIndex:
+    def index(self, record):
+        """Add or replace a log's entry"""
+        with local_store.transaction() as conn:
+            conn.execute('DELETE FROM log_search WHERE rowid = ?', (_doc_id(record['id']),))
+            conn.execute(f'INSERT INTO log_search ({_COLUMNS}) VALUES ({", ".join("?" * 12)})',
+                         _row(record, time.time()))
+
+    def remove(self, record_id):
+        # Kept as a marker so a rebuild already in flight doesn't bring it back
+        with local_store.transaction() as conn:
+            conn.execute('DELETE FROM log_search WHERE rowid = ?', (_doc_id(record_id),))
+            conn.execute(f'INSERT INTO log_search ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?)',
+                         (_doc_id(record_id), record_id, '', '', None, time.time(), '', '', '', '', ''))
+
+    def rebuild(self, records, started_at):
+        """Re-index from a full listing of the logs table that began at `started_at`"""
+        with local_store.transaction() as conn:
+            # Entries written after the listing started are newer than the snapshot and are kept
+            conn.execute('DELETE FROM log_search WHERE updated_at < ?', (started_at,))
+            kept = {row[0] for row in conn.execute('SELECT record_id FROM log_search')}
+            conn.executemany(f'INSERT INTO log_search ({_COLUMNS}) VALUES ({", ".join("?" * 12)})',
+                             [_row(record, started_at) for record in records if record['id'] not in kept])
+            conn.execute("INSERT INTO log_search (log_search) VALUES ('optimize')")
+        logger.info("Rebuilt the log search index from %d logs", len(records))
+
+    def search(self, text, user_id=None, status=None, date_from=None, date_to=None, offset=0, limit=20):
+        """
+        One page of matches as (hits, total). Each hit has the record ID, owner, status,
+        Created At, project name, title and an HTML snippet (escaped, matches in <mark>).
+        Raises ValueError for an empty query.
+        """
+        expression = match_expression(text)
+        if expression is None:
+            raise ValueError("Search query must contain at least one word")
+        conditions, params = ['log_search MATCH ?', 'deleted = 0'], [expression]
+        if user_id:
+            conditions.append('user_id = ?')
+            params.append(user_id)
+        if status:
+            conditions.append('status = ?')
+            params.append(status)
+        if date_from:
+            conditions.append('substr(created_at, 1, 10) >= ?')
+            params.append(date_from)
+        if date_to:
+            conditions.append('substr(created_at, 1, 10) <= ?')
+            params.append(date_to)
+        where = ' AND '.join(conditions)
+
+        conn = local_store.connect()
+        total = conn.execute(f'SELECT COUNT(*) FROM log_search WHERE {where}', params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT record_id, user_id, status, created_at, project_name, title, "
+            f"snippet(log_search, -1, ?, ?, '…', 16) AS snippet, bm25(log_search, {_WEIGHTS}) AS score "
+            f"FROM log_search WHERE {where} ORDER BY score LIMIT ? OFFSET ?",
+            (_MARK_START, _MARK_END, *params, limit, offset)).fetchall()
+        hits = []
+        for row in rows:
+            hit = dict(row)
+            hit['snippet'] = html.escape(hit['snippet']).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+            hits.append(hit)
+        return hits, total
@@ -0,0 +1,102 @@
+"""
+Per-request time accounting emitted as a Server-Timing response header.
+
+Upstream calls (by service and table), cache lookups and template rendering are
+accumulated on flask.g while the request runs, e.g.
+
+    Server-Timing: airtable-Logs;dur=182.4;desc="airtable Logs x2", render;dur=6.1, total;dur=195.0
+
+Requests slower than the configured threshold are also logged with the same breakdown.
+"""
+from flask import g, request, has_request_context
+from contextlib import contextmanager
+from jinja2 import Template
+import logging
+import re
+import time
+
+import upstream
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def record(name, duration, desc=None):
+    """Add `duration` seconds to the named entry of the current request"""
+    if not has_request_context():
+        return
+    entries = g.get('server_timing')
+    if entries is None:
+        return
+    entry = entries.get(name)
+    if entry is None:
+        entries[name] = [duration, 1, desc or name]
+    else:
+        entry[0] += duration
+        entry[1] += 1
+
+
+@contextmanager
+def timing(name, desc=None):
+    """Time a block of code into the current request's Server-Timing entry"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, desc)
+
+
+def _on_upstream_call(call):
+    name = _TOKEN_UNSAFE.sub('_', f"{call.service}-{call.resource}" if call.resource else call.service)
+    record(name, call.duration, f"{call.service} {call.resource}".strip())
+
+
+class TimedTemplate(Template):
+    """Jinja template whose top-level render is counted as `render` time"""
+
+    def render(self, *args, **kwargs):
+        with timing('render'):
+            return super().render(*args, **kwargs)
+
+
+def format_header(entries, total):
+    parts = []
+    for name, (duration, count, desc) in entries.items():
+        label = f"{desc} x{count}" if count > 1 else desc
+        parts.append(f'{name};dur={duration * 1000:.1f};desc="{label}"')
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ', '.join(parts)
+
+
+class ServerTiming:
+    """Flask extension adding the Server-Timing header and slow-request logging"""
+
+    def __init__(self, emit_header=True, slow_request_ms=None, is_authorized=None):
+        """`is_authorized()`, when given, decides per request whether the header is sent"""
+        self.emit_header = emit_header
+        self.is_authorized = is_authorized
+        self.slow_request_ms = slow_request_ms
+
+    def init_app(self, app):
+        app.jinja_env.template_class = TimedTemplate
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        upstream.add_observer(_on_upstream_call)
+
+    def _before_request(self):
+        g.server_timing = {}
+        g.server_timing_start = time.perf_counter()
+
+    def _after_request(self, response):
+        entries = g.get('server_timing')
+        if entries is None:
+            return response
+        total = time.perf_counter() - g.server_timing_start
+        header = format_header(entries, total)
+        if self.emit_header and (self.is_authorized is None or self.is_authorized()):
+            response.headers['Server-Timing'] = header
+        if self.slow_request_ms is not None and total * 1000 >= self.slow_request_ms:
+            logger.warning("Slow request %s %s (%s) took %.0fms: %s",
+                           request.method, request.path, response.status_code, total * 1000, header)
+        return response
@@ -0,0 +1,177 @@
+"""
+Server-side sessions stored in the shared SQLite local store.
+
+The browser only holds a signed, random session ID; the session data (including the
+per-user logs/projects caches) stays on the server, so request and response headers
+stay small no matter how much is cached. Data is serialized with Flask's tagged JSON
+serializer, the same format the default cookie sessions use, so anything that worked
+in a cookie session works here.
+
+Rows expire `PERMANENT_SESSION_LIFETIME` after their last write and expired rows are
+swept at most once every `sweep_interval` seconds per worker.
+"""
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+import logging
+import secrets
+import time
+
+import local_store
+
+logger = logging.getLogger(__name__)
+
+local_store.register_schema("""
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at);
+""")
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its ID and whether it was changed"""
+
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+        self.previous_sid = None
+        self.detached = False
+
+    def regenerate(self):
+        """Move the data to a fresh ID, e.g. after login, so a pre-login ID can't be reused"""
+        if self.sid and not self.new:
+            self.previous_sid = self.sid
+        self.sid = new_session_id()
+        self.modified = True
+
+
+def detached_copy(session):
+    """
+    Copy of a session (server-side, or Flask's cookie session) for a sub-request running
+    alongside others. A server-side copy is never saved itself; `merge()` applies its changes.
+    """
+    if not isinstance(session, ServerSideSession):
+        return type(session)(dict(session))
+    copy = ServerSideSession(dict(session), sid=session.sid, new=session.new, expires_at=session.expires_at)
+    copy.detached = True
+    return copy
+
+
+def merge(session, copy, base):
+    """Apply the keys `copy` set or removed relative to `base`, the session's contents when it was copied"""
+    if not copy.modified:
+        return
+    for key in base.keys() - copy.keys():
+        if key in session:
+            session.pop(key)
+    changed = {key: value for key, value in copy.items() if key not in base or base[key] is not value}
+    if changed:
+        session.update(changed)
+
+
+def new_session_id():
+    return secrets.token_urlsafe(32)
+
+
+class SqliteSessionInterface(SessionInterface):
+    """Flask session interface backed by the local_store `sessions` table"""
+
+    serializer = TaggedJSONSerializer()
+    salt = 'server-side-session'
+
+    def __init__(self, sweep_interval=300):
+        self.sweep_interval = sweep_interval
+        self.last_sweep = 0.0
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt=self.salt, key_derivation='hmac')
+
+    def open_session(self, app, request):
+        if not app.secret_key:
+            return None
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode()
+            except BadSignature:
+                sid = None
+            if sid:
+                row = local_store.connect().execute(
+                    'SELECT data, expires_at FROM sessions WHERE id = ? AND expires_at > ?',
+                    (sid, time.time())).fetchone()
+                if row is not None:
+                    try:
+                        return ServerSideSession(self.serializer.loads(row['data']), sid=sid,
+                                                 expires_at=row['expires_at'])
+                    except ValueError:
+                        logger.warning("Discarding unreadable session data")
+        return ServerSideSession(sid=new_session_id(), new=True)
+
+    def save_session(self, app, session, response):
+        if session.detached:
+            return
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        conn = local_store.connect()
+
+        if session.previous_sid:
+            conn.execute('DELETE FROM sessions WHERE id = ?', (session.previous_sid,))
+
+        if not session:
+            if session.modified and not session.new:
+                conn.execute('DELETE FROM sessions WHERE id = ?', (session.sid,))
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        now = time.time()
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        # Unchanged sessions only get their expiry pushed out once half the lifetime has gone by
+        needs_refresh = session.expires_at is None or session.expires_at - now < lifetime / 2
+        if session.modified:
+            conn.execute('INSERT OR REPLACE INTO sessions (id, data, expires_at) VALUES (?, ?, ?)',
+                         (session.sid, self.serializer.dumps(dict(session)), now + lifetime))
+        elif needs_refresh:
+            conn.execute('UPDATE sessions SET expires_at = ? WHERE id = ?', (now + lifetime, session.sid))
+
+        if self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                self._signer(app).sign(session.sid.encode()).decode(),
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+        if now - self.last_sweep >= self.sweep_interval:
+            self.last_sweep = now
+            self.sweep_expired()
+
+    def sweep_expired(self):
+        """Delete expired sessions; returns the number removed"""
+        removed = local_store.connect().execute('DELETE FROM sessions WHERE expires_at <= ?',
+                                                (time.time(),)).rowcount
+        if removed:
+            logger.info("Swept %d expired sessions", removed)
+        return removed
+
+
+def session_count():
+    """Live sessions in the store"""
+    return local_store.connect().execute('SELECT COUNT(*) FROM sessions WHERE expires_at > ?',
+                                         (time.time(),)).fetchone()[0]
@@ -0,0 +1,27 @@
+const BATCH_OPTIONS = document.currentScript.dataset;
+
+// GET several API paths through /api/batch, splitting into chunks the server accepts.
+// Resolves to one {id, status, body} result per path, in order.
+function apiBatch(paths) {
+    const chunkSize = Number(BATCH_OPTIONS.maxRequests) || 20;
+    const chunks = [];
+    for (let i = 0; i < paths.length; i += chunkSize) {
+        chunks.push(paths.slice(i, i + chunkSize));
+    }
+    return Promise.all(chunks.map(chunk =>
+        fetch(BATCH_OPTIONS.url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ requests: chunk.map(path => ({ path })) })
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(data => data.responses)
+    )).then(results => results.flat());
+}
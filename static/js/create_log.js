@@ -0,0 +1,149 @@
+const urlParams = new URLSearchParams(window.location.search);
+if (urlParams.has('project')) {
+    const projectName = urlParams.get('project');
+    document.addEventListener('DOMContentLoaded', function() {
+        const projectNameInput = document.querySelector('input[name="project_name"]');
+        if (projectNameInput) {
+            projectNameInput.value = projectName;
+        }
+    });
+}
+
+if (urlParams.has('project_tag')) {
+    const projectTag = urlParams.get('project_tag');
+    document.addEventListener('DOMContentLoaded', function() {
+        const tagSelect = document.querySelector('select[name="project_tag"]');
+        if (tagSelect) {
+            tagSelect.value = projectTag;
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const fileInput = document.getElementById('file-upload');
+    const fileLabel = document.querySelector('label[for="file-upload"]');
+    const fileLabelText = document.getElementById('file-label-text');
+    const successMessage = document.getElementById('file-success-message');
+    const previewContainer = document.getElementById('media-preview-container');
+
+    if (fileInput && fileLabel && fileLabelText) {
+        fileInput.addEventListener('change', function(event) {
+            const file = event.target.files[0];
+
+            if (file) {
+                fileLabelText.textContent = file.name;
+                fileLabel.classList.add('file-selected');
+
+                const icon = fileLabel.querySelector('i');
+                if (icon) {
+                    icon.className = 'bx bx-check text-xl';
+                }
+
+                successMessage.style.display = 'flex';
+                successMessage.querySelector('span').textContent = `File "${file.name}" uploaded successfully!`;
+
+                createPreview(file, previewContainer);
+
+                fileLabel.style.transform = 'scale(1.02)';
+                setTimeout(() => {
+                    fileLabel.style.transform = 'scale(1)';
+                }, 200);
+
+                console.log('File selected:', file.name, 'Type:', file.type, 'Size:', file.size);
+            } else {
+                resetFileInput();
+            }
+        });
+
+        fileLabel.addEventListener('dragover', function(e) {
+            e.preventDefault();
+            fileLabel.style.background = 'linear-gradient(45deg, #33d6a6, #5bc0de)';
+            fileLabel.style.transform = 'scale(1.02)';
+        });
+
+        fileLabel.addEventListener('dragleave', function(e) {
+            e.preventDefault();
+            fileLabel.style.background = 'linear-gradient(45deg, #a633d6, #ec3750)';
+            fileLabel.style.transform = 'scale(1)';
+        });
+
+        fileLabel.addEventListener('drop', function(e) {
+            e.preventDefault();
+            fileLabel.style.background = 'linear-gradient(45deg, #a633d6, #ec3750)';
+            fileLabel.style.transform = 'scale(1)';
+
+            const files = e.dataTransfer.files;
+            if (files.length > 0) {
+                fileInput.files = files;
+                fileInput.dispatchEvent(new Event('change'));
+            }
+        });
+    }
+
+    function createPreview(file, container) {
+        container.innerHTML = '';
+        container.style.display = 'flex';
+
+        if (file.type.startsWith('image/')) {
+            const img = document.createElement('img');
+            img.style.maxHeight = '280px';
+            img.style.maxWidth = '100%';
+            img.style.borderRadius = '8px';
+            img.style.objectFit = 'contain';
+
+            const reader = new FileReader();
+            reader.onload = function(e) {
+                img.src = e.target.result;
+                container.appendChild(img);
+            };
+            reader.readAsDataURL(file);
+
+        } else if (file.type.startsWith('video/')) {
+            const video = document.createElement('video');
+            video.style.maxHeight = '280px';
+            video.style.maxWidth = '100%';
+            video.style.borderRadius = '8px';
+            video.controls = true;
+
+            const reader = new FileReader();
+            reader.onload = function(e) {
+                video.src = e.target.result;
+                container.appendChild(video);
+            };
+            reader.readAsDataURL(file);
+        } else {
+            const fileInfo = document.createElement('div');
+            fileInfo.style.color = 'white';
+            fileInfo.style.textAlign = 'center';
+            fileInfo.innerHTML = `
+                <i class='bx bx-file text-4xl mb-2'></i>
+                <p>${file.name}</p>
+                <p class="text-sm text-gray-300">${formatFileSize(file.size)}</p>
+            `;
+            container.appendChild(fileInfo);
+        }
+    }
+
+    function resetFileInput() {
+        fileLabelText.textContent = 'Choose File';
+        fileLabel.classList.remove('file-selected');
+
+        const icon = fileLabel.querySelector('i');
+        if (icon) {
+            icon.className = 'bx bx-upload text-xl';
+        }
+
+        successMessage.style.display = 'none';
+        previewContainer.style.display = 'none';
+        previewContainer.innerHTML = '';
+    }
+
+    function formatFileSize(bytes) {
+        if (bytes === 0) return '0 Bytes';
+        const k = 1024;
+        const sizes = ['Bytes', 'KB', 'MB', 'GB'];
+        const i = Math.floor(Math.log(bytes) / Math.log(k));
+        return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+    }
+
+});
@@ -0,0 +1,452 @@
+const APP_URLS = document.currentScript.dataset;
+
+// Data the server embedded in the page; anything missing is fetched as before
+const HYDRATION = JSON.parse(document.getElementById('hydration-data')?.textContent || '{}');
+
+function hydratedOrFetch(key, url) {
+    if (key in HYDRATION) {
+        return Promise.resolve(HYDRATION[key]);
+    }
+    return fetch(url).then(response => {
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    });
+}
+
+function updateTime() {
+    const now = new Date();
+    const options = { 
+        hour: '2-digit', 
+        minute: '2-digit',
+        day: 'numeric',
+        month: 'short'
+    };
+    document.getElementById('current-time').textContent = now.toLocaleDateString('en-US', options);
+}
+updateTime();
+setInterval(updateTime, 60000);
+
+let isGridView = true;
+document.getElementById('grid-view').addEventListener('click', () => {
+    isGridView = true;
+    document.getElementById('grid-view').classList.add('bg-orange-500', 'text-white', 'glow-orange');
+    document.getElementById('grid-view').classList.remove('bg-slate-700', 'text-gray-400');
+    document.getElementById('list-view').classList.remove('bg-orange-500', 'text-white', 'glow-orange');
+    document.getElementById('list-view').classList.add('bg-slate-700', 'text-gray-400');
+    updateProjectsDisplay();
+});
+
+document.getElementById('list-view').addEventListener('click', () => {
+    isGridView = false;
+    document.getElementById('list-view').classList.add('bg-orange-500', 'text-white', 'glow-orange');
+    document.getElementById('list-view').classList.remove('bg-slate-700', 'text-gray-400');
+    document.getElementById('grid-view').classList.remove('bg-orange-500', 'text-white', 'glow-orange');
+    document.getElementById('grid-view').classList.add('bg-slate-700', 'text-gray-400');
+    updateProjectsDisplay();
+});
+
+document.getElementById('sort-projects').addEventListener('change', (e) => {
+    sortProjects(e.target.value);
+});
+
+let allProjects = [];
+
+function updateProjectsDisplay() {
+    const container = document.getElementById('projects-container');
+    if (isGridView) {
+        container.className = 'grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 relative z-10';
+    } else {
+        container.className = 'space-y-4 relative z-10';
+    }
+    renderProjects(allProjects);
+}
+
+function sortProjects(sortBy) {
+    const sortedProjects = [...allProjects].sort((a, b) => {
+        switch(sortBy) {
+            case 'newest':
+                return new Date(b.fields['Created At']) - new Date(a.fields['Created At']);
+            case 'oldest':
+                return new Date(a.fields['Created At']) - new Date(b.fields['Created At']);
+            case 'name':
+                return a.fields['Project Name'].localeCompare(b.fields['Project Name']);
+            default:
+                return 0;
+        }
+    });
+    renderProjects(sortedProjects);
+}
+
+const urlParams = new URLSearchParams(window.location.search);
+if (urlParams.get('updated') === 'true') {
+    const flashMessage = document.createElement('div');
+    flashMessage.className = 'mb-4 p-4 rounded-lg bg-gradient-to-r from-orange-500 to-red-500 text-white shadow-2xl animate__animated animate__fadeIn flex items-center border border-orange-400/20 glow-orange';
+    flashMessage.innerHTML = `
+        <i class='bx bx-check-circle text-2xl mr-3 animate-bounce'></i>
+        <span class="font-semibold">Project updated successfully!</span>
+    `;
+    document.querySelector('.container').prepend(flashMessage);
+
+    window.history.replaceState({}, document.title, window.location.pathname);
+
+    setTimeout(() => {
+        flashMessage.classList.add('animate__fadeOut');
+        setTimeout(() => {
+            flashMessage.remove();
+        }, 500);
+    }, 4500);
+}
+
+function getTagColor(tag) {
+    const colors = {
+        'CAD': 'bg-gradient-to-r from-blue-500 to-cyan-500 glow-blue',
+        'PCB': 'bg-gradient-to-r from-purple-500 to-blue-500 glow-purple',
+        'Hardware': 'bg-gradient-to-r from-orange-500 to-red-500 glow-orange',
+        'Software': 'bg-gradient-to-r from-emerald-500 to-cyan-500 glow-emerald',
+        '3D Printing': 'bg-gradient-to-r from-red-500 to-purple-500 glow-red',
+        'Research': 'bg-gradient-to-r from-purple-500 to-blue-500 glow-purple',
+        'General': 'bg-gradient-to-r from-slate-500 to-slate-600'
+    };
+
+    return colors[tag] || 'bg-gradient-to-r from-slate-500 to-slate-600';
+}
+
+function formatDate(dateString) {
+    const date = new Date(dateString);
+    if (isNaN(date)) return '';
+
+    const now = new Date();
+    const diffMs = now - date;
+    const diffSec = Math.floor(diffMs / 1000);
+    const diffMin = Math.floor(diffSec / 60);
+    const diffHour = Math.floor(diffMin / 60);
+    const diffDay = Math.floor(diffHour / 24);
+
+    if (diffDay > 0) {
+        return diffDay === 1 ? 'Yesterday' : `${diffDay} days ago`;
+    } else if (diffHour > 0) {
+        return `${diffHour} hour${diffHour > 1 ? 's' : ''} ago`;
+    } else if (diffMin > 0) {
+        return `${diffMin} minute${diffMin > 1 ? 's' : ''} ago`;
+    } else {
+        return 'Just now';
+    }
+}
+
+function renderProjects(projects) {
+    const container = document.getElementById('projects-container');
+
+    if (projects.length === 0) {
+        container.innerHTML = `
+            <div class="text-center py-16 animate__animated animate__fadeIn col-span-full">
+                <div class="relative mb-6">
+                    <i class='bx bx-folder-open text-6xl text-gray-400 mb-4 animate-pulse'></i>
+                    <div class="absolute -top-2 -right-2 w-4 h-4 bg-gradient-to-r from-orange-400 to-red-400 rounded-full animate-ping shadow-lg shadow-orange-500/50"></div>
+                </div>
+                <h3 class="text-2xl font-bold text-white mb-2 font-phantom">No Projects Yet</h3>
+                <p class="text-gray-300 text-lg mb-6 font-phantom">Start your development journey by creating your first project!</p>
+                <a href="${APP_URLS.createProject}" class="inline-flex items-center gap-2 px-8 py-3 text-white rounded-lg font-semibold bg-gradient-to-r from-orange-500 via-red-500 to-purple-600 hover:from-orange-600 hover:via-red-600 hover:to-purple-700 transform hover:scale-105 transition-all duration-300 shadow-lg hover:shadow-xl shadow-orange-500/30 hover:shadow-orange-500/50 backdrop-blur-sm border border-white/10 font-phantom">
+                    <i class='bx bx-plus animate-bounce'></i> Create Your First Project
+                </a>
+            </div>
+        `;
+        return;
+    }
+
+    if (isGridView) {
+        container.innerHTML = projects.map((project, index) => {
+            const projectTag = project.fields['Project Tag'];
+            const tagColor = getTagColor(projectTag);
+            const createdDate = project.fields['Created At'] ? formatDate(project.fields['Created At']) : '';
+            const animationDelay = index < 6 ? `animate__delay-${index % 3 + 1}s` : '';
+            const coverImage = project.fields['Cover Image URL'] || APP_URLS.defaultCover;
+            const githubLink = project.fields['github_link'] || // IDK what im doing its 3 am 😭
+                             project.fields['GitHub Link'] || 
+                             project.fields['Github Link'] || 
+                             project.fields['github_url'] || 
+                             project.fields['GitHub URL'] || 
+                             '';            
+            const hasGithubLink = githubLink && githubLink.trim() !== '';
+
+            console.log('Project:', project.fields['Project Name'], 'GitHub Link:', githubLink, 'Has Link:', hasGithubLink); // Debug log
+
+            return `
+            <div class="backdrop-blur-md bg-white/5 border border-white/10 overflow-hidden rounded-xl hover:shadow-2xl transition-all duration-500 animate__animated animate__fadeIn ${animationDelay} flex flex-col h-full transform hover:scale-105 group hover:shadow-orange-500/20 hover:border-orange-500/30">
+                <div class="relative overflow-hidden h-48">
+                    <img src="${coverImage}" class="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110" alt="${project.fields['Project Name']}">
+                    <div class="absolute inset-0 bg-gradient-to-t from-slate-900/80 via-purple-900/20 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300"></div>
+                    <div class="absolute bottom-0 left-0 p-4 w-full bg-gradient-to-t from-slate-900/90 via-purple-900/50 to-transparent">
+                        <div class="flex items-center justify-between">
+                            ${projectTag ? `<span class="bg-gradient-to-r from-orange-500 to-red-500 text-white px-3 py-1 rounded-full text-sm font-medium shadow-lg shadow-orange-500/30 backdrop-blur-sm border border-white/10 font-phantom">${projectTag}</span>` : '<div></div>'}
+                            <span class="text-gray-300 text-sm bg-slate-800/50 px-2 py-1 rounded-lg backdrop-blur-sm border border-white/10 font-phantom">${createdDate}</span>
+                        </div>
+                        <h3 class="text-white text-xl font-bold mt-2 truncate drop-shadow-lg font-phantom">${project.fields['Project Name']}</h3>
+                    </div>
+                </div>
+
+                <div class="p-6 flex-grow">
+                    <p class="text-gray-300 line-clamp-3 h-18 overflow-hidden leading-relaxed font-phantom">${project.fields['Description'] || 'No description provided.'}</p>
+                    ${hasGithubLink ? `
+                        <div class="mt-4 flex items-center gap-2 text-sm">
+                            <i class='bx bxl-github text-orange-400'></i>
+                            <a href="${githubLink}" target="_blank" class="text-orange-400 hover:text-orange-300 transition-colors duration-300 font-phantom">
+                                GitHub Repository
+                            </a>
+                        </div>
+                    ` : ''}
+                </div>
+
+                <div class="p-6 pt-0 flex justify-between items-center">
+                    <a href="/project/${project.id}" class="px-6 py-2 text-white rounded-lg text-sm font-medium flex items-center gap-2 bg-gradient-to-r from-orange-500 via-red-500 to-purple-600 hover:from-orange-600 hover:via-red-600 hover:to-purple-700 transform hover:scale-105 transition-all duration-300 shadow-lg hover:shadow-xl shadow-orange-500/30 hover:shadow-orange-500/50 backdrop-blur-sm border border-white/10 font-phantom">
+                        <i class='bx bx-folder-open'></i> View Project
+                    </a>
+                    <div class="flex space-x-2">
+                        ${hasGithubLink ? `
+                            <a href="${githubLink}" target="_blank" class="text-gray-400 hover:text-orange-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-orange-500/20 hover:to-red-500/20 p-2 rounded-full transition-all duration-300 transform hover:scale-110 shadow-lg backdrop-blur-sm border border-white/10 hover:border-orange-500/30" title="View on GitHub">
+                                <i class='bx bxl-github text-lg'></i>
+                            </a>
+                        ` : ''}
+                        <a href="/edit-project?id=${project.id}" class="text-gray-400 hover:text-emerald-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-emerald-500/20 hover:to-cyan-500/20 p-2 rounded-full transition-all duration-300 transform hover:scale-110 shadow-lg backdrop-blur-sm border border-white/10 hover:border-emerald-500/30">
+                            <i class='bx bx-edit text-lg'></i>
+                        </a>
+                        <button onclick="deleteProject('${project.id}')" class="text-gray-400 hover:text-red-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-red-500/20 hover:to-pink-500/20 p-2 rounded-full transition-all duration-300 transform hover:scale-110 shadow-lg backdrop-blur-sm border border-white/10 hover:border-red-500/30">
+                            <i class='bx bx-trash text-lg'></i>
+                        </button>
+                    </div>
+                </div>
+            </div>
+            `;
+        }).join('');
+    } else {
+        container.innerHTML = projects.map((project, index) => {
+            const projectTag = project.fields['Project Tag'];
+            const tagColor = getTagColor(projectTag);
+            const createdDate = project.fields['Created At'] ? formatDate(project.fields['Created At']) : '';
+            const coverImage = project.fields['Cover Image URL'] || APP_URLS.defaultCover;
+            const githubLink = project.fields['github_link'] || 
+                             project.fields['GitHub Link'] || 
+                             project.fields['Github Link'] || 
+                             project.fields['github_url'] || 
+                             project.fields['GitHub URL'] || 
+                             '';            
+            const hasGithubLink = githubLink && githubLink.trim() !== '';
+
+            return `
+            <div class="backdrop-blur-md bg-white/5 border border-white/10 p-6 rounded-xl hover:shadow-2xl transition-all duration-500 animate__animated animate__fadeIn flex items-center gap-6 transform hover:scale-102 group hover:shadow-orange-500/20 hover:border-orange-500/30">
+                <div class="relative overflow-hidden w-24 h-24 rounded-lg flex-shrink-0 border border-white/10">
+                    <img src="${coverImage}" class="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110" alt="${project.fields['Project Name']}">
+                </div>
+
+                <div class="flex-grow">
+                    <div class="flex items-center gap-3 mb-2">
+                        <h3 class="text-xl font-bold text-white font-phantom">${project.fields['Project Name']}</h3>
+                        ${projectTag ? `<span class="bg-gradient-to-r from-orange-500 to-red-500 text-white px-3 py-1 rounded-full text-sm font-medium shadow-lg shadow-orange-500/30 backdrop-blur-sm border border-white/10 font-phantom">${projectTag}</span>` : ''}
+                    </div>
+                    <p class="text-gray-300 line-clamp-2 mb-2 font-phantom">${project.fields['Description'] || 'No description provided.'}</p>
+                    ${hasGithubLink ? `
+                        <div class="flex items-center gap-2 text-sm mb-2">
+                            <i class='bx bxl-github text-orange-400'></i>
+                            <a href="${githubLink}" target="_blank" class="text-orange-400 hover:text-orange-300 transition-colors duration-300 font-phantom">
+                                GitHub Repository
+                            </a>
+                        </div>
+                    ` : ''}
+                    <p class="text-gray-400 text-sm font-phantom">${createdDate}</p>
+                </div>
+
+                <div class="flex items-center gap-3">
+                    <a href="/project/${project.id}" class="px-4 py-2 text-white rounded-lg text-sm font-medium flex items-center gap-2 bg-gradient-to-r from-orange-500 via-red-500 to-purple-600 hover:from-orange-600 hover:via-red-600 hover:to-purple-700 transform hover:scale-105 transition-all duration-300 shadow-lg shadow-orange-500/30 backdrop-blur-sm border border-white/10 font-phantom">
+                        <i class='bx bx-folder-open'></i> View
+                    </a>
+                    ${hasGithubLink ? `
+                        <a href="${githubLink}" target="_blank" class="text-gray-400 hover:text-orange-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-orange-500/20 hover:to-red-500/20 p-2 rounded-full transition-all duration-300 backdrop-blur-sm border border-white/10 hover:border-orange-500/30" title="View on GitHub">
+                            <i class='bx bxl-github text-lg'></i>
+                        </a>
+                    ` : ''}
+                    <a href="/edit-project?id=${project.id}" class="text-gray-400 hover:text-emerald-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-emerald-500/20 hover:to-cyan-500/20 p-2 rounded-full transition-all duration-300 backdrop-blur-sm border border-white/10 hover:border-emerald-500/30">
+                        <i class='bx bx-edit text-lg'></i>
+                    </a>
+                    <button onclick="deleteProject('${project.id}')" class="text-gray-400 hover:text-red-300 bg-slate-800/50 hover:bg-gradient-to-r hover:from-red-500/20 hover:to-pink-500/20 p-2 rounded-full transition-all duration-300 backdrop-blur-sm border border-white/10 hover:border-red-500/30">
+                        <i class='bx bx-trash text-lg'></i>
+                    </button>
+                </div>
+            </div>
+            `;
+        }).join('');
+    }
+}
+
+let nextCursor = null;
+let loadingPage = false;
+
+function projectsPageUrl(cursor) {
+    const params = new URLSearchParams({ limit: APP_URLS.pageSize, fields: APP_URLS.projectFields });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    return `${APP_URLS.projects}?${params}`;
+}
+
+function appendProjectsPage(page) {
+    allProjects = allProjects.concat(page.records);
+    nextCursor = page.next_cursor;
+
+    // Until the last page is in, the total is only a lower bound
+    const count = nextCursor ? `${allProjects.length}+` : allProjects.length;
+    document.getElementById('total-projects').textContent = count;
+    document.getElementById('active-projects').textContent = count;
+    document.getElementById('latest-project').textContent = allProjects.length > 0 ? allProjects[0].fields['Project Name'] : 'None';
+    document.getElementById('projects-sentinel').classList.toggle('hidden', !nextCursor);
+
+    sortProjects(document.getElementById('sort-projects').value);
+}
+
+function loadNextProjectsPage() {
+    if (loadingPage || !nextCursor) {
+        return;
+    }
+    loadingPage = true;
+    fetch(projectsPageUrl(nextCursor))
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(page => {
+            appendProjectsPage(page);
+            // Re-observing fires again if the sentinel is still on screen after this page
+            projectsObserver.unobserve(projectsSentinel);
+            projectsObserver.observe(projectsSentinel);
+        })
+        .catch(error => console.error('Error loading more projects:', error))
+        .finally(() => {
+            loadingPage = false;
+        });
+}
+
+const projectsSentinel = document.getElementById('projects-sentinel');
+const projectsObserver = new IntersectionObserver(entries => {
+    if (entries.some(entry => entry.isIntersecting)) {
+        loadNextProjectsPage();
+    }
+}, { rootMargin: '400px' });
+projectsObserver.observe(projectsSentinel);
+
+hydratedOrFetch('projectsPage', projectsPageUrl())
+    .then(appendProjectsPage)
+    .catch(error => {
+        console.error('Error loading projects:', error);
+        document.getElementById('projects-container').innerHTML = `
+            <div class="text-center py-16 animate__animated animate__fadeIn col-span-full">
+                <div class="relative mb-6">
+                    <i class='bx bx-error-circle text-6xl text-red-400 mb-4 animate-pulse'></i>
+                    <div class="absolute -top-2 -right-2 w-4 h-4 bg-gradient-to-r from-red-400 to-pink-500 rounded-full animate-ping shadow-lg shadow-red-500/50"></div>
+                </div>
+                <h3 class="text-2xl font-bold text-white mb-2 font-phantom">Oops! Something went wrong</h3>
+                <p class="text-red-300 text-lg mb-6 font-phantom">We couldn't load your projects. Please try again.</p>
+                <button onclick="window.location.reload()" class="bg-gradient-to-r from-slate-700 via-slate-600 to-slate-500 hover:from-slate-600 hover:via-slate-500 hover:to-slate-400 px-8 py-3 text-white rounded-lg font-semibold transform hover:scale-105 transition-all duration-300 shadow-lg hover:shadow-xl backdrop-blur-sm border border-white/10 font-phantom">
+                    <i class='bx bx-refresh mr-2 animate-spin'></i> Try Again
+                </button>
+            </div>
+        `;
+    });
+
+function deleteProject(recordId) {
+    const overlay = document.createElement('div');
+    overlay.className = 'fixed inset-0 bg-slate-900/60 backdrop-blur-sm flex items-center justify-center z-50 animate__animated animate__fadeIn';
+
+    const dialog = document.createElement('div');
+    dialog.className = 'backdrop-blur-md bg-white/5 border border-white/10 p-8 rounded-xl max-w-md w-full mx-4 animate__animated animate__zoomIn shadow-2xl shadow-red-500/20';
+    dialog.innerHTML = `
+        <div class="text-center mb-6">
+            <div class="relative mb-4">
+                <i class='bx bx-trash text-red-400 text-5xl animate-pulse'></i>
+                <div class="absolute -top-2 -right-2 w-4 h-4 bg-gradient-to-r from-red-400 to-pink-500 rounded-full animate-ping shadow-lg shadow-red-500/50"></div>
+            </div>
+            <h3 class="text-2xl font-bold text-white mt-4 mb-2 font-phantom">Delete Project</h3>
+            <p class="text-gray-300 mt-2 leading-relaxed font-phantom">Are you sure you want to delete this project? This action cannot be undone.</p>
+            <div class="mt-4 p-3 bg-red-500/10 border border-red-500/20 rounded-lg backdrop-blur-sm">
+                <p class="text-red-300 text-sm font-phantom">⚠️ Note: This will not delete the associated dev logs.</p>
+            </div>
+        </div>
+        <div class="flex justify-center gap-4 mt-8">
+            <button id="cancel-delete" class="bg-gradient-to-r from-slate-700 to-slate-600 hover:from-slate-600 hover:to-slate-500 px-6 py-3 text-white rounded-lg font-semibold transition-all duration-300 transform hover:scale-105 shadow-lg backdrop-blur-sm border border-white/10 font-phantom">
+                Cancel
+            </button>
+            <button id="confirm-delete" class="bg-gradient-to-r from-red-500 to-red-600 hover:from-red-600 hover:to-red-700 px-6 py-3 text-white rounded-lg font-semibold transition-all duration-300 transform hover:scale-105 shadow-lg shadow-red-500/30 hover:shadow-red-500/50 backdrop-blur-sm border border-white/10 font-phantom">
+                Delete Project
+            </button>
+        </div>
+    `;
+
+    overlay.appendChild(dialog);
+    document.body.appendChild(overlay);
+
+    document.getElementById('cancel-delete').addEventListener('click', () => {
+        dialog.classList.replace('animate__zoomIn', 'animate__zoomOut');
+        overlay.classList.replace('animate__fadeIn', 'animate__fadeOut');
+        setTimeout(() => overlay.remove(), 500);
+    });
+
+    document.getElementById('confirm-delete').addEventListener('click', () => {
+        document.getElementById('confirm-delete').innerHTML = `
+            <div class="flex items-center">
+                <div class="animate-spin rounded-full h-4 w-4 border-t-2 border-b-2 border-white mr-2"></div>
+                Deleting...
+            </div>
+        `;
+        document.getElementById('confirm-delete').disabled = true;
+
+        fetch(`/api/projects/${recordId}`, {
+            method: 'DELETE'
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                dialog.innerHTML = `
+                    <div class="text-center mb-6">
+                        <div class="relative mb-4">
+                            <i class='bx bx-check-circle text-emerald-400 text-5xl animate-bounce'></i>
+                            <div class="absolute -top-2 -right-2 w-4 h-4 bg-gradient-to-r from-emerald-400 to-cyan-500 rounded-full animate-ping shadow-lg shadow-emerald-500/50"></div>
+                        </div>
+                        <h3 class="text-2xl font-bold text-white mt-4 font-phantom">Success!</h3>
+                        <p class="text-gray-300 mt-2 font-phantom">${data.message || 'Project deleted successfully.'}</p>
+                    </div>
+                `;
+
+                setTimeout(() => {
+                    window.location.reload();
+                }, 1000);
+            } else {
+                throw new Error(data.message || 'Failed to delete project');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            dialog.innerHTML = `
+                <div class="text-center mb-6">
+                    <div class="relative mb-4">
+                        <i class='bx bx-error-circle text-red-400 text-5xl animate-pulse'></i>
+                        <div class="absolute -top-2 -right-2 w-4 h-4 bg-gradient-to-r from-red-400 to-pink-500 rounded-full animate-ping shadow-lg shadow-red-500/50"></div>
+                    </div>
+                    <h3 class="text-2xl font-bold text-white mt-4 font-phantom">Error</h3>
+                    <p class="text-red-300 mt-2 font-phantom">${error.message || 'An error occurred while deleting the project'}</p>
+                </div>
+                <div class="flex justify-center mt-6">
+                    <button id="close-error" class="bg-gradient-to-r from-slate-700 to-slate-600 hover:from-slate-600 hover:to-slate-500 px-6 py-3 text-white rounded-lg font-semibold transition-all duration-300 transform hover:scale-105 shadow-lg backdrop-blur-sm border border-white/10 font-phantom">
+                        Close
+                    </button>
+                </div>
+            `;
+
+            document.getElementById('close-error').addEventListener('click', () => {
+                dialog.classList.replace('animate__zoomIn', 'animate__zoomOut');
+                overlay.classList.replace('animate__fadeIn', 'animate__fadeOut');
+                setTimeout(() => overlay.remove(), 500);
+            });
+        });
+    });
+}
@@ -0,0 +1,405 @@
+const APP_URLS = document.currentScript.dataset;
+
+// Data the server embedded in the page; anything missing is fetched as before
+const HYDRATION = JSON.parse(document.getElementById('hydration-data')?.textContent || '{}');
+
+function hydratedOrFetch(key, url) {
+    if (key in HYDRATION) {
+        return Promise.resolve(HYDRATION[key]);
+    }
+    return fetch(url).then(response => {
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    });
+}
+
+const pathParts = window.location.pathname.split('/');
+const projectId = pathParts[pathParts.length - 1];
+let allLogs = [];
+let filteredLogs = [];
+let sortOrder = 'desc';
+
+function formatDate(dateString) {
+    const date = new Date(dateString);
+    if (isNaN(date)) return '';
+
+    const now = new Date();
+    const diffMs = now - date;
+    const diffSec = Math.floor(diffMs / 1000);
+    const diffMin = Math.floor(diffSec / 60);
+    const diffHour = Math.floor(diffMin / 60);
+    const diffDay = Math.floor(diffHour / 24);
+
+    if (diffDay > 0) {
+        return diffDay === 1 ? 'Yesterday' : `${diffDay} days ago`;
+    } else if (diffHour > 0) {
+        return `${diffHour} hour${diffHour > 1 ? 's' : ''} ago`;
+    } else if (diffMin > 0) {
+        return `${diffMin} minute${diffMin > 1 ? 's' : ''} ago`;
+    } else {
+        return 'Just now';
+    }
+}
+
+function getTagColor(tag) {
+    const colors = {
+        'CAD': 'bg-gradient-to-r from-blue-500 to-cyan-500',
+        'PCB': 'bg-gradient-to-r from-purple-500 to-pink-500',
+        'Hardware': 'bg-gradient-to-r from-orange-500 to-red-500',
+        'Software': 'bg-gradient-to-r from-green-500 to-emerald-500',
+        '3D Printing': 'bg-gradient-to-r from-pink-500 to-purple-500',
+        'Research': 'bg-gradient-to-r from-indigo-500 to-blue-500'
+    };
+
+    return colors[tag] || 'bg-gradient-to-r from-orange-500 to-red-500';
+}
+
+function updateStats() {
+    const totalLogs = allLogs.length;
+    const totalMinutes = allLogs.reduce((sum, log) => sum + (parseInt(log.fields['Time Spent (minutes)']) || 0), 0);
+    const totalHours = (totalMinutes / 60).toFixed(1);
+
+    document.getElementById('total-logs').textContent = totalLogs;
+    document.getElementById('total-time').textContent = totalHours;
+
+    if (totalLogs > 0) {
+        document.getElementById('logs-stats').classList.remove('hidden');
+    }
+}
+
+function filterAndSortLogs() {
+    const searchTerm = document.getElementById('log-search').value.toLowerCase();
+    const tagFilter = document.getElementById('tag-filter').value;
+
+    filteredLogs = allLogs.filter(log => {
+        const title = log.fields['Title'] || log.fields['title'] || '';
+        console.log("title is", title); // i hate this issue
+        const whatIDid = log.fields['What I Did'] || log.fields['what_did'] || '';
+        const projectTag = log.fields['Project Tag'] || log.fields['project_tag'] || '';
+        const issuesFaced = log.fields['Issues Faced'] || log.fields['issues_faced'] || '';
+        const next_steps = log.fields['Next Steps'] || log.fields['next_steps'] || '';
+
+        const matchesSearch = !searchTerm || 
+            title.toLowerCase().includes(searchTerm) ||
+            whatIDid.toLowerCase().includes(searchTerm);
+
+        const matchesTag = !tagFilter || projectTag === tagFilter;
+
+        return matchesSearch && matchesTag;
+    });
+
+    filteredLogs.sort((a, b) => {
+        const dateA = new Date(a.fields['Created At'] || a.fields['created_at'] || '');
+        const dateB = new Date(b.fields['Created At'] || b.fields['created_at'] || '');
+        return sortOrder === 'desc' ? dateB - dateA : dateA - dateB;
+    });
+
+    renderLogs();
+}
+
+function renderLogs() {
+    const container = document.getElementById('logs-container');
+
+    if (filteredLogs.length === 0) {
+        if (allLogs.length === 0) {
+            container.innerHTML = `
+                <div class="text-center py-16 animate__animated animate__fadeIn">
+                    <div class="mb-6">
+                        <i class='bx bx-notepad text-6xl text-orange-400 mb-4 animate-pulse'></i>
+                        <h3 class="text-xl font-semibold text-white mb-2">No Development Logs Yet</h3>
+                        <p class="text-gray-300">Start documenting your project progress by creating your first log entry.</p>
+                    </div>
+                    <a href="${APP_URLS.createLog}" id="empty-create-log-btn" class="bg-gradient-to-r from-orange-500 to-red-500 hover:from-orange-600 hover:to-red-600 inline-flex items-center gap-2 px-6 py-3 text-white rounded-xl font-semibold hover:scale-105 hover:rotate-1 transition-all duration-300 shadow-lg shadow-orange-500/30">
+                        <i class='bx bx-plus'></i> Create First Log
+                    </a>
+                </div>
+            `;
+        } else {
+            container.innerHTML = `
+                <div class="text-center py-16 animate__animated animate__fadeIn">
+                    <i class='bx bx-search text-6xl text-orange-400 mb-4 animate-pulse'></i>
+                    <h3 class="text-xl font-semibold text-white mb-2">No Logs Found</h3>
+                    <p class="text-gray-300">Try adjusting your search or filter criteria.</p>
+                </div>
+            `;
+        }
+        return;
+    }
+
+    container.innerHTML = filteredLogs.map((log, index) => {
+        const title = log.fields['Title'] || log.fields['title'] || 'Untitled Log';
+        const projectTag = log.fields['Project Tag'] || log.fields['project_tag'] || 'General';
+        const whatIDid = log.fields['What I Did'] || log.fields['what_did'] || 'No description provided';
+        const next_steps = log.fields['Next Steps'] || log.fields['next_steps'] || 'No description provided';
+        const timeSpentMinutes = log.fields['Time Spent (minutes)'] || log.fields['time_spent'] || '0';
+        const timeSpentHours = (parseInt(timeSpentMinutes) / 60).toFixed(1);
+        const mediaURL = log.fields['Media URL'] || log.fields['media_url'] || '';
+        const createdAt = log.fields['Created At'] || log.fields['created_at'] || '';
+        const issuesFaced = log.fields['Issues Faced'] || log.fields['issues_faced'] || '';
+        const status = log.fields['Status'] || 'Pending';
+
+        const statusColors = {
+            'Approved': 'bg-gradient-to-r from-green-500 to-emerald-500',
+            'Denied': 'bg-gradient-to-r from-red-500 to-pink-500',
+            'Pending': 'bg-gradient-to-r from-yellow-500 to-orange-500'
+        };
+
+        const statusColor = statusColors[status] || 'bg-gradient-to-r from-yellow-500 to-orange-500';
+        const tagColor = getTagColor(projectTag);
+        const createdDate = createdAt ? formatDate(createdAt) : '';
+        const animationDelay = index < 5 ? `animate__delay-${index+1}s` : '';
+
+        return `
+        <div class="glass-card p-6 rounded-xl shadow-lg shadow-orange-500/10 hover:shadow-xl hover:shadow-orange-500/20 transition-all duration-300 animate__animated animate__fadeIn ${animationDelay} group border border-orange-500/20 hover:border-orange-500/40 hover:scale-[1.02] hover:rotate-1">
+            <div class="flex flex-col md:flex-row justify-between items-start mb-4 gap-3">
+                <div class="flex-1">
+                    <div class="flex items-center gap-3 mb-3">
+                        <span class="${tagColor} text-white px-3 py-1 rounded-full text-sm font-medium shadow-lg backdrop-blur-sm">${projectTag}</span>
+                        <span class="${statusColor} text-white px-3 py-1 rounded-full text-sm font-medium shadow-lg backdrop-blur-sm">${status}</span>
+                        <span class="text-gray-300 text-sm flex items-center gap-1">
+                            <i class='bx bx-time text-orange-400'></i>
+                            ${createdDate}
+                        </span>
+                    </div>
+                    <h3 class="text-white text-xl font-semibold group-hover:text-orange-300 transition-colors duration-300">${title}</h3>
+                </div>
+                <div class="flex items-center gap-4">
+                    <div class="flex items-center glass-card px-4 py-2 rounded-full border border-orange-500/30">
+                        <i class='bx bx-stopwatch text-orange-400 mr-2'></i>
+                        <span class="text-gray-200 text-sm font-medium">${timeSpentHours} hrs</span>
+                    </div>
+                    <div class="flex space-x-2">
+                        <a href="/edit-log?id=${log.id}" class="text-blue-400 hover:text-blue-300 glass-card p-2 rounded-full transition-all duration-300 hover:scale-110 hover:rotate-12 border border-blue-500/30" title="Edit log">
+                            <i class='bx bx-edit text-lg'></i>
+                        </a>
+                        <button onclick="deleteLog('${log.id}')" class="text-red-400 hover:text-red-300 glass-card p-2 rounded-full transition-all duration-300 hover:scale-110 hover:rotate-12 border border-red-500/30" title="Delete log">
+                            <i class='bx bx-trash text-lg'></i>
+                        </button>
+                    </div>
+                </div>
+            </div>
+
+            <div class="glass-card p-6 rounded-xl mb-4 border border-orange-500/20 hover:border-orange-500/40 transition-all duration-300">
+                <div class="flex items-center gap-2 mb-3">
+                    <i class='bx bx-code-block text-orange-400'></i>
+                    <h4 class="text-orange-300 font-medium">What I Did</h4>
+                </div>
+                <p class="text-white leading-relaxed">${whatIDid}</p>
+            </div>
+
+            <div class="glass-card p-6 rounded-xl mb-4 border border-purple-500/20 hover:border-purple-500/40 transition-all duration-300">
+                <div class="flex items-center gap-2 mb-3">
+                    <i class='bx bx-right-arrow-alt text-purple-400'></i>
+                    <h4 class="text-purple-300 font-medium">Next Steps</h4>
+                </div>
+                <p class="text-white leading-relaxed">${next_steps}</p>
+            </div>
+
+            <div class="glass-card p-6 rounded-xl mb-4 border border-red-500/20 hover:border-red-500/40 transition-all duration-300">
+                <div class="flex items-center gap-2 mb-3">
+                    <i class='bx bx-error-circle text-red-400'></i>
+                    <h4 class="text-red-300 font-medium">Issues Faced</h4>
+                </div>
+                <p class="text-white leading-relaxed">${issuesFaced}</p>
+            </div>
+
+            ${mediaURL ? `
+            <div class="mt-4">
+                <div class="glass-card p-4 rounded-xl border border-cyan-500/20 hover:border-cyan-500/40 transition-all duration-300">
+                    <div class="flex items-center gap-2 mb-3">
+                        <i class='bx bx-image text-cyan-400'></i>
+                        <h4 class="text-cyan-300 font-medium">Attached Media</h4>
+                    </div>
+                    ${(() => {
+                        const url = mediaURL;
+                        const fileExt = url.split('.').pop().toLowerCase();
+
+                        if (['jpg', 'jpeg', 'png', 'gif'].includes(fileExt)) {
+                            return `<img src="${url}" class="rounded-lg max-h-96 object-contain border border-cyan-500/30 hover:border-cyan-500/50 transition-all duration-300 hover:scale-105" alt="Log media">`;
+                        } else if (['mp4', 'webm', 'ogg'].includes(fileExt)) {
+                            return `<video controls class="rounded-lg max-h-96 w-full border border-cyan-500/30 hover:border-cyan-500/50 transition-all duration-300"><source src="${url}" type="video/${fileExt}">Your browser does not support the video tag.</video>`;
+                        } else {
+                            return `<a href="${url}" target="_blank" class="text-cyan-400 hover:text-cyan-300 flex items-center gap-2 p-3 glass-card rounded-lg border border-cyan-500/30 hover:border-cyan-500/50 transition-all duration-300 hover:scale-105 hover:rotate-1">
+                                <i class='bx bx-file text-xl'></i> 
+                                <span>View attached file</span>
+                                <i class='bx bx-external-link text-sm'></i>
+                            </a>`;
+                        }
+                    })()}
+                </div>
+            </div>` : ''}
+        </div>
+    `;
+}).join('');
+}
+
+const projectRequest = hydratedOrFetch('project', `/api/projects/${projectId}`);
+
+projectRequest
+    .then(project => {
+        const projectDetails = document.getElementById('project-details');
+        const tagColor = getTagColor(project.fields['Project Tag']);
+        const createdDate = project.fields['Created At'] ? formatDate(project.fields['Created At']) : '';
+        const coverImage = project.fields['Cover Image URL'] || APP_URLS.defaultCover;
+
+        document.title = `${project.fields['Project Name']} - Groundplane`;
+
+        const projectName = project.fields['Project Name'] || '';
+        const projectTag = project.fields['Project Tag'] || '';
+        document.getElementById('create-log-btn').href = `${APP_URLS.createLog}?project=${encodeURIComponent(projectName)}&project_tag=${encodeURIComponent(projectTag)}`;
+
+        projectDetails.innerHTML = `
+            <div class="relative rounded-2xl overflow-hidden mb-8 h-80 group">
+                <img src="${coverImage}" class="w-full h-full object-cover group-hover:scale-105 transition-transform duration-700" alt="${project.fields['Project Name']}">
+                <div class="absolute inset-0 bg-gradient-to-t from-slate-900 via-slate-900/50 to-transparent"></div>
+                <div class="absolute bottom-0 left-0 p-8 w-full">
+                    <div class="flex items-center gap-2 mb-3">
+                        <i class='bx bx-calendar text-orange-400'></i>
+                        <span class="text-gray-300 text-sm">${createdDate}</span>
+                    </div>
+                    <h1 class="text-4xl font-bold text-white mb-2 bg-gradient-to-r from-orange-400 to-purple-400 bg-clip-text text-transparent">${project.fields['Project Name']}</h1>
+                </div>
+            </div>
+
+            <div class="glass-card p-8 rounded-xl mb-6 border border-orange-500/20 hover:border-orange-500/40 transition-all duration-300">
+                <div class="flex items-center gap-2 mb-4">
+                    <i class='bx bx-info-circle text-orange-400 text-xl'></i>
+                    <h3 class="text-orange-300 font-medium text-lg">Project Description</h3>
+                </div>
+                <p class="text-white leading-relaxed text-lg">${project.fields['Description'] || 'No description provided.'}</p>
+            </div>
+
+            <div class="flex justify-end mt-6 gap-4">
+                <a href="/edit-project?id=${project.id}" class="glass-card hover:bg-orange-500/10 px-6 py-3 text-white rounded-xl flex items-center gap-2 transition-all duration-300 hover:scale-105 hover:rotate-1 border border-orange-500/30 hover:border-orange-500/50">
+                    <i class='bx bx-edit'></i> Edit Project
+                </a>
+                <a href="/api/projects/${project.id}/export-markdown" class="glass-card hover:bg-emerald-500/10 px-6 py-3 text-white rounded-xl flex items-center gap-2 transition-all duration-300 hover:scale-105 hover:rotate-1 border border-emerald-500/30 hover:border-emerald-500/50">
+                    <i class='bx bx-download'></i> Export Devlogs
+                </a>
+            </div>
+        `;
+
+        document.getElementById('project-loading').classList.add('hidden');
+        projectDetails.classList.remove('hidden');
+    })
+    .catch(error => {
+        console.error('Error loading project:', error);
+        document.getElementById('project-loading').innerHTML = `
+            <div class="text-center py-12 w-full">
+                <i class='bx bx-error-circle text-6xl text-red-400 mb-4 animate-pulse'></i>
+                <h3 class="text-xl font-semibold text-red-300 mb-2">Failed to Load Project</h3>
+                <p class="text-gray-300 mb-6">There was an error loading the project details.</p>
+                <a href="${APP_URLS.index}" class="glass-card hover:bg-orange-500/10 px-6 py-3 text-white rounded-xl font-semibold inline-flex items-center gap-2 hover:scale-105 hover:rotate-1 transition-all duration-300 border border-orange-500/30">
+                    <i class='bx bx-arrow-back'></i> Back to Projects
+                </a>
+            </div>
+        `;
+    });
+
+function deleteLog(logId) {
+    if (!confirm('Are you sure you want to delete this log? This action cannot be undone.')) {
+        return;
+    }
+
+    fetch(`/api/logs/${logId}`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json'
+        }
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('Failed to delete log');
+        }
+        allLogs = allLogs.filter(log => log.id !== logId);
+        filterAndSortLogs();
+        updateStats();
+    })
+    .catch(error => {
+        console.error('Error deleting log:', error);
+        alert('Error deleting log. Please try again.');
+    });
+}
+
+hydratedOrFetch('logs', `/api/projects/${projectId}/logs`)
+    .then(logs => {
+        console.log('Received logs:', logs);
+        console.log('Number of logs:', logs.length);
+
+        if (logs.length > 0) {
+            console.log('First log structure:', logs[0]);
+            console.log('First log fields:', logs[0].fields);
+        }
+
+        allLogs = logs;
+        filteredLogs = [...logs];
+
+        const tagFilter = document.getElementById('tag-filter');
+        const uniqueTags = [...new Set(logs.map(log => log.fields['Project Tag']).filter(Boolean))];
+        console.log('Unique tags:', uniqueTags);
+
+        uniqueTags.forEach(tag => {
+            const option = document.createElement('option');
+            option.value = tag;
+            option.textContent = tag;
+            tagFilter.appendChild(option);
+        });
+
+        if (logs.length > 0) {
+            document.getElementById('log-controls').classList.remove('hidden');
+        }
+
+        updateStats();
+        filterAndSortLogs();
+
+        projectRequest
+            .then(project => {
+                const projectName = project.fields['Project Name'] || '';
+                const projectTag = project.fields['Project Tag'] || '';
+                console.log('Project name for logs:', projectName);
+                console.log('Project tag for logs:', projectTag);
+
+                const emptyBtn = document.getElementById('empty-create-log-btn');
+                if (emptyBtn) {
+                    emptyBtn.href = `${APP_URLS.createLog}?project=${encodeURIComponent(projectName)}&project_tag=${encodeURIComponent(projectTag)}`;
+                }
+            });
+    })
+    .catch(error => {
+        console.error('Error loading logs:', error);
+        document.getElementById('logs-container').innerHTML = `
+            <div class="text-center py-16 animate__animated animate__fadeIn">
+                <i class='bx bx-error-circle text-6xl text-red-400 mb-4 animate-pulse'></i>
+                <h3 class="text-xl font-semibold text-red-300 mb-2">Error Loading Logs</h3>
+                <p class="text-gray-300 mb-6">There was an error loading the project logs. Check the console for details.</p>
+                <p class="text-sm text-gray-400 mb-6">Error: ${error.message}</p>
+                <button onclick="window.location.reload()" class="glass-card hover:bg-orange-500/10 px-6 py-3 text-white rounded-xl font-semibold hover:scale-105 hover:rotate-1 transition-all duration-300 flex items-center gap-2 mx-auto border border-orange-500/30">
+                    <i class='bx bx-refresh'></i> Try Again
+                </button>
+            </div>
+        `;
+    });
+
+function debugFilterAndSort() {
+    console.log('All logs:', allLogs);
+    console.log('Filtered logs:', filteredLogs);
+    console.log('Current search term:', document.getElementById('log-search').value);
+    console.log('Current tag filter:', document.getElementById('tag-filter').value);
+    console.log('Current sort order:', sortOrder);
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    document.getElementById('log-search').addEventListener('input', filterAndSortLogs);
+    document.getElementById('tag-filter').addEventListener('change', filterAndSortLogs);
+
+    document.getElementById('sort-toggle').addEventListener('click', function() {
+        sortOrder = sortOrder === 'desc' ? 'asc' : 'desc';
+        this.innerHTML = `
+            <i class='bx bx-sort-alt-2'></i>
+            <span>${sortOrder === 'desc' ? 'Latest First' : 'Oldest First'}</span>
+        `;
+        filterAndSortLogs();
+    });
+});
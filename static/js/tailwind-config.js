@@ -0,0 +1,32 @@
+tailwind.config = {
+    theme: {
+        extend: {
+            colors: {
+                primary: {
+                    orange: '#ff8c37',
+                    red: '#ec3750',
+                    purple: '#a633d6',
+                    yellow: '#f1c40f',
+                    green: '#33d6a6',
+                    cyan: '#5bc0de',
+                    blue: '#338eda',
+                },
+                slate: {
+                    950: '#0f172a',
+                    900: '#1e293b',
+                    800: '#312e81',
+                }
+            },
+            animation: {
+                'gradient-x': 'gradient-x 3s ease infinite',
+                'gradient-y': 'gradient-y 3s ease infinite',
+                'pulse-glow': 'pulse-glow 2s ease-in-out infinite alternate',
+                'float': 'float 4s ease-in-out infinite',
+            },
+            fontFamily: {
+                'phantom': ['Inter', 'system-ui', '-apple-system', 'BlinkMacSystemFont', '"Segoe UI"', 'Roboto', 'sans-serif'],
+                'comic': ['"Comic Sans MS"', 'cursive'],
+            }
+        }
+    }
+}
@@ -8,16 +8,17 @@ AIRTABLE_BASE_ID = os.environ.get('AIRTABLE_BASE_ID')
 AIRTABLE_TABLE_NAME = os.environ.get('AIRTABLE_TABLE_NAME')
 AIRTABLE_PROJECTS_TABLE = os.environ.get('AIRTABLE_PROJECTS_TABLE')
 AIRTABLE_API_KEY = os.environ.get('AIRTABLE_API_KEY')
+AIRTABLE_API_URL = os.environ.get('AIRTABLE_API_URL', 'https://api.airtable.com/v0').rstrip('/')
 
 logger = logging.getLogger(__name__)
 
 def api_admin_project_log_count(project_id):
     """API endpoint to get the count of logs for a specific project."""
     try:
-        logs_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+        logs_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
-        project_url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{project_id}"
+        project_url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_PROJECTS_TABLE}/{project_id}"
         project_response = requests.get(project_url, headers=headers)
         
         if project_response.status_code != 200:
@@ -48,7 +49,7 @@ def api_admin_project_log_count(project_id):
 def api_admin_recent_logs():
     """API endpoint to get recent logs for the admin dashboard."""
     try:
-        url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
+        url = f"{AIRTABLE_API_URL}/{AIRTABLE_BASE_ID}/{AIRTABLE_TABLE_NAME}"
         headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
         
         params = {
@@ -0,0 +1,121 @@
+"""
+Opt-in request recorder. Each finished request is appended to a newline-delimited JSON
+trace file with the matched route, sanitized parameters, timing and the upstream calls
+it made. Traces are re-driven against a running app with replay.py.
+
+Nothing identifying is written: user IDs are hashed, secrets in the query string are
+masked and form/JSON bodies are reduced to field names plus value sizes.
+"""
+from flask import g, request, session, has_request_context
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+import upstream
+
+logger = logging.getLogger(__name__)
+
+SENSITIVE_PARAMS = {'code', 'state', 'token', 'access_token', 'secret', 'password', 'key'}
+SKIPPED_PREFIXES = ('/temp/', '/static/')
+
+
+def hash_user(user_id):
+    return hashlib.sha256(user_id.encode('utf-8')).hexdigest()[:12] if user_id else None
+
+
+def _shape(value):
+    """Keep numbers, booleans and nulls; replace text by "s<length>" """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value)
+    return f"s{len(str(value))}"
+
+
+def sanitize_body():
+    """Reduce the request body to field names and sizes"""
+    if request.is_json:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            return {'kind': 'json', 'fields': {k: _shape(v) for k, v in data.items()}}
+        return None
+    if request.form or request.files:
+        body = {'kind': 'form', 'fields': {k: _shape(v) for k, v in request.form.items()}}
+        if request.files:
+            body['files'] = {}
+            for name, file in request.files.items():
+                file.stream.seek(0, os.SEEK_END)
+                size = file.stream.tell()
+                file.stream.seek(0)
+                body['files'][name] = [os.path.splitext(file.filename or '')[1].lower(), size]
+        return body
+    return None
+
+
+class TrafficRecorder:
+    """Flask extension writing one compact JSON line per request"""
+
+    def __init__(self, path, sample_rate=1.0, max_bytes=None):
+        # `{pid}` lets each gunicorn worker write its own file
+        self.path = path.format(pid=os.getpid())
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.file = None
+        self.written = 0
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        upstream.add_observer(self._on_upstream_call)
+        logger.info("Recording traffic to %s", self.path)
+
+    def _before_request(self):
+        if request.path.startswith(SKIPPED_PREFIXES):
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        g.traffic_trace = {'start': time.time(), 'perf': time.perf_counter(), 'calls': []}
+
+    def _on_upstream_call(self, call):
+        trace = g.get('traffic_trace') if has_request_context() else None
+        if trace is not None:
+            trace['calls'].append([call.service, call.resource, call.method, call.status,
+                                   round(call.duration * 1000, 1)])
+
+    def _after_request(self, response):
+        trace = g.pop('traffic_trace', None)
+        if trace is None:
+            return response
+        try:
+            entry = {
+                't': round(trace['start'], 3),
+                'm': request.method,
+                'r': request.url_rule.rule if request.url_rule else None,
+                'p': request.path,
+                'q': {k: ('***' if k.lower() in SENSITIVE_PARAMS else v) for k, v in request.args.items()},
+                'u': hash_user(session.get('user_id')),
+                's': response.status_code,
+                'd': round((time.perf_counter() - trace['perf']) * 1000, 1),
+                'up': trace['calls'],
+            }
+            body = sanitize_body() if request.method in ('POST', 'PATCH', 'PUT') else None
+            if body:
+                entry['b'] = body
+            self._write(json.dumps(entry, separators=(',', ':')) + '\n')
+        except Exception as e:
+            logger.error("Error recording request trace: %s", e)
+        return response
+
+    def _write(self, line):
+        with self.lock:
+            if self.max_bytes and self.written >= self.max_bytes:
+                return
+            if self.file is None:
+                self.file = open(self.path, 'a', buffering=1, encoding='utf-8')
+            self.file.write(line)
+            self.written += len(line)
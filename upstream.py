@@ -0,0 +1,83 @@
+"""
+Thin instrumented wrapper around `requests` for calls to Airtable, Slack, the CDN and
+tmpfiles. Every call is timed and reported to the registered observers (traffic
+recorder, metrics, Server-Timing) as an UpstreamCall.
+
+Usage mirrors requests: upstream.get(url, headers=..., params=...).
+"""
+import logging
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import requests
+
+UpstreamCall = namedtuple('UpstreamCall', 'service resource method status duration')
+
+logger = logging.getLogger(__name__)
+
+_services = []
+_observers = []
+
+
+def register_service(name, base_url):
+    """Label calls whose URL starts with base_url as belonging to `name`"""
+    _services.append((base_url.rstrip('/'), name))
+    # Longest prefix wins so nested base URLs resolve to the most specific service
+    _services.sort(key=lambda item: len(item[0]), reverse=True)
+
+
+def add_observer(callback):
+    """Register callback(UpstreamCall), invoked synchronously after each call"""
+    _observers.append(callback)
+
+
+def classify(url):
+    """Return (service, resource) for a URL: Airtable calls resolve to the table name"""
+    for base_url, name in _services:
+        if url.startswith(base_url):
+            path = urlsplit(url[len(base_url):]).path.strip('/')
+            segments = path.split('/') if path else []
+            if name == 'airtable':
+                # /<base id>/<table>[/<record id>]
+                return name, segments[1] if len(segments) > 1 else (segments[0] if segments else '')
+            return name, segments[-1] if segments else ''
+    return 'other', urlsplit(url).netloc
+
+
+def request(method, url, **kwargs):
+    start = time.perf_counter()
+    status = 0
+    try:
+        response = requests.request(method, url, **kwargs)
+        status = response.status_code
+        return response
+    finally:
+        if _observers:
+            service, resource = classify(url)
+            call = UpstreamCall(service, resource, method, status, time.perf_counter() - start)
+            for observer in _observers:
+                try:
+                    observer(call)
+                except Exception as e:
+                    logger.error("Upstream observer failed: %s", e)
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def patch(url, **kwargs):
+    return request('PATCH', url, **kwargs)
+
+
+def put(url, **kwargs):
+    return request('PUT', url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return request('DELETE', url, **kwargs)